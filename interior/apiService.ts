@@ -110,10 +110,18 @@ async function apiRequest<T>(
 /**
  * Get list of designers with optional filters and pagination
  */
+/** Listing orderings the API accepts (anything else is rejected with 400) */
+export type DesignerOrdering = 'id' | '-id' | 'name' | 'newest' | 'most_projects' | 'price' | 'relevance';
+
 export interface GetDesignersParams {
+  /** Substring match ('Architect' also matches 'Landscape Architect') */
   category?: string;
+  /** Whole category, e.g. a facet value (listing total == facet count) */
+  category_exact?: string;
+  city?: string;
+  price?: string;
   search?: string;
-  ordering?: string;
+  ordering?: DesignerOrdering;
   page?: number;
   page_size?: number;
 }
@@ -124,6 +132,9 @@ export async function getDesigners(
   const queryParams = new URLSearchParams();
   
   if (params.category) queryParams.append('category', params.category);
+  if (params.category_exact) queryParams.append('category_exact', params.category_exact);
+  if (params.city) queryParams.append('city', params.city);
+  if (params.price) queryParams.append('price', params.price);
   if (params.search) queryParams.append('search', params.search);
   if (params.ordering) queryParams.append('ordering', params.ordering);
   if (params.page) queryParams.append('page', params.page.toString());
@@ -135,6 +146,37 @@ export async function getDesigners(
   return apiRequest<ApiDesignerListingResponse>(endpoint);
 }
 
+export interface ApiFacetCount {
+  value: string;
+  count: number;
+  label?: string;
+}
+
+export interface ApiDesignerFacetsResponse {
+  success: boolean;
+  data: {
+    category: ApiFacetCount[];
+    city: ApiFacetCount[];
+    price: ApiFacetCount[];
+  };
+}
+
+/**
+ * Get designer counts per category, city and price bucket (filter chips),
+ * optionally scoped to the current search
+ */
+export async function getDesignerFacets(
+  params: { search?: string; limit?: number } = {}
+): Promise<ApiDesignerFacetsResponse> {
+  const queryParams = new URLSearchParams();
+  if (params.search) queryParams.append('search', params.search);
+  if (params.limit) queryParams.append('limit', params.limit.toString());
+
+  const queryString = queryParams.toString();
+  const endpoint = `/designers/facets/${queryString ? `?${queryString}` : ''}`;
+  return apiRequest<ApiDesignerFacetsResponse>(endpoint);
+}
+
 // Export API base URL for debugging
 export { API_BASE_URL };
 
@@ -191,6 +233,7 @@ export interface ApiDesignerDetail {
   additional_addresses: string | null;
   portfolio: string[];
   projects: ApiProjectBasic[];
+  projects_pagination: ApiCursorPagination & { total: number };
   rating: number;
   reviewsCount: number;
   verified: boolean;
@@ -226,6 +269,7 @@ export interface ApiProjectDetail {
   url: string | null;
   images: ApiImage[];
   created_at: string;
+  images_pagination: ApiCursorPagination;
 }
 
 export interface ApiProjectDetailResponse {
@@ -233,6 +277,24 @@ export interface ApiProjectDetailResponse {
   data: ApiProjectDetail;
 }
 
+export interface ApiCursorPagination {
+  page_size: number;
+  has_next: boolean;
+  next_cursor: string | null;
+}
+
+export interface ApiDesignerProjectsResponse {
+  success: boolean;
+  data: ApiProjectBasic[];
+  pagination: ApiCursorPagination & { mode: 'cursor'; count: number };
+}
+
+export interface ApiProjectImagesResponse {
+  success: boolean;
+  data: ApiImage[];
+  pagination: ApiCursorPagination & { mode: 'cursor'; count: number };
+}
+
 /**
  * Get designer detail by ID
  */
@@ -241,6 +303,21 @@ export async function getDesignerDetail(designerId: number | string): Promise<Ap
   return apiRequest<ApiDesignerDetailResponse>(endpoint);
 }
 
+/**
+ * Get the next page of a designer's projects (cursor from projects_pagination.next_cursor)
+ */
+export async function getDesignerProjects(
+  designerId: number | string,
+  cursor: string,
+  pageSize?: number
+): Promise<ApiDesignerProjectsResponse> {
+  const queryParams = new URLSearchParams({ cursor });
+  if (pageSize) queryParams.append('page_size', pageSize.toString());
+
+  const endpoint = `/designers/${designerId}/projects/?${queryParams.toString()}`;
+  return apiRequest<ApiDesignerProjectsResponse>(endpoint);
+}
+
 /**
  * Get project detail by ID
  */
@@ -249,6 +326,43 @@ export async function getProjectDetail(projectId: number | string): Promise<ApiP
   return apiRequest<ApiProjectDetailResponse>(endpoint);
 }
 
+/**
+ * Get the next page of a project's images (cursor from images_pagination.next_cursor)
+ */
+export async function getProjectImages(
+  projectId: number | string,
+  cursor: string,
+  pageSize?: number
+): Promise<ApiProjectImagesResponse> {
+  const queryParams = new URLSearchParams({ cursor });
+  if (pageSize) queryParams.append('page_size', pageSize.toString());
+
+  const endpoint = `/projects/${projectId}/images/?${queryParams.toString()}`;
+  return apiRequest<ApiProjectImagesResponse>(endpoint);
+}
+
+export interface ApiBatchResponse<T> {
+  success: boolean;
+  data: T[];
+  missing: number[];
+}
+
+/**
+ * Get several designers' details in one request (ids that do not exist are listed in `missing`)
+ */
+export async function getDesignersBatch(ids: Array<number | string>): Promise<ApiBatchResponse<ApiDesignerDetail>> {
+  const endpoint = `/designers/batch/?ids=${ids.join(',')}`;
+  return apiRequest<ApiBatchResponse<ApiDesignerDetail>>(endpoint);
+}
+
+/**
+ * Get several projects' details in one request (ids that do not exist are listed in `missing`)
+ */
+export async function getProjectsBatch(ids: Array<number | string>): Promise<ApiBatchResponse<ApiProjectDetail>> {
+  const endpoint = `/projects/batch/?ids=${ids.join(',')}`;
+  return apiRequest<ApiBatchResponse<ApiProjectDetail>>(endpoint);
+}
+
 /**
  * Map API project basic to frontend Project type
  */
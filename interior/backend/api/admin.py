@@ -4,10 +4,11 @@ from .models import Designer, Project, Image
 
 @admin.register(Designer)
 class DesignerAdmin(admin.ModelAdmin):
-    list_display = ['id', 'business_name', 'category', 'phone_number', 'website', 'created_at']
+    list_display = ['id', 'business_name', 'category', 'phone_number', 'website', 'project_count', 'created_at']
     list_filter = ['category', 'created_at']
     search_fields = ['business_name', 'phone_number', 'website', 'address']
-    readonly_fields = ['created_at', 'updated_at']
+    # Denormalized from projects, maintained by api.signals
+    readonly_fields = ['project_count', 'featured_image', 'created_at', 'updated_at']
     fieldsets = (
         ('Basic Information', {
             'fields': ('business_name', 'category', 'phone_number', 'website')
@@ -21,6 +22,9 @@ class DesignerAdmin(admin.ModelAdmin):
         ('Details', {
             'fields': ('services_provided', 'areas_served', 'typical_job_cost', 'followers', 'socials')
         }),
+        ('Projects', {
+            'fields': ('project_count', 'featured_image')
+        }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
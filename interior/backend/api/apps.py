@@ -5,3 +5,12 @@ class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
 
+    def ready(self):
+        # Register signal handlers
+        from . import signals  # noqa: F401
+        # Register system checks
+        from . import checks  # noqa: F401
+        # Record per-request query counts / DB time on every connection
+        from django.db.backends.signals import connection_created
+        from .db.instrumentation import install_query_recorder
+        connection_created.connect(install_query_recorder)
@@ -0,0 +1,43 @@
+from django.core import checks
+from rest_framework import serializers
+
+
+def _api_serializer_classes():
+    """Every serializer class defined in this app"""
+    pending = [serializers.Serializer]
+    found = []
+    while pending:
+        cls = pending.pop()
+        for subclass in cls.__subclasses__():
+            pending.append(subclass)
+            if subclass.__module__.startswith('api.') and hasattr(subclass, 'Meta'):
+                found.append(subclass)
+    return found
+
+
+@checks.register()
+def check_serializer_reads(app_configs, **kwargs):
+    """
+    Warn about SerializerMethodFields whose reads are undeclared
+    
+    The query planner cannot narrow queries for them (every column is loaded,
+    relations they follow are queried per object), so each method field should be
+    decorated with @reads(...) or @constant.
+    """
+    from . import serializers as api_serializers  # noqa: F401  (define the classes)
+    
+    warnings = []
+    for serializer_class in _api_serializer_classes():
+        serializer = serializer_class()
+        for field in serializer._readable_fields:
+            if not isinstance(field, serializers.SerializerMethodField):
+                continue
+            method = getattr(serializer, field.method_name)
+            if getattr(method, 'reads', None) is None:
+                warnings.append(checks.Warning(
+                    f'{serializer_class.__name__}.{field.method_name} does not declare what it reads',
+                    hint='Decorate it with @reads(...) or @constant (api.serializers.compiled)',
+                    obj=serializer_class,
+                    id='api.W001',
+                ))
+    return warnings
@@ -0,0 +1,26 @@
+"""
+MySQL backend with connection pooling (DB_POOL=True)
+
+Same as django.db.backends.mysql, but connections come from an in-process
+api.db.pool.ConnectionPool; idle connections are checked with a ping before
+reuse when CONN_HEALTH_CHECKS is on.
+"""
+from django.db.backends.mysql import base
+from ...pool import ConnectionPool, PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+
+    def create_pool(self):
+        conn_params = self.get_connection_params()
+        connect = super(PooledDatabaseWrapperMixin, self).get_new_connection
+        options = self.pool_options()
+        return ConnectionPool(
+            lambda: connect(conn_params),
+            min_size=options['min_size'],
+            max_size=options['max_size'],
+            timeout=options['timeout'],
+            max_idle=options['max_idle'],
+            check=(lambda connection: connection.ping()) if self.settings_dict['CONN_HEALTH_CHECKS'] else None,
+            check_idle=options['check_idle'],
+        )
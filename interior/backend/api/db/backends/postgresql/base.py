@@ -0,0 +1,93 @@
+"""
+PostgreSQL backend with connection pooling (DB_POOL=True)
+
+Same as django.db.backends.postgresql, but connections come from psycopg's own
+pool (psycopg_pool.ConnectionPool), which needs psycopg 3 and psycopg_pool 3.2+
+(for the `check` argument):
+
+    pip install "psycopg[binary,pool]" "psycopg-pool>=3.2"
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.postgresql import base
+from ...pool import PoolTimeout, PooledDatabaseWrapperMixin
+
+try:
+    import psycopg_pool
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg_pool = None
+
+
+class PsycopgPool:
+    """psycopg_pool.ConnectionPool behind the api.db.pool.ConnectionPool interface"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def getconn(self):
+        try:
+            return self.pool.getconn()
+        except psycopg_pool.PoolTimeout as e:
+            raise PoolTimeout(str(e)) from e
+
+    def putconn(self, connection, discard=False):
+        if discard:
+            # The pool replaces closed connections instead of reusing them
+            connection.close()
+        self.pool.putconn(connection)
+
+    def stats(self):
+        stats = self.pool.get_stats()
+        size = stats.get('pool_size', 0)
+        idle = stats.get('pool_available', 0)
+        return {
+            'size': size,
+            'in_use': size - idle,
+            'idle': idle,
+            'max_size': stats.get('pool_max', self.pool.max_size),
+            'waiting': stats.get('requests_waiting', 0),
+            'waits': stats.get('requests_queued', 0),
+            'wait_time_ms': float(stats.get('requests_wait_ms', 0)),
+            'timeouts': stats.get('requests_errors', 0),
+            'connections_created': stats.get('connections_num', 0),
+            'connections_closed': stats.get('connections_lost', 0) + stats.get('returns_bad', 0),
+        }
+
+    def close(self):
+        self.pool.close()
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+
+    def create_pool(self):
+        # ConnectionPool.check_connection arrived in psycopg_pool 3.2
+        if psycopg_pool is None or not base.is_psycopg3 or not hasattr(psycopg_pool.ConnectionPool, 'check_connection'):
+            raise ImproperlyConfigured(
+                'DB_POOL with PostgreSQL requires psycopg 3 and psycopg_pool 3.2+: '
+                'pip install "psycopg[binary,pool]" "psycopg-pool>=3.2"'
+            )
+        options = self.pool_options()
+        return PsycopgPool(psycopg_pool.ConnectionPool(
+            kwargs=self.get_connection_params(),
+            min_size=options['min_size'],
+            max_size=options['max_size'],
+            timeout=options['timeout'],
+            max_idle=options['max_idle'],
+            configure=self._configure_pooled_connection,
+            check=psycopg_pool.ConnectionPool.check_connection if self.settings_dict['CONN_HEALTH_CHECKS'] else None,
+            name=f'django-{self.alias}',
+            open=True,
+        ))
+
+    def get_new_connection(self, conn_params):
+        # Django's get_new_connection() sets this before connecting
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = (
+            base.IsolationLevel(isolation_level) if isolation_level is not None
+            else base.IsolationLevel.READ_COMMITTED
+        )
+        return super().get_new_connection(conn_params)
+
+    def _configure_pooled_connection(self, connection):
+        """Per-connection setup Django's get_new_connection() does after connecting"""
+        if self.settings_dict['OPTIONS'].get('isolation_level') is not None:
+            connection.isolation_level = self.isolation_level
@@ -0,0 +1,178 @@
+"""
+Per-request query instrumentation
+
+Every database connection gets an execute wrapper (installed when the connection
+is created) that, inside `track_queries()`, records the number of statements, the
+total database time and the slowest statement. QueryInstrumentationMiddleware
+tracks each request, reports the figures in a Server-Timing header and checks them
+against the view's @query_budget. Statements slower than API_SLOW_QUERY_MS are
+captured by slow_queries.
+
+Session and user lookups (API_QUERY_BUDGET_EXCLUDED_TABLES) are counted but not
+charged to the budget: they depend on whether the client is logged in, not on the
+view.
+
+Tracking follows the request into the threads it hands ORM work to (async views,
+run_in_thread), and covers every database alias (primary and replicas).
+"""
+import contextvars
+import re
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from . import slow_queries
+
+# Tables of the session / authentication lookups a logged-in request makes
+DEFAULT_EXCLUDED_TABLES = (
+    'django_session', 'auth_user', 'auth_user_groups', 'auth_user_user_permissions',
+    'auth_group', 'auth_group_permissions', 'auth_permission', 'django_content_type',
+)
+
+_excluded_pattern = (None, None)
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised by the query that takes a request over its view's budget (API_QUERY_BUDGET_ENFORCE)"""
+
+
+def _is_excluded(sql):
+    """True if the statement reads a session / auth table (not charged to budgets)"""
+    global _excluded_pattern
+    tables = tuple(getattr(settings, 'API_QUERY_BUDGET_EXCLUDED_TABLES', DEFAULT_EXCLUDED_TABLES))
+    if _excluded_pattern[0] != tables:
+        pattern = re.compile(r'\b(?:%s)\b' % '|'.join(map(re.escape, tables))) if tables else None
+        _excluded_pattern = (tables, pattern)
+    pattern = _excluded_pattern[1]
+    return pattern is not None and pattern.search(sql) is not None
+
+
+class QueryStats:
+    """Queries recorded for one request (or one track_queries() block)"""
+
+    def __init__(self, parent=None):
+        # Enclosing block (a test's track_queries() around the request's own), also credited
+        self.parent = parent
+        # Request being served and its view's @query_budget (set by QueryInstrumentationMiddleware)
+        self.request = None
+        self.budget = None
+        self.count = 0
+        # Session / auth statements among `count` (not charged to the budget)
+        self.excluded = 0
+        self.duration = 0.0
+        self.slowest_sql = None
+        self.slowest_duration = 0.0
+        self.lock = threading.Lock()
+
+    @property
+    def budgeted_count(self):
+        """Queries charged to the view's budget"""
+        return self.count - self.excluded
+
+    def record(self, sql, duration, excluded=None):
+        if excluded is None:
+            excluded = _is_excluded(sql)
+        with self.lock:
+            self.count += 1
+            if excluded:
+                self.excluded += 1
+            self.duration += duration
+            if duration > self.slowest_duration:
+                self.slowest_sql = sql
+                self.slowest_duration = duration
+        if self.parent is not None:
+            self.parent.record(sql, duration, excluded)
+
+    def current_request(self):
+        stats = self
+        while stats is not None and stats.request is None:
+            stats = stats.parent
+        return stats.request if stats is not None else None
+
+    def over_budget(self):
+        """(budgeted count, budget) of the nearest block with a budget, if it is exceeded"""
+        stats = self
+        while stats is not None and stats.budget is None:
+            stats = stats.parent
+        if stats is not None and stats.budgeted_count > stats.budget:
+            return stats.budgeted_count, stats.budget
+        return None
+
+
+_stats = contextvars.ContextVar('query_stats', default=None)
+
+
+@contextmanager
+def track_queries():
+    """
+    Record the queries run inside the block (any alias, any thread the block hands work to)
+
+    Usage (e.g. in a test):
+
+        with track_queries() as stats:
+            client.get('/api/designers/')
+        assert stats.count <= 3
+
+    Yields:
+        QueryStats: Filled in as queries run
+    """
+    stats = QueryStats(_stats.get())
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+    """Execute wrapper recording the statement into the current QueryStats, if any"""
+    stats = _stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        result = execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        stats.record(sql, duration)
+
+    slow = slow_queries.threshold()
+    if slow is not None and duration >= slow:
+        slow_queries.capture(sql, params, many, duration, context['connection'], stats.current_request())
+
+    if getattr(settings, 'API_QUERY_BUDGET_ENFORCE', False):
+        # Fail at the offending statement, while the view is still running
+        overrun = stats.over_budget()
+        if overrun is not None:
+            raise QueryBudgetExceeded(
+                f'Query {overrun[0]} exceeds the view\'s budget of {overrun[1]}: {sql}'
+            )
+    return result
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created handler adding record_query to every new connection"""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def query_budget(max_queries):
+    """
+    Declare the most queries a view may run for one request
+
+    Budgets are the measured worst case (cold caches) plus a margin of 2, and do
+    not count session / auth lookups (see api/tests.py, which asserts them for
+    anonymous and logged-in clients). QueryInstrumentationMiddleware logs every
+    overrun. With API_QUERY_BUDGET_ENFORCE on (the test suite), the statement that
+    goes over the budget raises QueryBudgetExceeded instead, so a lost prefetch
+    or a new per-row query fails loudly instead of slowing pages down quietly.
+
+    Apply it outermost (above @api_view and the conditional GET decorators).
+
+    Args:
+        max_queries (int): Query budget
+    """
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
@@ -0,0 +1,270 @@
+"""
+Database connection pooling
+
+Pooled backends (api.db.backends.mysql / api.db.backends.postgresql, enabled with
+DB_POOL=True) borrow a connection from a per-process pool when Django connects
+and hand it back when Django closes it at the end of the request, so requests
+skip the TCP handshake, authentication and session setup of a new connection.
+"""
+import os
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes free within the pool timeout"""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections
+
+    Idle connections are reused most-recently-used first (so surplus ones age out
+    after `max_idle`), checked with `check` when they sat idle longer than
+    `check_idle`, and at most `max_size` connections are open at once; callers
+    beyond that wait up to `timeout` seconds for one to be returned.
+    """
+
+    def __init__(self, connect, min_size=0, max_size=10, timeout=10.0, max_idle=600.0, check=None, check_idle=30.0):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.check = check
+        self.check_idle = check_idle
+        self._idle = deque()  # (connection, returned_at)
+        self._size = 0
+        self._lock = threading.Condition()
+        self._waiting = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._created = 0
+        self._closed = 0
+
+    def getconn(self):
+        """
+        Borrow a connection
+
+        Returns:
+            A DB-API connection
+
+        Raises:
+            PoolTimeout: If max_size connections stay in use for `timeout` seconds
+        """
+        deadline = None
+        while True:
+            with self._lock:
+                # Callers already waiting go first (no barging past the queue)
+                queued = self._waiting and deadline is None
+                connection, returned_at = (None, None) if queued else self._pop_idle()
+                if connection is None and self._size < self.max_size and not queued:
+                    # Reserve the slot, connect outside the lock
+                    self._size += 1
+                    returned_at = None
+                elif connection is None:
+                    if deadline is None:
+                        self._waits += 1
+                        deadline = time.monotonic() + self.timeout
+                    self._wait(deadline)
+                    continue
+
+            if returned_at is None:
+                return self._new_connection()
+            if self.check is None or time.monotonic() - returned_at < self.check_idle or self._healthy(connection):
+                return connection
+            self._discard(connection)
+
+    def putconn(self, connection, discard=False):
+        """
+        Return a borrowed connection
+
+        Args:
+            connection: Connection from getconn()
+            discard (bool): Close it instead of keeping it (broken / mid-transaction)
+        """
+        if discard:
+            self._discard(connection)
+            return
+        with self._lock:
+            self._idle.append((connection, time.monotonic()))
+            self._lock.notify()
+
+    def stats(self):
+        """
+        Pool metrics
+
+        Returns:
+            dict: size (open connections), in_use, idle, max_size, waiting (callers
+                  waiting now), waits (callers that had to wait), wait_time_ms (total
+                  time spent waiting), timeouts, connections_created, connections_closed
+        """
+        with self._lock:
+            return {
+                'size': self._size,
+                'in_use': self._size - len(self._idle),
+                'idle': len(self._idle),
+                'max_size': self.max_size,
+                'waiting': self._waiting,
+                'waits': self._waits,
+                'wait_time_ms': round(self._wait_time * 1000, 1),
+                'timeouts': self._timeouts,
+                'connections_created': self._created,
+                'connections_closed': self._closed,
+            }
+
+    def close(self):
+        """Close every idle connection (borrowed ones are closed when returned with discard)"""
+        with self._lock:
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+        for connection in idle:
+            self._discard(connection)
+
+    def _pop_idle(self):
+        """Most recently returned idle connection (closing expired ones), or (None, None); holds the lock"""
+        now = time.monotonic()
+        # Connections idle beyond max_idle are closed, down to min_size
+        while self._idle and self._size > self.min_size and now - self._idle[0][1] > self.max_idle:
+            connection, _ = self._idle.popleft()
+            self._size -= 1
+            self._closed += 1
+            self._close_quietly(connection)
+        if self._idle:
+            return self._idle.pop()
+        return None, None
+
+    def _wait(self, deadline):
+        """Wait for a returned connection; holds the lock"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            self._timeouts += 1
+            raise PoolTimeout(f'No database connection free within {self.timeout:g}s ({self.max_size} in use)')
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            self._lock.wait(remaining)
+        finally:
+            self._waiting -= 1
+            self._wait_time += time.monotonic() - started
+
+    def _new_connection(self):
+        try:
+            connection = self.connect()
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._created += 1
+        return connection
+
+    def _healthy(self, connection):
+        try:
+            self.check(connection)
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, connection):
+        self._close_quietly(connection)
+        with self._lock:
+            self._size -= 1
+            self._closed += 1
+            self._lock.notify()
+
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+# Pools of this process by database alias (forked workers create their own)
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias, create):
+    """
+    Get the process-wide pool of a database alias
+
+    Args:
+        alias (str): Database alias
+        create (callable): Builds the pool on first use
+
+    Returns:
+        Pool (ConnectionPool interface: getconn / putconn / stats / close)
+    """
+    key = (alias, os.getpid())
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = create()
+    return pool
+
+
+def pool_stats():
+    """
+    Metrics of this process's pools
+
+    Returns:
+        dict: Database alias -> ConnectionPool.stats()
+    """
+    pid = os.getpid()
+    return {alias: pool.stats() for (alias, owner), pool in list(_pools.items()) if owner == pid}
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    DatabaseWrapper mixin borrowing connections from a pool instead of opening them
+
+    Settings come from the database's POOL dict (see config/settings.py). Use with
+    CONN_MAX_AGE = 0: Django then "closes" the connection after every request,
+    which returns it to the pool.
+    """
+
+    def create_pool(self):
+        """Build the pool for this database (backend-specific)"""
+        raise NotImplementedError
+
+    def pool_options(self):
+        """POOL settings with defaults"""
+        options = {
+            'min_size': 0,
+            'max_size': 10,
+            'timeout': 10.0,
+            'max_idle': 600.0,
+            'check_idle': 30.0,
+        }
+        options.update(self.settings_dict.get('POOL') or {})
+        return options
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.create_pool)
+
+    def get_new_connection(self, conn_params):
+        try:
+            return self.pool.getconn()
+        except PoolTimeout as e:
+            # Surfaces as django.db.OperationalError
+            raise self.Database.OperationalError(str(e)) from e
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # A connection closed mid-transaction or after an error is not reused
+        discard = self.in_atomic_block or self.errors_occurred
+        if not discard and not self.get_autocommit():
+            try:
+                self.connection.rollback()
+            except Exception:
+                discard = True
+        self.pool.putconn(self.connection, discard=discard)
@@ -0,0 +1,168 @@
+"""
+Read-replica routing
+
+With read replicas configured (DB_REPLICA_HOSTS, see settings.DB_REPLICAS), reads
+made inside `replica_reads()` go to a replica picked by weight; everything else
+(every write, and every read outside that scope: scraper, admin, shell, management
+commands) stays on the primary. ReplicaRoutingMiddleware opens the scope for
+read-only /api/ requests.
+
+Within a scope:
+    - the replica is picked once, so all queries of a request (catalog version,
+      count, page) see the same snapshot
+    - a replica that cannot be connected to is skipped for DB_REPLICA_RETRY_AFTER
+      seconds; with none left, reads fall back to the primary
+    - after a write, the remaining reads go to the primary (read-your-writes)
+"""
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+class _ReadScope:
+    """Routing state of one request (shared by the threads it hands work to)"""
+
+    def __init__(self, primary=False):
+        self.primary = primary
+        self.alias = None
+        self.wrote = False
+        self.lock = threading.Lock()
+
+
+_scope = contextvars.ContextVar('replica_read_scope', default=None)
+
+# alias -> time.monotonic() until which the replica is skipped
+_unavailable = {}
+_unavailable_lock = threading.Lock()
+
+
+def replicas():
+    """
+    Configured read replicas
+
+    Returns:
+        dict: Database alias -> weight (only aliases present in DATABASES)
+    """
+    return {
+        alias: weight
+        for alias, weight in getattr(settings, 'DB_REPLICAS', {}).items()
+        if alias in settings.DATABASES and weight > 0
+    }
+
+
+@contextmanager
+def replica_reads(primary=False):
+    """
+    Route the reads made inside the block to a read replica
+
+    Args:
+        primary (bool): Keep the reads on the primary anyway (e.g. a client that
+                        just wrote); writes made in the block are still recorded
+
+    Yields:
+        _ReadScope: Scope state (`wrote` tells whether the block wrote)
+    """
+    scope = _ReadScope(primary)
+    token = _scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _scope.reset(token)
+
+
+def mark_unavailable(alias):
+    """Skip a replica for DB_REPLICA_RETRY_AFTER seconds"""
+    retry_after = getattr(settings, 'DB_REPLICA_RETRY_AFTER', 30)
+    with _unavailable_lock:
+        _unavailable[alias] = time.monotonic() + retry_after
+
+
+def replica_status():
+    """
+    Replica weights and availability (for /api/health/)
+
+    Returns:
+        dict: alias -> {'weight': int, 'available': bool}
+    """
+    now = time.monotonic()
+    with _unavailable_lock:
+        return {
+            alias: {'weight': weight, 'available': _unavailable.get(alias, 0) <= now}
+            for alias, weight in replicas().items()
+        }
+
+
+def _connectable(alias):
+    """Connect (or health-check the persistent connection) now, so failures fall over"""
+    connection = connections[alias]
+    try:
+        connection.close_if_health_check_failed()
+        connection.ensure_connection()
+    except DatabaseError:
+        mark_unavailable(alias)
+        return False
+    return True
+
+
+def choose_replica():
+    """
+    Pick an available replica, weighted, falling over to the others
+
+    Returns:
+        str: Replica alias, or DEFAULT_DB_ALIAS when none is reachable
+    """
+    now = time.monotonic()
+    with _unavailable_lock:
+        candidates = {
+            alias: weight for alias, weight in replicas().items()
+            if _unavailable.get(alias, 0) <= now
+        }
+
+    while candidates:
+        aliases = list(candidates)
+        alias = random.choices(aliases, weights=[candidates[a] for a in aliases])[0]
+        if _connectable(alias):
+            return alias
+        del candidates[alias]
+    return DEFAULT_DB_ALIAS
+
+
+class ReplicaRouter:
+    """
+    Database router sending scoped reads to replicas and all writes to the primary
+
+    Registered in DATABASE_ROUTERS; without replicas or outside replica_reads()
+    it returns None, i.e. Django's default (primary) routing.
+    """
+
+    def db_for_read(self, model, **hints):
+        scope = _scope.get()
+        if scope is None or scope.primary or scope.wrote:
+            return None
+        with scope.lock:
+            if scope.alias is None:
+                scope.alias = choose_replica()
+            return scope.alias
+
+    def db_for_write(self, model, **hints):
+        scope = _scope.get()
+        if scope is not None:
+            scope.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the primary's data: objects from any of them may be related
+        databases = {DEFAULT_DB_ALIAS, *replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive schema changes through replication
+        if db in replicas():
+            return False
+        return None
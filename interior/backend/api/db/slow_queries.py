@@ -0,0 +1,145 @@
+"""
+Slow-query capture
+
+Statements of a tracked request (see instrumentation.track_queries) that take at
+least API_SLOW_QUERY_MS are captured with:
+
+    - the endpoint (route name, method, path) and its normalized query parameters
+    - the SQL and its parameters
+    - the frame in api/services (else elsewhere in api/) that issued the statement
+    - for a sample of SELECTs (API_SLOW_QUERY_EXPLAIN_SAMPLE), the plan from the
+      backend's EXPLAIN (EXPLAIN QUERY PLAN on SQLite), run on the same connection
+
+Captures go to an in-process ring buffer (the last API_SLOW_QUERY_BUFFER_SIZE,
+served to staff at /api/slow-queries/) and, as one JSON object per line, to the
+`api.slow_queries` logger (a rotating file, see LOGGING in settings).
+"""
+import json
+import logging
+import os
+import random
+import sys
+import threading
+from collections import deque
+from django.conf import settings
+from django.utils import timezone
+
+logger = logging.getLogger('api.slow_queries')
+
+_buffer = deque(maxlen=200)
+_buffer_lock = threading.Lock()
+
+_SERVICES_DIR = os.path.join('api', 'services') + os.sep
+_API_DIR = os.sep + 'api' + os.sep
+_DB_DIR = os.path.join('api', 'db') + os.sep
+
+
+def threshold():
+    """Slow-query threshold in seconds, or None when capture is off"""
+    milliseconds = getattr(settings, 'API_SLOW_QUERY_MS', 0)
+    return milliseconds / 1000 if milliseconds > 0 else None
+
+
+def _issuer():
+    """'path:line in function' of the api/services frame (else api/ frame) issuing the query"""
+    fallback = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _API_DIR in filename and _DB_DIR not in filename:
+            location = f'{filename[filename.rindex(_API_DIR) + 1:]}:{frame.f_lineno} in {frame.f_code.co_name}'
+            if _SERVICES_DIR in filename:
+                return location
+            if fallback is None:
+                fallback = location
+        frame = frame.f_back
+    return fallback
+
+
+def _param_values(params):
+    """Statement parameters as (truncated) strings"""
+    if isinstance(params, dict):
+        return {name: str(value)[:200] for name, value in params.items()}
+    return [str(value)[:200] for value in (params or ())]
+
+
+def explain(connection, sql, params):
+    """
+    Plan of a statement from the backend's EXPLAIN
+
+    Runs on a plain backend cursor, so the EXPLAIN itself is neither counted nor
+    captured. Skipped for non-SELECTs and inside transactions.
+
+    Returns:
+        list: Plan lines, or None if the statement cannot be explained
+    """
+    # A failed statement would abort an enclosing PostgreSQL transaction
+    if not sql.lstrip().upper().startswith('SELECT') or connection.in_atomic_block:
+        return None
+    cursor = connection.create_cursor()
+    try:
+        cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+        return [' '.join(str(value) for value in row) for row in cursor.fetchall()]
+    except Exception as e:  # the plan is best-effort, never fail the request
+        return [f'EXPLAIN failed: {e}']
+    finally:
+        cursor.close()
+
+
+def capture(sql, params, many, duration, connection, request):
+    """
+    Record a slow statement
+
+    Args:
+        sql (str): Statement
+        params: Statement parameters
+        many (bool): executemany() call
+        duration (float): Seconds the statement took
+        connection: Django database connection that ran it
+        request: Django request being served, or None
+    """
+    entry = {
+        'time': timezone.now().isoformat(),
+        'duration_ms': round(duration * 1000, 2),
+        'database': connection.alias,
+        'vendor': connection.vendor,
+        'endpoint': None,
+        'params': None,
+        'sql': sql,
+        'sql_params': None if many else _param_values(params),
+        'issued_by': _issuer(),
+        'plan': None,
+        'pid': os.getpid(),
+    }
+    if request is not None:
+        from ..services.response_cache import ResponseCache
+
+        match = getattr(request, 'resolver_match', None)
+        entry['endpoint'] = {
+            'route': match.url_name if match is not None else None,
+            'method': request.method,
+            'path': request.path,
+        }
+        entry['params'] = ResponseCache.normalize_params(request.GET.dict())
+
+    if not many and random.random() < getattr(settings, 'API_SLOW_QUERY_EXPLAIN_SAMPLE', 0.1):
+        entry['plan'] = explain(connection, sql, params)
+
+    size = getattr(settings, 'API_SLOW_QUERY_BUFFER_SIZE', 200)
+    global _buffer
+    with _buffer_lock:
+        if _buffer.maxlen != size:
+            _buffer = deque(_buffer, maxlen=size)
+        _buffer.append(entry)
+    logger.warning(json.dumps(entry, default=str))
+
+
+def recent():
+    """
+    Captured slow statements of this process, newest first
+
+    Returns:
+        list: Capture dicts
+    """
+    with _buffer_lock:
+        return list(reversed(_buffer))
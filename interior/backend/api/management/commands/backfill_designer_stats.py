@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from api.models import Designer
+
+
+class Command(BaseCommand):
+    help = 'Recompute Designer.project_count and Designer.featured_image from projects'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Number of designers updated per UPDATE statement (default: 5000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = Designer.objects.order_by('id').values_list('id', flat=True)
+
+        updated = 0
+        last_id = 0
+        while True:
+            # Walk the primary key in ranges so each UPDATE stays short
+            batch = list(ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            updated += Designer.refresh_project_stats(batch)
+            last_id = batch[-1]
+            self.stdout.write(f'  Refreshed {updated} designers...')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Refreshed project stats for {updated} designers'))
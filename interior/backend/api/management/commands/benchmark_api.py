@@ -0,0 +1,216 @@
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from api.db.instrumentation import track_queries
+from api.models import Designer, Image, Project
+
+# (weight, name) of the request mix, roughly the frontend's traffic: listing pages
+# and detail pages dominate, filters / search / paging behind them
+MIX = [
+    (25, 'listing'),
+    (5, 'listing deep page'),
+    (8, 'listing category'),
+    (8, 'listing search'),
+    (4, 'listing ordering'),
+    (4, 'listing cursor'),
+    (3, 'listing sparse'),
+    (3, 'designer facets'),
+    (18, 'designer detail'),
+    (5, 'designer projects'),
+    (14, 'project detail'),
+    (4, 'project images'),
+    (1, 'designer batch'),
+    (1, 'project batch'),
+]
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Replay a weighted mix of the API endpoints against the configured database '
+        '(SQLite, MySQL or PostgreSQL, see DB_ENGINE) and report p50/p95/p99 latency, '
+        'queries per request and throughput per endpoint'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=1000, help='Timed requests (default: 1000)')
+        parser.add_argument('--warmup', type=int, default=50, help='Untimed requests first (default: 50)')
+        parser.add_argument(
+            '--concurrency', type=int, default=1,
+            help='Requests in flight, one thread each, like gunicorn threads/workers (default: 1)'
+        )
+        parser.add_argument('--seed', type=int, default=1, help='Random seed of the request mix (default: 1)')
+        parser.add_argument(
+            '--cold', action='store_true',
+            help='Disable the response cache, document store and count cache (every request queries)'
+        )
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        samples = self._samples(rng)
+        urls = self._requests(rng, samples, options['warmup'] + options['requests'])
+        warmup, timed = urls[:options['warmup']], urls[options['warmup']:]
+
+        overrides = {'ALLOWED_HOSTS': [*settings.ALLOWED_HOSTS, 'testserver']}
+        if options['cold']:
+            overrides.update(
+                API_RESPONSE_CACHE_ENABLED=False,
+                API_DOCUMENT_STORE_ENABLED=False,
+                LISTING_COUNT_CACHE_TTL=0,
+            )
+
+        cache.clear()
+        with override_settings(**overrides):
+            self._run(warmup, options['concurrency'])
+            wall, results = self._run(timed, options['concurrency'])
+
+        report = self._report(results, wall, options)
+        if options['json_path']:
+            with open(options['json_path'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f'Results written to {options["json_path"]}')
+
+    @staticmethod
+    def _samples(rng, size=200):
+        """Existing designer / project ids, categories and search words to build requests from"""
+        def sample_ids(model):
+            bounds = model.objects.order_by().values_list('id', flat=True)
+            low, high = bounds.order_by('id').first(), bounds.order_by('-id').first()
+            if low is None:
+                return []
+            # Seek to random points of the id range (cheap at any table size)
+            ids = {
+                bounds.filter(id__gte=rng.randint(low, high)).order_by('id').first()
+                for _ in range(size)
+            }
+            return sorted(ids)
+
+        designer_ids = sample_ids(Designer)
+        project_ids = sample_ids(Project)
+        if not designer_ids or not project_ids:
+            raise CommandError('No designers / projects in the database (run manage.py seed_catalog first)')
+
+        designers = Designer.objects.filter(id__in=designer_ids).values_list('category', 'business_name')
+        categories = sorted({category for category, _ in designers if category})
+        words = sorted({
+            word for _, name in designers for word in (name or '').split()
+            if len(word) > 3 and not word.isdigit()
+        })
+        return {
+            'designer_ids': designer_ids,
+            'project_ids': project_ids,
+            'categories': categories or ['Interior Designer'],
+            'words': words or ['design'],
+            'pages': max(1, min(50, Designer.objects.count() // 20)),
+        }
+
+    @staticmethod
+    def _requests(rng, samples, count):
+        """(name, url) pairs of the mix, deterministic for a seed"""
+        weights = [weight for weight, _ in MIX]
+        names = [name for _, name in MIX]
+
+        def batch_ids(ids):
+            return ','.join(map(str, rng.sample(ids, min(10, len(ids)))))
+
+        def build(name):
+            designer = rng.choice(samples['designer_ids'])
+            project = rng.choice(samples['project_ids'])
+            if name == 'listing':
+                return '/api/designers/'
+            if name == 'listing deep page':
+                return f'/api/designers/?page={rng.randint(2, max(2, samples["pages"]))}'
+            if name == 'listing category':
+                return f'/api/designers/?category={rng.choice(samples["categories"])}'
+            if name == 'listing search':
+                return f'/api/designers/?search={rng.choice(samples["words"])}'
+            if name == 'listing ordering':
+                return f'/api/designers/?ordering={rng.choice(["newest", "name", "most_projects", "price"])}'
+            if name == 'listing cursor':
+                return '/api/designers/?cursor='
+            if name == 'listing sparse':
+                return '/api/designers/?fields=id,business_name,featured_image'
+            if name == 'designer facets':
+                return '/api/designers/facets/' + (f'?search={rng.choice(samples["words"])}' if rng.random() < 0.3 else '')
+            if name == 'designer detail':
+                return f'/api/designers/{designer}/'
+            if name == 'designer projects':
+                return f'/api/designers/{designer}/projects/'
+            if name == 'project detail':
+                return f'/api/projects/{project}/'
+            if name == 'project images':
+                return f'/api/projects/{project}/images/'
+            if name == 'designer batch':
+                return '/api/designers/batch/?ids=' + batch_ids(samples['designer_ids'])
+            return '/api/projects/batch/?ids=' + batch_ids(samples['project_ids'])
+
+        return [(name, build(name)) for name in rng.choices(names, weights=weights, k=count)]
+
+    @staticmethod
+    def _run(requests, concurrency):
+        """Serve requests with `concurrency` threads; returns (wall seconds, results)"""
+        def fetch(request):
+            name, url = request
+            with track_queries() as stats:
+                start = time.perf_counter()
+                response = Client().get(url)
+                elapsed = time.perf_counter() - start
+            return name, elapsed, stats.count, response.status_code
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(fetch, requests))
+        return time.perf_counter() - started, results
+
+    def _report(self, results, wall, options):
+        by_name = defaultdict(list)
+        for result in results:
+            by_name[result[0]].append(result)
+
+        self.stdout.write(
+            f'{connection.vendor}: {Designer.objects.count()} designers, {Project.objects.count()} projects, '
+            f'{Image.objects.count()} images; {len(results)} requests, concurrency {options["concurrency"]}'
+            f'{", cold caches" if options["cold"] else ""}\n'
+            f'{"endpoint":<20} {"n":>5} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"queries":>8} {"errors":>7}'
+        )
+
+        endpoints = {}
+        for _, name in MIX + [(0, 'all')]:
+            rows = results if name == 'all' else by_name.get(name)
+            if not rows:
+                continue
+            timings = sorted(elapsed for _, elapsed, _, _ in rows)
+            endpoints[name] = {
+                'requests': len(rows),
+                'p50_ms': round(percentile(timings, 0.5) * 1000, 2),
+                'p95_ms': round(percentile(timings, 0.95) * 1000, 2),
+                'p99_ms': round(percentile(timings, 0.99) * 1000, 2),
+                'queries_per_request': round(statistics.mean(queries for _, _, queries, _ in rows), 2),
+                'errors': sum(1 for _, _, _, status in rows if status >= 400),
+            }
+            stats = endpoints[name]
+            self.stdout.write(
+                f'{name:<20} {stats["requests"]:>5} {stats["p50_ms"]:>8.1f} {stats["p95_ms"]:>8.1f} '
+                f'{stats["p99_ms"]:>8.1f} {stats["queries_per_request"]:>8.1f} {stats["errors"]:>7}'
+            )
+
+        throughput = len(results) / wall
+        self.stdout.write(f'throughput: {throughput:.1f} req/s ({wall:.2f}s wall)')
+        return {
+            'vendor': connection.vendor,
+            'options': {key: options[key] for key in ('requests', 'warmup', 'concurrency', 'seed', 'cold')},
+            'throughput_rps': round(throughput, 1),
+            'endpoints': endpoints,
+        }
@@ -0,0 +1,153 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import ThreadSensitiveContext
+from types import ModuleType
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import AsyncClient, Client, override_settings
+from django.urls import path
+from api.models import Designer, Project
+from api.view.designer_view import designer_listing, designer_listing_async
+from api.view.designer_detail_view import designer_detail, designer_detail_async
+from api.view.project_detail_view import project_detail, project_detail_async
+
+
+def _urlconf(name, listing, designer, project):
+    # Both variants are benchmarked whatever API_ASYNC_VIEWS routes
+    urlconf = ModuleType(name)
+    urlconf.urlpatterns = [
+        path('api/designers/', listing),
+        path('api/designers/<int:designer_id>/', designer),
+        path('api/projects/<int:project_id>/', project),
+    ]
+    return urlconf
+
+
+SYNC_URLCONF = _urlconf('sync_urls', designer_listing, designer_detail, project_detail)
+ASYNC_URLCONF = _urlconf('async_urls', designer_listing_async, designer_detail_async, project_detail_async)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare the sync views (fixed pool of sync workers) with the async views (one event loop) '
+        'under simulated database latency: throughput, latency percentiles, identical output check'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=120, help='Requests per mode (default: 120)')
+        parser.add_argument(
+            '--sync-workers', type=int, default=3,
+            help='Concurrent requests in sync mode, like gunicorn --workers (default: 3)'
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=30,
+            help='Requests in flight in async mode (default: 30)'
+        )
+        parser.add_argument(
+            '--db-latency-ms', type=float, default=20.0,
+            help='Delay added to every database query, e.g. a slow or remote database (default: 20)'
+        )
+
+    def handle(self, *args, **options):
+        designer_ids = list(Designer.objects.order_by('id').values_list('id', flat=True)[:20])
+        project_ids = list(Project.objects.order_by('id').values_list('id', flat=True)[:20])
+        if not designer_ids or not project_ids:
+            raise CommandError('No designers / projects in the database (run the scraper or seed data first)')
+
+        # Listing pages (offset mode counts and pages), designer and project details
+        urls = []
+        for i in range(options['requests']):
+            kind = i % 3
+            if kind == 0:
+                urls.append(f'/api/designers/?page={i % 5 + 1}')
+            elif kind == 1:
+                urls.append(f'/api/designers/{designer_ids[i % len(designer_ids)]}/')
+            else:
+                urls.append(f'/api/projects/{project_ids[i % len(project_ids)]}/')
+
+        latency = options['db_latency_ms'] / 1000
+
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            if slow_query not in connection.execute_wrappers:
+                connection.execute_wrappers.append(slow_query)
+
+        # Every request hits the database: no response / count cache, no materialized documents
+        # (the test client's host is allowed for the in-process requests)
+        no_caches = override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+            API_RESPONSE_CACHE_ENABLED=False,
+            API_DOCUMENT_STORE_ENABLED=False,
+            LISTING_COUNT_CACHE_TTL=0,
+        )
+
+        connections.close_all()
+        connection_created.connect(add_latency)
+        try:
+            with no_caches:
+                sync_results = self._run_sync(urls, max(1, options['sync_workers']))
+                async_results = asyncio.run(self._run_async(urls, max(1, options['concurrency'])))
+        finally:
+            connection_created.disconnect(add_latency)
+            connections.close_all()
+
+        self.stdout.write(
+            f'{len(urls)} requests, +{options["db_latency_ms"]:g} ms per query\n'
+            f'{"mode":<28} {"wall s":>8} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8}'
+        )
+        for name, (wall, timings, _) in (
+            (f'sync, {options["sync_workers"]} workers', sync_results),
+            (f'async, {options["concurrency"]} in flight', async_results),
+        ):
+            timings = sorted(timings)
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f'{name:<28} {wall:>8.2f} {len(timings) / wall:>8.1f} '
+                f'{statistics.median(timings) * 1000:>8.1f} {p95 * 1000:>8.1f}'
+            )
+
+        differing = [url for url in urls if sync_results[2][url] != async_results[2][url]]
+        if differing:
+            raise CommandError(f'Async responses differ from sync ones: {", ".join(sorted(set(differing)))}')
+        self.stdout.write('identical responses: yes')
+
+    @staticmethod
+    def _run_sync(urls, workers):
+        """Serve urls with `workers` threads running the sync views, one request at a time each"""
+        def fetch(url):
+            start = time.perf_counter()
+            response = Client().get(url)
+            return url, time.perf_counter() - start, (response.status_code, response.content)
+
+        with override_settings(ROOT_URLCONF=SYNC_URLCONF):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(fetch, urls))
+            wall = time.perf_counter() - started
+        return wall, [elapsed for _, elapsed, _ in results], {url: body for url, _, body in results}
+
+    @staticmethod
+    async def _run_async(urls, concurrency):
+        """Serve urls from one event loop with the async views, `concurrency` requests in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+        client = AsyncClient()
+
+        async def fetch(url):
+            # Like ASGIHandler, give each request its own thread for sync / async ORM work
+            async with semaphore, ThreadSensitiveContext():
+                start = time.perf_counter()
+                response = await client.get(url)
+                return url, time.perf_counter() - start, (response.status_code, response.content)
+
+        with override_settings(ROOT_URLCONF=ASYNC_URLCONF):
+            started = time.perf_counter()
+            results = await asyncio.gather(*(fetch(url) for url in urls))
+            wall = time.perf_counter() - started
+        return wall, [elapsed for _, elapsed, _ in results], {url: body for url, _, body in results}
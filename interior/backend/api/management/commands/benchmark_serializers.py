@@ -0,0 +1,76 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from api.models import Designer, Project
+from api.serializers import (
+    DesignerListingSerializer,
+    DesignerDetailSerializer,
+    ProjectDetailSerializer,
+    compiled_designer_listing_serializer,
+    compiled_designer_detail_serializer,
+    compiled_project_detail_serializer,
+)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark DRF serializers against the compiled fast path (per-object cost, identical output check)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=100, help='Objects per case (default: 100)')
+        parser.add_argument('--repeat', type=int, default=20, help='Timed passes per case (default: 20)')
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        repeat = options['repeat']
+
+        # Load everything up front with the serializers' query plans (nested lists are
+        # prefetched into the default relation caches, which `.all()` reuses) so only
+        # serialization is timed, not the database
+        designers = list(compiled_designer_listing_serializer.plan().apply(Designer.objects.order_by('id'))[:limit])
+        designers_with_projects = list(
+            compiled_designer_detail_serializer.plan().apply(Designer.objects.order_by('id'))[:limit]
+        )
+        projects = list(compiled_project_detail_serializer.plan().apply(Project.objects.order_by('id'))[:limit])
+
+        if not designers:
+            raise CommandError('No designers in the database (run the scraper or seed data first)')
+
+        cases = [
+            ('designer listing', designers, DesignerListingSerializer, compiled_designer_listing_serializer),
+            ('designer detail', designers_with_projects, DesignerDetailSerializer, compiled_designer_detail_serializer),
+            ('project detail', projects, ProjectDetailSerializer, compiled_project_detail_serializer),
+        ]
+
+        renderer = JSONRenderer()
+        self.stdout.write(f'{"case":<18} {"objects":>8} {"DRF µs/obj":>12} {"compiled µs/obj":>16} {"speedup":>8}  identical')
+
+        for name, objs, serializer_class, compiled in cases:
+            if not objs:
+                self.stdout.write(f'{name:<18} {0:>8}  (no data)')
+                continue
+
+            drf_data = serializer_class(objs, many=True).data
+            fast_data = compiled.serialize_many(objs)
+            identical = renderer.render(drf_data) == renderer.render(fast_data)
+
+            drf_time = self._time(lambda: serializer_class(objs, many=True).data, repeat)
+            fast_time = self._time(lambda: compiled.serialize_many(objs), repeat)
+
+            per_drf = drf_time / len(objs) * 1e6
+            per_fast = fast_time / len(objs) * 1e6
+            self.stdout.write(
+                f'{name:<18} {len(objs):>8} {per_drf:>12.1f} {per_fast:>16.1f} '
+                f'{per_drf / per_fast:>7.1f}x  {"yes" if identical else "NO"}'
+            )
+            if not identical:
+                raise CommandError(f'Compiled output differs from {serializer_class.__name__}')
+
+    @staticmethod
+    def _time(func, repeat):
+        """Best-of-`repeat` wall time of one call, in seconds"""
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from api.models import ApiDocument
+from api.services.document_store_service import DocumentStoreService
+
+
+class Command(BaseCommand):
+    help = 'Materialize designer and project detail response bodies (only missing ones unless --all)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Rebuild every document, not only the missing ones',
+        )
+        parser.add_argument(
+            '--kind',
+            choices=[ApiDocument.KIND_DESIGNER, ApiDocument.KIND_PROJECT],
+            help='Only build documents of this kind',
+        )
+
+    def handle(self, *args, **options):
+        kinds = [options['kind']] if options['kind'] else [ApiDocument.KIND_DESIGNER, ApiDocument.KIND_PROJECT]
+
+        for kind in kinds:
+            if options['all']:
+                model = DocumentStoreService.missing_ids(kind).model
+                ids = model.objects.order_by('id').values_list('id', flat=True)
+            else:
+                ids = DocumentStoreService.missing_ids(kind)
+
+            built = 0
+            # Materialize the ID list first: building documents writes to api_documents
+            for object_id in list(ids):
+                built += int(DocumentStoreService.build(kind, object_id))
+                if built and built % 1000 == 0:
+                    self.stdout.write(f'  Built {built} {kind} documents...')
+
+            self.stdout.write(self.style.SUCCESS(f'✅ Built {built} {kind} documents'))
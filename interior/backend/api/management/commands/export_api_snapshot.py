@@ -0,0 +1,86 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connections
+from api.services.snapshot_service import SnapshotService
+
+
+def _init_worker():
+    # Spawned workers start without Django; forked ones must not reuse the parent's connections
+    if not apps.ready:
+        django.setup()
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = (
+        'Export every listing page, designer detail and project detail as (precompressed) '
+        'JSON files for nginx to serve; only files whose content changed are rewritten. '
+        'Run after each scrape.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            help='Snapshot root (default: API_SNAPSHOT_ROOT)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Worker processes (default: CPU count; 1 exports in this process)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Files rendered per worker task (default: 200)',
+        )
+        parser.add_argument(
+            '--kind',
+            choices=SnapshotService.KINDS,
+            help='Only export this kind (stale files are then left in place)',
+        )
+
+    def handle(self, *args, **options):
+        root = str(options['output'] or SnapshotService.root())
+        workers = max(1, options['workers'])
+        batch_size = max(1, options['batch_size'])
+        kinds = [options['kind']] if options['kind'] else list(SnapshotService.KINDS)
+        started = time.monotonic()
+
+        tasks = []
+        for kind in kinds:
+            keys = SnapshotService.keys(kind)
+            tasks += [(kind, keys[i:i + batch_size]) for i in range(0, len(keys), batch_size)]
+
+        exported = set()
+        written = 0
+
+        if workers == 1:
+            for kind, keys in tasks:
+                paths, changed = SnapshotService.export(root, kind, keys)
+                exported.update(paths)
+                written += changed
+        else:
+            # Connections opened above must not be shared with forked workers
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [executor.submit(SnapshotService.export, root, kind, keys) for kind, keys in tasks]
+                for done, future in enumerate(as_completed(futures), 1):
+                    paths, changed = future.result()
+                    exported.update(paths)
+                    written += changed
+                    if done % 50 == 0:
+                        self.stdout.write(f'  Exported {len(exported)} files ({done}/{len(futures)} batches)...')
+
+        removed = 0 if options['kind'] else SnapshotService.remove_stale(root, exported)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Exported {len(exported)} files to {root}: {written} rewritten, '
+            f'{len(exported) - written} unchanged, {removed} removed '
+            f'({time.monotonic() - started:.1f}s)'
+        ))
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+from api.models import CatalogVersion, Designer, DesignerFacet
+
+
+class Command(BaseCommand):
+    help = (
+        'Re-derive Designer.city / price_bucket and recount the designer facets '
+        '(after writes that skip signals, e.g. QuerySet.update() or raw SQL)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--skip-derive', action='store_true',
+            help='Only recount the facets from the stored city / price_bucket columns',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=2000,
+            help='Designers updated per statement when re-deriving (default: 2000)',
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias (default: default)')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        batch_size = options['batch_size']
+
+        if not options['skip_derive']:
+            designers = Designer.objects.using(using).only(
+                'business_name', 'typical_job_cost', 'address'
+            ).order_by('id')
+            fields = ['sort_name', 'sort_price', 'city', 'price_bucket']
+            updated = 0
+            last_id = 0
+            while True:
+                # Walk the primary key in ranges so each statement stays short
+                batch = list(designers.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+                for designer in batch:
+                    designer.update_derived_fields()
+                Designer.objects.using(using).bulk_update(batch, fields)
+                updated += len(batch)
+                last_id = batch[-1].id
+                self.stdout.write(f'  Re-derived {updated} designers...')
+
+        rows = DesignerFacet.rebuild(using=using)
+        # Cached facet / listing responses were built from the old values
+        CatalogVersion.bump()
+        self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt {rows} designer facet counts'))
@@ -0,0 +1,212 @@
+import random
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Max
+from api.models import ApiDocument, CatalogVersion, Designer, DesignerFacet, Image, Project
+
+CATEGORIES = [
+    'Interior Designer', 'Architect', 'Kitchen & Bath Designer', 'Home Builder',
+    'Furniture & Accessories', 'Landscape Architect', 'Lighting Designer', 'Design-Build Firm',
+]
+CITIES = [
+    'Mumbai', 'Delhi', 'Bengaluru', 'Pune', 'Hyderabad', 'Chennai', 'Kolkata',
+    'Ahmedabad', 'Jaipur', 'Chandigarh', 'Kochi', 'Goa', 'Lucknow', 'Indore',
+]
+NAME_WORDS = [
+    'Studio', 'Design', 'Interiors', 'Spaces', 'Atelier', 'Concepts', 'Living', 'Habitat',
+    'Nest', 'Craft', 'Form', 'Axis', 'Canvas', 'Urban', 'Modern', 'Heritage', 'Earth',
+    'Lotus', 'Indigo', 'Teak', 'Marble', 'Linen', 'Aura', 'Vastu', 'Decor', 'Works',
+]
+TEXT_WORDS = [
+    'modern', 'minimal', 'luxury', 'residential', 'commercial', 'kitchen', 'bedroom',
+    'living', 'bathroom', 'villa', 'apartment', 'office', 'turnkey', 'renovation',
+    'furniture', 'lighting', 'wardrobe', 'modular', 'contemporary', 'traditional',
+    'sustainable', 'budget', 'premium', 'space', 'planning', 'execution', 'the', 'and',
+    'with', 'for', 'our', 'team', 'projects', 'homes', 'clients', 'design', 'quality',
+]
+ROOMS = ['Living Room', 'Kitchen', 'Master Bedroom', 'Bathroom', 'Dining', 'Home Office', 'Balcony', 'Foyer']
+JOB_COSTS = ['₹50,000 - ₹2,00,000', '₹2,00,000 - ₹5,00,000', '₹5,00,000 - ₹10,00,000', '₹10,00,000+', None]
+
+# Rows per size preset: images (the largest table), ~20 per project, ~10 projects per designer
+SIZES = {'10k': 10_000, '100k': 100_000, '2m': 2_000_000, '20m': 20_000_000}
+IMAGES_PER_PROJECT = 20
+PROJECTS_PER_DESIGNER = 10
+
+
+def _count(rng, mean, maximum):
+    """Skewed row count (most designers / projects are small, a few are large)"""
+    return min(maximum, int(rng.expovariate(1 / mean)))
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-generate a synthetic catalog (designers, projects, images) for benchmarks, '
+        'e.g. --size 100k / 2m / 20m images, with batched inserts'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size', default='100k',
+            help=f'Approximate number of images: {", ".join(SIZES)} or a number (default: 100k)'
+        )
+        parser.add_argument('--designers', type=int, help='Number of designers (default: derived from --size)')
+        parser.add_argument(
+            '--projects-per-designer', type=float, default=PROJECTS_PER_DESIGNER,
+            help=f'Mean projects per designer (default: {PROJECTS_PER_DESIGNER})'
+        )
+        parser.add_argument(
+            '--images-per-project', type=float, default=IMAGES_PER_PROJECT,
+            help=f'Mean images per project (default: {IMAGES_PER_PROJECT})'
+        )
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per INSERT (default: 5000)')
+        parser.add_argument('--seed', type=int, default=1, help='Random seed, for repeatable catalogs (default: 1)')
+        parser.add_argument(
+            '--clear', action='store_true',
+            help='Empty the designers, projects, images and API documents tables first'
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='Database alias (default: default)')
+
+    def handle(self, *args, **options):
+        size = options['size'].lower()
+        try:
+            images = SIZES[size] if size in SIZES else int(size)
+        except ValueError:
+            raise CommandError(f'Invalid --size {options["size"]!r}')
+
+        per_designer = options['projects_per_designer'] * options['images_per_project']
+        designers = options['designers'] or max(1, round(images / per_designer))
+        using = options['database']
+        connection = connections[using]
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.using = using
+
+        if options['clear']:
+            # Same statements as `manage.py flush`, for the catalog tables only
+            tables = [model._meta.db_table for model in (Image, Project, Designer, ApiDocument)]
+            connection.ops.execute_sql_flush(
+                connection.ops.sql_flush(no_style(), tables, reset_sequences=True)
+            )
+
+        # Explicit primary keys: no RETURNING needed (MySQL has none), and children
+        # can reference their parents before the parents are inserted
+        self.next_id = {
+            model: (model.objects.using(using).aggregate(top=Max('id'))['top'] or 0) + 1
+            for model in (Designer, Project, Image)
+        }
+
+        self.stdout.write(
+            f'Seeding ~{designers} designers, ~{round(designers * options["projects_per_designer"])} projects, '
+            f'~{round(designers * per_designer)} images into {connection.vendor} ({using})'
+        )
+        started = time.perf_counter()
+        totals = {Designer: 0, Project: 0, Image: 0}
+        pending = {Designer: [], Project: [], Image: []}
+
+        for _ in range(designers):
+            designer, projects, project_images = self._designer(
+                options['projects_per_designer'], options['images_per_project']
+            )
+            pending[Designer].append(designer)
+            pending[Project] += projects
+            pending[Image] += project_images
+            if len(pending[Image]) >= self.batch_size * 4 or len(pending[Designer]) >= self.batch_size:
+                self._flush(pending, totals)
+                self._progress(totals, started)
+        self._flush(pending, totals)
+
+        # Postgres sequences do not follow explicit primary keys
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Designer, Project, Image]):
+                cursor.execute(sql)
+
+        # Bulk inserts send no signals: recount the facets and invalidate cached responses once
+        DesignerFacet.rebuild(using=using)
+        CatalogVersion.bump()
+
+        elapsed = time.perf_counter() - started
+        rows = sum(totals.values())
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Inserted {totals[Designer]} designers, {totals[Project]} projects, {totals[Image]} images '
+            f'in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)'
+        ))
+
+    def _take_id(self, model):
+        value = self.next_id[model]
+        self.next_id[model] += 1
+        return value
+
+    def _words(self, count):
+        return ' '.join(self.rng.choice(TEXT_WORDS) for _ in range(count))
+
+    def _designer(self, projects_mean, images_mean):
+        """Generate one designer with its projects and images (unsaved, ids assigned)"""
+        rng = self.rng
+        designer_id = self._take_id(Designer)
+        city = rng.choice(CITIES)
+        name = f'{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} {designer_id}'
+
+        projects, images = [], []
+        for _ in range(_count(rng, projects_mean, 200)):
+            project_id = self._take_id(Project)
+            thumbnail = f'https://st.hzcdn.com/seed/{project_id}/thumb.jpg' if rng.random() < 0.9 else None
+            image_total = _count(rng, images_mean, 300)
+            projects.append(Project(
+                id=project_id,
+                designer_id=designer_id,
+                project_id=f'seed-{project_id}',
+                url=f'https://www.houzz.in/projects/seed-{project_id}',
+                image=thumbnail,
+                location=city,
+                project_title=f'{rng.choice(ROOMS)} - {self._words(3).title()}',
+                project_cost=rng.choice(JOB_COSTS),
+                image_count=image_total,
+            ))
+            for position in range(image_total):
+                image_id = self._take_id(Image)
+                images.append(Image(
+                    id=image_id,
+                    project_id=project_id,
+                    image_id=f'seed-{image_id}',
+                    title=f'{rng.choice(ROOMS)} {position + 1}',
+                    image_url=f'https://st.hzcdn.com/seed/{project_id}/{image_id}.jpg',
+                ))
+
+        designer = Designer(
+            id=designer_id,
+            business_name=name,
+            category=rng.choice(CATEGORIES),
+            about_us=self._words(rng.randint(10, 150)).capitalize() + '.',
+            services_provided=', '.join(rng.sample(TEXT_WORDS[:25], 4)),
+            areas_served=', '.join(rng.sample(CITIES, 3)),
+            phone_number=f'+91 9{rng.randint(100000000, 999999999)}',
+            website=f'https://{name.split()[0].lower()}{designer_id}.example.in',
+            address=f'{rng.randint(1, 400)}, {rng.choice(NAME_WORDS)} Road, {city}',
+            typical_job_cost=rng.choice(JOB_COSTS),
+            followers=str(rng.randint(0, 5000)),
+            # Denormalized stats, as Designer.refresh_project_stats would compute them
+            project_count=len(projects),
+            featured_image=projects[0].image if projects else None,
+        )
+        # bulk_create() skips save(), which derives the sort keys and facet values
+        designer.update_derived_fields()
+        return designer, projects, images
+
+    def _flush(self, pending, totals):
+        """Insert the pending rows (parents first) in one transaction"""
+        with transaction.atomic(using=self.using):
+            for model in (Designer, Project, Image):
+                if pending[model]:
+                    model.objects.using(self.using).bulk_create(pending[model], batch_size=self.batch_size)
+                    totals[model] += len(pending[model])
+                    pending[model] = []
+
+    def _progress(self, totals, started):
+        elapsed = time.perf_counter() - started
+        rows = sum(totals.values())
+        self.stdout.write(
+            f'  {totals[Designer]} designers, {totals[Project]} projects, {totals[Image]} images '
+            f'({rows / elapsed:,.0f} rows/s)'
+        )
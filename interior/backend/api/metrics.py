@@ -0,0 +1,140 @@
+"""
+Prometheus metrics for the API (served at /api/metrics/)
+
+Recorded per route name (designer-listing, designer-detail, project-detail, ...):
+request latency by method and status, response size on the wire, queries and
+database time per request, plus cache lookups (hit / miss) of the response cache,
+the materialized documents, the compressed-variant cache and the listing counts,
+and connection pool usage when DB_POOL is on.
+
+Gunicorn runs several worker processes. With PROMETHEUS_MULTIPROC_DIR set (see
+gunicorn.service) every worker writes its samples to memory-mapped files in that
+directory, and /api/metrics/ aggregates the files of all workers, whichever worker
+answers the scrape. Without it the metrics cover the answering process only
+(runserver, single worker).
+
+Requires the `prometheus_client` package; without it nothing is recorded and the
+endpoint answers 503.
+"""
+import os
+from django.conf import settings
+from .db.pool import pool_stats
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'api_request_duration_seconds', 'API request latency',
+        ['route', 'method', 'status'],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0),
+    )
+    RESPONSE_SIZE = prometheus_client.Histogram(
+        'api_response_size_bytes', 'API response body size as sent (after compression)',
+        ['route'],
+        buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+    )
+    REQUEST_QUERIES = prometheus_client.Histogram(
+        'api_request_queries', 'Database queries per API request',
+        ['route'],
+        buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 25, 50, 100),
+    )
+    REQUEST_DB_TIME = prometheus_client.Histogram(
+        'api_request_db_duration_seconds', 'Database time per API request',
+        ['route'],
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    )
+    QUERY_BUDGET_EXCEEDED = prometheus_client.Counter(
+        'api_query_budget_exceeded_total', 'API requests that ran more queries than their @query_budget',
+        ['route'],
+    )
+    CACHE_LOOKUPS = prometheus_client.Counter(
+        'api_cache_lookups_total', 'API cache lookups (response, document, compressed, count)',
+        ['cache', 'result'],
+    )
+    # Summed over the live workers (a dead worker's pool is gone with it)
+    POOL_CONNECTIONS = prometheus_client.Gauge(
+        'api_db_pool_connections', 'Pooled database connections by state',
+        ['alias', 'state'], multiprocess_mode='livesum',
+    )
+    POOL_WAITS = prometheus_client.Gauge(
+        'api_db_pool_waits', 'Requests that waited for a pooled connection (since worker start)',
+        ['alias'], multiprocess_mode='livesum',
+    )
+    POOL_TIMEOUTS = prometheus_client.Gauge(
+        'api_db_pool_timeouts', 'Requests that timed out waiting for a pooled connection (since worker start)',
+        ['alias'], multiprocess_mode='livesum',
+    )
+
+
+def enabled():
+    return prometheus_client is not None and getattr(settings, 'API_METRICS_ENABLED', True)
+
+
+def route_name(request):
+    """Route label of a request: its URL name, or 'unmatched' (404s, redirects)"""
+    match = getattr(request, 'resolver_match', None)
+    return (match.url_name if match is not None else None) or 'unmatched'
+
+
+def observe_request(request, response, stats, elapsed, over_budget=False):
+    """
+    Record a finished API request
+
+    Args:
+        request: Django request
+        response: Django response (as sent, i.e. compressed)
+        stats (QueryStats): Queries the request ran
+        elapsed (float): Request duration in seconds
+        over_budget (bool): The request exceeded its view's query budget
+    """
+    if not enabled() or not request.path.startswith('/api/'):
+        return
+    route = route_name(request)
+
+    REQUEST_LATENCY.labels(route, request.method, str(response.status_code)).observe(elapsed)
+    if not response.streaming:
+        RESPONSE_SIZE.labels(route).observe(len(response.content))
+    REQUEST_QUERIES.labels(route).observe(stats.count)
+    REQUEST_DB_TIME.labels(route).observe(stats.duration)
+    if over_budget:
+        QUERY_BUDGET_EXCEEDED.labels(route).inc()
+
+    for alias, pool in pool_stats().items():
+        POOL_CONNECTIONS.labels(alias, 'in_use').set(pool['in_use'])
+        POOL_CONNECTIONS.labels(alias, 'idle').set(pool['idle'])
+        POOL_WAITS.labels(alias).set(pool['waits'])
+        POOL_TIMEOUTS.labels(alias).set(pool['timeouts'])
+
+
+def cache_lookup(cache, hit):
+    """
+    Record a cache lookup
+
+    Args:
+        cache (str): 'response', 'document', 'compressed' or 'count'
+        hit (bool): The lookup found an entry
+    """
+    if enabled():
+        CACHE_LOOKUPS.labels(cache, 'hit' if hit else 'miss').inc()
+
+
+def render():
+    """
+    Render the metrics in the Prometheus text format
+
+    Returns:
+        tuple: (body bytes, content type)
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Aggregate the files every worker process wrote
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
+
@@ -0,0 +1,249 @@
+"""
+HTTP middleware for the API
+"""
+import logging
+import time
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from . import metrics
+from .db.instrumentation import track_queries
+from .db.router import replica_reads, replicas
+from .services.response_cache import CompressedResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def negotiate_encoding(accept_encoding, available):
+    """
+    Pick the response encoding for an Accept-Encoding header
+
+    Args:
+        accept_encoding (str): Accept-Encoding request header
+        available (tuple): Supported encodings in preference order
+
+    Returns:
+        str or None: Best acceptable encoding (highest q, then preference order),
+                     or None to send the body uncompressed
+    """
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressedResponseCacheMiddleware:
+    """
+    Compress cacheable API JSON responses, reusing cached compressed variants
+
+    Serves Brotli (when the `brotli` package is installed) or gzip according to
+    Accept-Encoding. Each response is compressed once per encoding and the variant
+    cached under the response's cache key or ETag (see CompressedResponseCache). Like
+    Django's GZipMiddleware it adds `Vary: Accept-Encoding` and weakens strong
+    ETags, which conditional GETs still match (weak comparison).
+
+    Works in sync (WSGI) and async (ASGI) middleware chains; under ASGI the cache
+    lookup and any compression run on a worker thread, off the event loop.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self._compressible(request, response):
+            self._compress(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self._compressible(request, response):
+            await sync_to_async(self._compress, thread_sensitive=False)(request, response)
+        return response
+
+    @staticmethod
+    def _compressible(request, response):
+        if not getattr(settings, 'API_COMPRESSION_ENABLED', True):
+            return False
+        if request.method not in ('GET', 'HEAD') or not request.path.startswith('/api/'):
+            return False
+        if response.status_code != 200 or response.streaming or response.has_header('Content-Encoding'):
+            return False
+        if not response.get('Content-Type', '').startswith('application/json'):
+            return False
+        cache_control = response.get('Cache-Control', '')
+        if 'no-store' in cache_control or 'private' in cache_control:
+            return False
+        return len(response.content) >= getattr(settings, 'API_COMPRESSION_MIN_SIZE', 512)
+
+    @staticmethod
+    def _compress(request, response):
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = negotiate_encoding(
+            request.META.get('HTTP_ACCEPT_ENCODING', ''), CompressedResponseCache.ENCODINGS
+        )
+        if encoding is None:
+            return
+
+        key = CompressedResponseCache.key(request, response)
+        body, _ = CompressedResponseCache.get(key, response.content, encoding)
+        if len(body) >= len(response.content):
+            return
+
+        response.content = body
+        response['Content-Length'] = str(len(body))
+        response['Content-Encoding'] = encoding
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            # The representation differs per encoding
+            response['ETag'] = 'W/' + etag
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve read-only API requests from the read replicas (see api.db.router)
+
+    GET / HEAD requests under /api/ read from a replica; other requests (admin,
+    writes) stay on the primary. A request that writes sets a short-lived cookie
+    (DB_REPLICA_STICKY_SECONDS) that keeps the client's next requests on the
+    primary, so it reads its own writes whatever the replication lag.
+
+    Unused (removed from the chain) when no replica is configured.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    COOKIE_NAME = 'db_primary'
+
+    def __init__(self, get_response):
+        if not replicas():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with replica_reads(primary=self._needs_primary(request)) as scope:
+            response = self.get_response(request)
+        self._set_sticky(scope, response)
+        return response
+
+    async def __acall__(self, request):
+        with replica_reads(primary=self._needs_primary(request)) as scope:
+            response = await self.get_response(request)
+        self._set_sticky(scope, response)
+        return response
+
+    def _needs_primary(self, request):
+        if request.method not in ('GET', 'HEAD') or not request.path.startswith('/api/'):
+            return True
+        return self.COOKIE_NAME in request.COOKIES
+
+    def _set_sticky(self, scope, response):
+        if scope.wrote:
+            response.set_cookie(
+                self.COOKIE_NAME, '1',
+                max_age=getattr(settings, 'DB_REPLICA_STICKY_SECONDS', 10),
+                httponly=True, samesite='Lax', secure=settings.SESSION_COOKIE_SECURE,
+            )
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record each request's queries, report them in Server-Timing and check budgets
+
+    Also feeds the request metrics (latency, size, queries; see api.metrics).
+
+    Adds `Server-Timing: db;dur=<ms>;desc="<n> queries", db-slowest;dur=<ms>,
+    app;dur=<ms>` (browser dev tools show it in the request's Timing tab; with DEBUG
+    the slowest statement is included). A view's @query_budget overrun is logged
+    (with API_QUERY_BUDGET_ENFORCE on, the execute wrapper already failed the view
+    at the offending statement; the finished response is never replaced).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with track_queries() as stats:
+            stats.request = request
+            request._query_stats = stats
+            response = self.get_response(request)
+        return self._finish(request, response, stats, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        with track_queries() as stats:
+            stats.request = request
+            request._query_stats = stats
+            response = await self.get_response(request)
+        return self._finish(request, response, stats, time.perf_counter() - started)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = getattr(view_func, 'query_budget', None)
+        stats = getattr(request, '_query_stats', None)
+        if stats is not None:
+            stats.budget = request.query_budget
+
+    @staticmethod
+    def _finish(request, response, stats, elapsed):
+        if getattr(settings, 'API_SERVER_TIMING', True):
+            slowest = f'db-slowest;dur={stats.slowest_duration * 1000:.1f}'
+            if settings.DEBUG and stats.slowest_sql:
+                sql = ' '.join(stats.slowest_sql.split())[:120].replace('\\', '').replace('"', "'")
+                slowest += f';desc="{sql}"'
+            response['Server-Timing'] = ', '.join((
+                f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                slowest,
+                f'app;dur={elapsed * 1000:.1f}',
+            ))
+
+        budget = getattr(request, 'query_budget', None)
+        over_budget = budget is not None and stats.budgeted_count > budget
+        metrics.observe_request(request, response, stats, elapsed, over_budget)
+
+        if over_budget:
+            logger.warning(
+                f'{request.method} {request.path} ran {stats.budgeted_count} queries (budget {budget}, '
+                f'plus {stats.excluded} session / auth); slowest ({stats.slowest_duration * 1000:.1f} ms): '
+                f'{stats.slowest_sql}'
+            )
+        return response
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def install_search_index(apps, schema_editor):
+    from api.services.search_backend import BACKENDS
+    backend = BACKENDS.get(schema_editor.connection.vendor)
+    if backend:
+        backend().install(schema_editor.connection)
+
+
+def uninstall_search_index(apps, schema_editor):
+    from api.services.search_backend import BACKENDS
+    backend = BACKENDS.get(schema_editor.connection.vendor)
+    if backend:
+        backend().uninstall(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
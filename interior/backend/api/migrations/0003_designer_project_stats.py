@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:22
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_project_stats(apps, schema_editor):
+    Designer = apps.get_model('api', 'Designer')
+    Project = apps.get_model('api', 'Project')
+    projects = Project.objects.filter(designer=models.OuterRef('pk'))
+    project_count = projects.order_by().values('designer').annotate(total=models.Count('id')).values('total')
+    first_image = projects.order_by('id').values('image')[:1]
+    Designer.objects.update(
+        project_count=Coalesce(models.Subquery(project_count), 0),
+        featured_image=models.Subquery(first_image),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_designer_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='designer',
+            name='featured_image',
+            field=models.URLField(blank=True, help_text='Thumbnail of the first project', max_length=500, null=True),
+        ),
+        migrations.AddField(
+            model_name='designer',
+            name='project_count',
+            field=models.IntegerField(default=0, help_text='Number of projects'),
+        ),
+        migrations.RunPython(backfill_project_stats, migrations.RunPython.noop),
+    ]
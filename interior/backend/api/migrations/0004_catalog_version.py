@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:23
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def create_catalog_version(apps, schema_editor):
+    CatalogVersion = apps.get_model('api', 'CatalogVersion')
+    CatalogVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_designer_project_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=1)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Catalog version',
+                'verbose_name_plural': 'Catalog version',
+                'db_table': 'catalog_version',
+            },
+        ),
+        migrations.RunPython(create_catalog_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_catalog_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApiDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('designer', 'Designer detail'), ('project', 'Project detail')], max_length=20)),
+                ('object_id', models.BigIntegerField(help_text='ID of the designer or project')),
+                ('body', models.BinaryField(help_text='Complete JSON response body')),
+                ('built_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'API document',
+                'verbose_name_plural': 'API documents',
+                'db_table': 'api_documents',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:08
+
+from django.db import migrations, models
+
+
+def backfill_sort_keys(apps, schema_editor):
+    from api.models.designer import UNKNOWN_PRICE, job_cost_floor
+    Designer = apps.get_model('api', 'Designer')
+    designers = Designer.objects.using(schema_editor.connection.alias).only('business_name', 'typical_job_cost')
+    batch = []
+    for designer in designers.order_by('id').iterator(chunk_size=2000):
+        designer.sort_name = (designer.business_name or '').strip().lower()[:255]
+        price = job_cost_floor(designer.typical_job_cost)
+        designer.sort_price = UNKNOWN_PRICE if price is None else min(price, UNKNOWN_PRICE)
+        batch.append(designer)
+        if len(batch) == 2000:
+            designers.bulk_update(batch, ['sort_name', 'sort_price'])
+            batch = []
+    if batch:
+        designers.bulk_update(batch, ['sort_name', 'sort_price'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_api_documents'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='designer',
+            name='sort_name',
+            field=models.CharField(default='', editable=False, help_text='Lowercased business name', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='designer',
+            name='sort_price',
+            field=models.BigIntegerField(default=4611686018427387904, editable=False, help_text='Lower bound of the typical job cost (UNKNOWN_PRICE when there is none)'),
+        ),
+        migrations.RunPython(backfill_sort_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='designer',
+            index=models.Index(fields=['sort_name', 'id'], name='designers_sort_na_2b349e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='designer',
+            index=models.Index(fields=['created_at', 'id'], name='designers_created_177175_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='designer',
+            index=models.Index(fields=['project_count', 'id'], name='designers_project_7e2c85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='designer',
+            index=models.Index(fields=['sort_price', 'id'], name='designers_sort_pr_620f31_idx'),
+        ),
+    ]
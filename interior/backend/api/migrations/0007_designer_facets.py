@@ -0,0 +1,70 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:12
+
+from django.db import migrations, models
+
+
+def backfill_facets(apps, schema_editor):
+    from api.models.designer import address_city, job_cost_floor, price_bucket
+    Designer = apps.get_model('api', 'Designer')
+    DesignerFacet = apps.get_model('api', 'DesignerFacet')
+    designers = Designer.objects.using(schema_editor.connection.alias)
+
+    batch = []
+    for designer in designers.only('address', 'typical_job_cost').order_by('id').iterator(chunk_size=2000):
+        designer.city = address_city(designer.address)
+        designer.price_bucket = price_bucket(job_cost_floor(designer.typical_job_cost))
+        batch.append(designer)
+        if len(batch) == 2000:
+            designers.bulk_update(batch, ['city', 'price_bucket'])
+            batch = []
+    if batch:
+        designers.bulk_update(batch, ['city', 'price_bucket'])
+
+    # Same counts as DesignerFacet.rebuild()
+    counts = {}
+    for facet, field in (('category', 'category'), ('city', 'city'), ('price', 'price_bucket')):
+        for row in designers.order_by().values(field).annotate(total=models.Count('id')):
+            value = (row[field] or '').strip()[:255]
+            if value:
+                counts[(facet, value)] = counts.get((facet, value), 0) + row['total']
+    DesignerFacet.objects.using(schema_editor.connection.alias).bulk_create(
+        [DesignerFacet(facet=facet, value=value, count=total) for (facet, value), total in counts.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_designer_listing_orderings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='designer',
+            name='city',
+            field=models.CharField(default='', editable=False, help_text='City parsed from the address', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='designer',
+            name='price_bucket',
+            field=models.CharField(default='', editable=False, help_text="PRICE_BUCKETS key of the typical job cost ('' when there is none)", max_length=20),
+        ),
+        migrations.CreateModel(
+            name='DesignerFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(choices=[('category', 'Category'), ('city', 'City'), ('price', 'Price bucket')], max_length=20)),
+                ('value', models.CharField(max_length=255)),
+                ('count', models.IntegerField(default=0, help_text='Number of designers with this value')),
+            ],
+            options={
+                'verbose_name': 'Designer facet',
+                'verbose_name_plural': 'Designer facets',
+                'db_table': 'designer_facets',
+                'indexes': [models.Index(fields=['facet', '-count'], name='designer_fa_facet_0a8078_idx')],
+                'unique_together': {('facet', 'value')},
+            },
+        ),
+        migrations.RunPython(backfill_facets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_designer_facets'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apidocument',
+            name='generation',
+            field=models.BigIntegerField(default=0, help_text='Bumped by every invalidation'),
+        ),
+        migrations.AlterField(
+            model_name='apidocument',
+            name='body',
+            field=models.BinaryField(help_text='Complete JSON response body (NULL: invalidated)', null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_api_document_generation'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='image',
+            name='images_project_4245e3_idx',
+        ),
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(fields=['project', '-created_at', '-id'], name='images_project_cba6eb_idx'),
+        ),
+    ]
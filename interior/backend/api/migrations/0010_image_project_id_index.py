@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_image_project_created_id_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='image',
+            name='images_project_cba6eb_idx',
+        ),
+        migrations.AddIndex(
+            model_name='image',
+            index=models.Index(fields=['project', 'id'], name='images_project_43265f_idx'),
+        ),
+    ]
@@ -1,6 +1,9 @@
 from .designer import Designer
 from .project import Project
 from .image import Image
+from .catalog import CatalogVersion
+from .document import ApiDocument
+from .facet import DesignerFacet
 
-__all__ = ['Designer', 'Project', 'Image']
+__all__ = ['Designer', 'Project', 'Image', 'CatalogVersion', 'ApiDocument', 'DesignerFacet']
 
@@ -0,0 +1,59 @@
+from django.db import models, router
+from django.db.models import F
+from django.utils import timezone
+from ..transaction_hooks import run_once_on_commit
+
+
+class CatalogVersion(models.Model):
+    """
+    Single-row counter bumped whenever Designer, Project or Image rows change
+
+    Response caches key on the version, so a bump invalidates every cached entry
+    immediately in every process (scraper, admin, shell and all gunicorn workers).
+    """
+    
+    version = models.BigIntegerField(default=1)
+    updated_at = models.DateTimeField(default=timezone.now)
+    
+    SINGLETON_ID = 1
+    
+    class Meta:
+        db_table = 'catalog_version'
+        verbose_name = 'Catalog version'
+        verbose_name_plural = 'Catalog version'
+    
+    def __str__(self):
+        return f"Catalog v{self.version}"
+    
+    @classmethod
+    def current(cls):
+        """
+        Get the current catalog version (one primary-key lookup)
+        
+        Returns:
+            tuple: (version, updated_at)
+        """
+        row = cls.objects.filter(pk=cls.SINGLETON_ID).values_list('version', 'updated_at').first()
+        if row is None:
+            obj, _ = cls.objects.get_or_create(pk=cls.SINGLETON_ID)
+            row = (obj.version, obj.updated_at)
+        return row
+    
+    @classmethod
+    def bump(cls):
+        """
+        Increment the catalog version
+        
+        Inside a transaction the bump is deferred to commit and issued once, however
+        many rows the transaction touched (e.g. a cascade delete of hundreds of images).
+        """
+        using = router.db_for_write(cls)
+        run_once_on_commit(('catalog_version', cls), lambda: cls._bump(using), using=using)
+    
+    @classmethod
+    def _bump(cls, using):
+        updated = cls.objects.using(using).filter(pk=cls.SINGLETON_ID).update(
+            version=F('version') + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            cls.objects.using(using).get_or_create(pk=cls.SINGLETON_ID)
@@ -1,4 +1,80 @@
+import re
 from django.db import models
+from django.db.models.functions import Coalesce
+
+# First amount of a typical_job_cost range like '₹50,000 - ₹2,00,000' or '₹10,00,000+'
+_AMOUNT = re.compile(r'\d[\d,]*')
+
+# Designer.sort_price of designers without a typical job cost (after every real price)
+UNKNOWN_PRICE = 2 ** 62
+
+# Designer.price_bucket: (exclusive upper bound of the job cost floor, key, label)
+PRICE_BUCKETS = [
+    (2_00_000, 'under_2l', 'Under ₹2 lakh'),
+    (5_00_000, '2l_5l', '₹2 - 5 lakh'),
+    (10_00_000, '5l_10l', '₹5 - 10 lakh'),
+    (None, '10l_plus', '₹10 lakh+'),
+]
+
+# Trailing address parts that are not the city ('..., Mumbai, Maharashtra 400053, India').
+# Goa, Delhi, Chandigarh and Puducherry are left out: they are used as city names too.
+_REGIONS = frozenset([
+    'india', 'andhra pradesh', 'arunachal pradesh', 'assam', 'bihar', 'chhattisgarh',
+    'gujarat', 'haryana', 'himachal pradesh', 'jharkhand', 'karnataka', 'kerala',
+    'madhya pradesh', 'maharashtra', 'manipur', 'meghalaya', 'mizoram', 'nagaland',
+    'odisha', 'punjab', 'rajasthan', 'sikkim', 'tamil nadu', 'telangana', 'tripura',
+    'uttar pradesh', 'uttarakhand', 'west bengal', 'jammu and kashmir', 'ladakh',
+])
+
+
+def job_cost_floor(typical_job_cost):
+    """
+    Lower bound of a typical_job_cost text, in whole currency units
+    
+    Args:
+        typical_job_cost (str): Scraped cost range, or None
+    
+    Returns:
+        int or None: First amount of the range, or None if it has none
+    """
+    match = _AMOUNT.search(typical_job_cost or '')
+    if match is None:
+        return None
+    return int(match.group().replace(',', ''))
+
+
+def price_bucket(price):
+    """
+    PRICE_BUCKETS key of a job cost floor
+    
+    Args:
+        price (int): job_cost_floor result, or None
+    
+    Returns:
+        str: Bucket key, or '' if the price is unknown
+    """
+    if price is None:
+        return ''
+    for upper, key, _ in PRICE_BUCKETS:
+        if upper is None or price < upper:
+            return key
+
+
+def address_city(address):
+    """
+    City of a scraped address: its last part that is not a PIN code, state or country
+    
+    Args:
+        address (str): Address like '12, MG Road, Bengaluru, Karnataka 560001'
+    
+    Returns:
+        str: City, or '' if the address has none
+    """
+    for part in reversed((address or '').split(',')):
+        part = ' '.join(re.sub(r'\d', ' ', part).split())
+        if part and part.lower() not in _REGIONS:
+            return part[:100]
+    return ''
 
 
 class Designer(models.Model):
@@ -23,6 +99,25 @@ class Designer(models.Model):
     followers = models.CharField(max_length=100, blank=True, null=True)
     socials = models.TextField(blank=True, null=True)
     
+    # Denormalized from projects (kept in sync by api.signals, see refresh_project_stats)
+    project_count = models.IntegerField(default=0, help_text="Number of projects")
+    featured_image = models.URLField(max_length=500, blank=True, null=True, help_text="Thumbnail of the first project")
+    
+    # Listing sort keys (derived from business_name / typical_job_cost on save, see
+    # update_derived_fields). NOT NULL so every listing ordering is a plain index scan.
+    sort_name = models.CharField(max_length=255, default='', editable=False, help_text="Lowercased business name")
+    sort_price = models.BigIntegerField(
+        default=UNKNOWN_PRICE, editable=False,
+        help_text="Lower bound of the typical job cost (UNKNOWN_PRICE when there is none)"
+    )
+    
+    # Facet values (derived from address / typical_job_cost on save, counted in DesignerFacet)
+    city = models.CharField(max_length=100, default='', editable=False, help_text="City parsed from the address")
+    price_bucket = models.CharField(
+        max_length=20, default='', editable=False,
+        help_text="PRICE_BUCKETS key of the typical job cost ('' when there is none)"
+    )
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -32,7 +127,72 @@ class Designer(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Designer'
         verbose_name_plural = 'Designers'
+        # One (sort key, id) index per listing ordering (DesignerService.ORDERINGS);
+        # descending orderings scan the same index backwards
+        indexes = [
+            models.Index(fields=['sort_name', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['project_count', 'id']),
+            models.Index(fields=['sort_price', 'id']),
+        ]
     
     def __str__(self):
         return self.business_name or f"Designer #{self.id}"
+    
+    def save(self, *args, **kwargs):
+        self.update_derived_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'business_name' in update_fields:
+                update_fields.add('sort_name')
+            if 'typical_job_cost' in update_fields:
+                update_fields.update(['sort_price', 'price_bucket'])
+            if 'address' in update_fields:
+                update_fields.add('city')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+    
+    def update_derived_fields(self):
+        """
+        Derive the sort keys and facet values from business_name, typical_job_cost and address
+        
+        Called by save(); call it directly before bulk_create(), which skips save().
+        """
+        self.sort_name = (self.business_name or '').strip().lower()[:255]
+        price = job_cost_floor(self.typical_job_cost)
+        self.sort_price = UNKNOWN_PRICE if price is None else min(price, UNKNOWN_PRICE)
+        self.price_bucket = price_bucket(price)
+        self.city = address_city(self.address)
+    
+    @classmethod
+    def refresh_project_stats(cls, designer_ids=None):
+        """
+        Recompute project_count and featured_image from the projects table
+        
+        Runs as a single UPDATE with correlated subqueries, so it costs one query
+        whether it refreshes one designer or a whole batch.
+        
+        Args:
+            designer_ids (iterable): IDs to refresh (default: all designers)
+        
+        Returns:
+            int: Number of designers updated
+        """
+        from .project import Project
+        
+        projects = Project.objects.filter(designer=models.OuterRef('pk'))
+        project_count = projects.order_by().values('designer').annotate(
+            total=models.Count('id')
+        ).values('total')
+        first_image = projects.order_by('id').values('image')[:1]
+        
+        queryset = cls.objects.all()
+        if designer_ids is not None:
+            queryset = queryset.filter(pk__in=list(designer_ids))
+        
+        return queryset.update(
+            project_count=Coalesce(models.Subquery(project_count), 0),
+            featured_image=models.Subquery(first_image),
+        )
 
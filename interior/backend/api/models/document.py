@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class ApiDocument(models.Model):
+    """
+    Pre-rendered JSON response body for a designer or project detail page
+    
+    Invalidation clears the body and bumps `generation` (leaving a tombstone row
+    when there was no document yet); a build only stores its body if the
+    generation it read before rendering is still current, so a body rendered from
+    rows that changed meanwhile is never written back.
+    """
+    
+    KIND_DESIGNER = 'designer'
+    KIND_PROJECT = 'project'
+    KIND_CHOICES = [
+        (KIND_DESIGNER, 'Designer detail'),
+        (KIND_PROJECT, 'Project detail'),
+    ]
+    
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField(help_text="ID of the designer or project")
+    body = models.BinaryField(null=True, help_text="Complete JSON response body (NULL: invalidated)")
+    generation = models.BigIntegerField(default=0, help_text="Bumped by every invalidation")
+    
+    # Timestamps
+    built_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'api_documents'
+        verbose_name = 'API document'
+        verbose_name_plural = 'API documents'
+        unique_together = [['kind', 'object_id']]
+    
+    def __str__(self):
+        return f"{self.kind} #{self.object_id}"
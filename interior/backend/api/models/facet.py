@@ -0,0 +1,133 @@
+from django.db import IntegrityError, models, router, transaction
+from django.db.models import Count, F
+
+
+class DesignerFacet(models.Model):
+    """
+    Number of designers per category, city and price bucket
+    
+    Maintained incrementally by api.signals as designers are saved and deleted, so
+    the facet counts are one small indexed read instead of a GROUP BY over every
+    designer. Writes that skip signals (bulk_create, QuerySet.update) are followed
+    by rebuild() (seed_catalog, `manage.py rebuild_designer_facets`).
+    """
+    
+    FACET_CATEGORY = 'category'
+    FACET_CITY = 'city'
+    FACET_PRICE = 'price'
+    FACET_CHOICES = [
+        (FACET_CATEGORY, 'Category'),
+        (FACET_CITY, 'City'),
+        (FACET_PRICE, 'Price bucket'),
+    ]
+    
+    # Designer column counted for each facet
+    DESIGNER_FIELDS = {
+        FACET_CATEGORY: 'category',
+        FACET_CITY: 'city',
+        FACET_PRICE: 'price_bucket',
+    }
+    
+    facet = models.CharField(max_length=20, choices=FACET_CHOICES)
+    value = models.CharField(max_length=255)
+    count = models.IntegerField(default=0, help_text="Number of designers with this value")
+    
+    class Meta:
+        db_table = 'designer_facets'
+        verbose_name = 'Designer facet'
+        verbose_name_plural = 'Designer facets'
+        unique_together = [['facet', 'value']]
+        indexes = [
+            models.Index(fields=['facet', '-count']),
+        ]
+    
+    def __str__(self):
+        return f"{self.facet}={self.value} ({self.count})"
+    
+    @classmethod
+    def values_of(cls, row):
+        """
+        Facet values a designer is counted under
+        
+        Args:
+            row: Designer instance, or dict with the DESIGNER_FIELDS columns
+        
+        Returns:
+            set: (facet, value) pairs (empty values are not counted)
+        """
+        get = row.get if isinstance(row, dict) else lambda field: getattr(row, field)
+        values = set()
+        for facet, field in cls.DESIGNER_FIELDS.items():
+            value = (get(field) or '').strip()[:255]
+            if value:
+                values.add((facet, value))
+        return values
+    
+    @classmethod
+    def values_by_designer(cls, designers):
+        """
+        Facet values of several designers (one query)
+        
+        Args:
+            designers (QuerySet): Designers
+        
+        Returns:
+            dict: Designer ID -> set of (facet, value) pairs
+        """
+        rows = designers.order_by().values('id', *cls.DESIGNER_FIELDS.values())
+        return {row['id']: cls.values_of(row) for row in rows}
+    
+    @classmethod
+    def apply(cls, added=(), removed=(), using=None):
+        """
+        Adjust the counts for a designer write
+        
+        Args:
+            added (iterable): (facet, value) pairs that gained a designer
+            removed (iterable): (facet, value) pairs that lost a designer
+            using (str): Database alias (default: the router's write database)
+        """
+        using = using or router.db_for_write(cls)
+        with transaction.atomic(using=using):
+            for facet, value in removed:
+                cls.objects.using(using).filter(facet=facet, value=value).update(count=F('count') - 1)
+            for facet, value in added:
+                rows = cls.objects.using(using).filter(facet=facet, value=value)
+                if rows.update(count=F('count') + 1):
+                    continue
+                try:
+                    with transaction.atomic(using=using):
+                        cls.objects.using(using).create(facet=facet, value=value, count=1)
+                except IntegrityError:
+                    # Created concurrently by another writer
+                    rows.update(count=F('count') + 1)
+    
+    @classmethod
+    def rebuild(cls, using=None):
+        """
+        Recount every facet from the designers table (one GROUP BY per facet)
+        
+        Args:
+            using (str): Database alias (default: the router's write database)
+        
+        Returns:
+            int: Number of facet rows written
+        """
+        from .designer import Designer
+        
+        using = using or router.db_for_write(cls)
+        counts = {}
+        for facet, field in cls.DESIGNER_FIELDS.items():
+            grouped = Designer.objects.using(using).order_by().values(field).annotate(total=Count('id'))
+            for row in grouped:
+                value = (row[field] or '').strip()[:255]
+                if value:
+                    counts[(facet, value)] = counts.get((facet, value), 0) + row['total']
+        
+        with transaction.atomic(using=using):
+            cls.objects.using(using).all().delete()
+            cls.objects.using(using).bulk_create(
+                [cls(facet=facet, value=value, count=total) for (facet, value), total in counts.items()],
+                batch_size=1000,
+            )
+        return len(counts)
@@ -26,7 +26,8 @@ class Image(models.Model):
         verbose_name_plural = 'Images'
         indexes = [
             models.Index(fields=['image_id']),
-            models.Index(fields=['project', '-created_at']),
+            # Matches the images page order (id within a project), so keyset pages read the index only
+            models.Index(fields=['project', 'id']),
         ]
         unique_together = [['project', 'image_id']]
     
@@ -0,0 +1,70 @@
+"""
+JSON renderers for the API
+
+FastJSONRenderer encodes with orjson (C-accelerated) when it is installed and
+falls back to DRF's stdlib-based JSONRenderer otherwise, or whenever orjson cannot
+encode a value (pretty-printing requested, integers beyond 64 bits, ...).
+"""
+from rest_framework.utils import encoders
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# DRF escapes these so the output is a strict JavaScript subset
+_LINE_SEPARATOR = '\u2028'.encode('utf-8')
+_PARAGRAPH_SEPARATOR = '\u2029'.encode('utf-8')
+
+
+def _escape_separators(data):
+    if _LINE_SEPARATOR in data or _PARAGRAPH_SEPARATOR in data:
+        data = data.replace(_LINE_SEPARATOR, b'\\u2028').replace(_PARAGRAPH_SEPARATOR, b'\\u2029')
+    return data
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer producing the same bytes, encoded with orjson"""
+
+    # Types orjson would format differently from DRF's encoder go through it instead
+    _encoder = encoders.JSONEncoder()
+
+    @classmethod
+    def dumps(cls, data):
+        """
+        Encode data to compact JSON bytes (same output as DRF's compact JSONRenderer)
+
+        Args:
+            data: Data to encode
+
+        Returns:
+            bytes: JSON
+
+        Raises:
+            TypeError / ValueError: If the value cannot be encoded by orjson
+        """
+        return _escape_separators(orjson.dumps(
+            data,
+            default=cls._encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        ))
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if (
+            orjson is None or
+            not self.compact or
+            self.ensure_ascii or
+            self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            return self.dumps(data)
+        except (TypeError, ValueError):
+            # orjson.JSONEncodeError subclasses TypeError; let DRF handle the odd value
+            return super().render(data, accepted_media_type, renderer_context)
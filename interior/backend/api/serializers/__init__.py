@@ -1,12 +1,18 @@
 # Serializers package - export all serializers
-from .designer_listing_serializer import DesignerListingSerializer
+from .compiled import CompiledSerializer
+from .designer_listing_serializer import (
+    DesignerListingSerializer,
+    compiled_designer_listing_serializer,
+)
 from .designer_detail_serializer import (
     DesignerDetailSerializer,
     ProjectBasicSerializer,
+    compiled_designer_detail_serializer,
 )
 from .project_detail_serializer import (
     ProjectDetailSerializer,
     ImageSerializer,
+    compiled_project_detail_serializer,
 )
 
 __all__ = [
@@ -15,5 +21,9 @@ __all__ = [
     'ProjectBasicSerializer',
     'ProjectDetailSerializer',
     'ImageSerializer',
+    'CompiledSerializer',
+    'compiled_designer_listing_serializer',
+    'compiled_designer_detail_serializer',
+    'compiled_project_detail_serializer',
 ]
 
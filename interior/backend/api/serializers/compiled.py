@@ -0,0 +1,323 @@
+"""
+Compiled (fast-path) serialization for the hot read endpoints
+
+DRF's field machinery (get_attribute, SkipField handling, per-field method
+dispatch) dominates CPU on large pages. `CompiledSerializer` inspects a DRF
+serializer class once and turns every field into a plain accessor function, so
+serializing an object is a single dict comprehension. The output is identical to
+`SerializerClass(obj).data` (same keys, same order, same values), so the DRF
+serializers remain the single source of truth for the response shape.
+"""
+import datetime
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import fields as drf_fields
+from rest_framework import serializers
+from rest_framework.settings import ISO_8601, api_settings
+from .planner import plan_serializer
+
+
+# Entries kept per compiled serializer for client-chosen field sets
+CACHE_MAXSIZE = 128
+
+
+class _LRUCache:
+    """Bounded map from key to value, evicting the least recently used entry"""
+
+    def __init__(self, maxsize=CACHE_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_create(self, key, create):
+        """
+        Cached value for `key`, calling create() on a miss
+
+        Args:
+            key: Hashable key
+            create (callable): Builds the value (called outside the lock)
+
+        Returns:
+            Cached or newly created value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = create()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+
+def constant(method):
+    """
+    Mark a SerializerMethodField method whose value never depends on the object
+
+    The compiled path calls it once at compile time instead of once per object.
+    """
+    method.is_constant = True
+    method.reads = ()
+    return method
+
+
+def reads(*paths):
+    """
+    Declare what a SerializerMethodField method reads from the object
+
+    Paths are model columns ('about_us') or relations followed with '__'
+    ('projects__image'). The query planner loads exactly these (only(),
+    select_related(), prefetch_related()); undeclared method fields load every
+    column, and `manage.py check` warns about them (api.W001).
+    """
+    def decorator(method):
+        method.reads = paths
+        return method
+    return decorator
+
+
+def _compile_datetime(field):
+    """
+    ISO-8601 fast path for UTC datetimes (DRF resolves the current timezone per value)
+
+    Only used when the project renders datetimes the DRF default way in UTC; any
+    other value (naive, non-UTC) still goes through DRF's own to_representation.
+    """
+    uses_defaults = (
+        not hasattr(field, 'format') and
+        not hasattr(field, 'timezone') and
+        api_settings.DATETIME_FORMAT == ISO_8601 and
+        settings.USE_TZ and
+        settings.TIME_ZONE == 'UTC'
+    )
+    if not uses_defaults:
+        return field.to_representation
+
+    utc = datetime.timezone.utc
+    slow = field.to_representation
+
+    def to_representation(value):
+        if type(value) is datetime.datetime and value.tzinfo is utc:
+            value = value.isoformat()
+            return value[:-6] + 'Z' if value.endswith('+00:00') else value
+        return slow(value)
+    return to_representation
+
+
+def _compile_value(field):
+    """Return a function converting a non-None attribute to its representation"""
+    # Exact type checks: subclasses may override to_representation
+    if type(field) in (drf_fields.CharField, drf_fields.URLField, drf_fields.EmailField):
+        return lambda value: value if type(value) is str else str(value)
+    if type(field) is drf_fields.IntegerField:
+        return lambda value: value if type(value) is int else int(value)
+    if type(field) is drf_fields.DateTimeField:
+        return _compile_datetime(field)
+    return field.to_representation
+
+
+def _is_concrete_attribute(model, source_attrs):
+    """True if the source is a single concrete, non-relational model column"""
+    if model is None or len(source_attrs) != 1:
+        return False
+    try:
+        model_field = model._meta.get_field(source_attrs[0])
+    except FieldDoesNotExist:
+        return False
+    return model_field.concrete and not model_field.is_relation
+
+
+def _compile_field(serializer, field):
+    """Compile one bound DRF field into `accessor(obj) -> value`"""
+    if isinstance(field, serializers.SerializerMethodField):
+        method = getattr(serializer, field.method_name)
+        if getattr(method, 'is_constant', False):
+            value = method(None)
+            if isinstance(value, list):
+                return lambda obj: list(value)
+            if isinstance(value, dict):
+                return lambda obj: dict(value)
+            return lambda obj: value
+        return method
+
+    if isinstance(field, serializers.ListSerializer):
+        child = CompiledSerializer(type(field.child)).serialize
+        get = field.get_attribute
+
+        def accessor(obj):
+            data = get(obj)
+            if data is None:
+                return None
+            iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+            return [child(item) for item in iterable]
+        return accessor
+
+    if isinstance(field, serializers.BaseSerializer):
+        child = CompiledSerializer(type(field)).serialize
+        get = field.get_attribute
+        return lambda obj: None if (value := get(obj)) is None else child(value)
+
+    to_representation = _compile_value(field)
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+
+    if _is_concrete_attribute(model, field.source_attrs):
+        attr = field.source_attrs[0]
+        return lambda obj: None if (value := getattr(obj, attr)) is None else to_representation(value)
+
+    get = field.get_attribute
+    return lambda obj: None if (value := get(obj)) is None else to_representation(value)
+
+
+class CompiledSerializer:
+    """
+    Serializer compiled from a DRF serializer class into per-field accessors
+
+    Usage:
+        LISTING = CompiledSerializer(DesignerListingSerializer)
+        LISTING.serialize(designer)          # == DesignerListingSerializer(designer).data
+        LISTING.serialize_many(designers)    # == DesignerListingSerializer(designers, many=True).data
+        LISTING.data(designers, many=True)   # compiled unless API_FAST_SERIALIZERS is off
+        LISTING.restrict(['id', 'business_name']).serialize(designer)   # sparse fieldset
+        LISTING.plan().apply(Designer.objects.all())   # queryset loading just what it reads
+
+    Fields that raise SkipField in DRF (missing attribute on a non-required field)
+    are not supported; none of the API serializers declare such fields.
+    """
+
+    def __init__(self, serializer_class, names=None):
+        self.serializer_class = serializer_class
+        # Field subset (sparse fieldset), None = every field
+        self.names = names
+        self._accessors = None
+        # Keyed on client-supplied field sets, so bounded
+        self._plans = _LRUCache()
+        self._restricted = _LRUCache()
+
+    def _compile(self):
+        serializer = self.serializer_class()
+        fields = [
+            field for field in serializer._readable_fields
+            if self.names is None or field.field_name in self.names
+        ]
+        self._accessors = tuple((field.field_name, _compile_field(serializer, field)) for field in fields)
+
+    @property
+    def accessors(self):
+        """(field name, accessor) pairs, compiled on first use (model fields need the app registry)"""
+        if self._accessors is None:
+            self._compile()
+        return self._accessors
+
+    @property
+    def field_names(self):
+        """Names of the fields this serializer outputs, in order"""
+        return tuple(name for name, _ in self.accessors)
+
+    def includes(self, name):
+        """True if the output contains field `name`"""
+        return name in self.field_names
+
+    def restrict(self, names):
+        """
+        Compiled serializer producing only some fields (same order as the full one)
+
+        Args:
+            names (iterable): Field names to keep, or None for every field
+
+        Returns:
+            CompiledSerializer: Restricted serializer (LRU-cached per field set)
+        """
+        if names is None:
+            return self
+        key = frozenset(names)
+        return self._restricted.get_or_create(key, lambda: CompiledSerializer(self.serializer_class, names=key))
+
+    def plan(self, provided=()):
+        """
+        Query plan for the selected fields (see planner.plan_serializer)
+
+        Args:
+            provided (iterable): Fields whose values the caller supplies itself
+                                 (serialize_with overrides), so they need no query
+
+        Returns:
+            QueryPlan: Plan to apply to a queryset of the serializer's model (LRU-cached)
+        """
+        key = frozenset(provided)
+        return self._plans.get_or_create(
+            key, lambda: plan_serializer(self.serializer_class, names=self.names, provided=key)
+        )
+
+    def serialize(self, obj):
+        """
+        Serialize one object
+
+        Args:
+            obj: Model instance
+
+        Returns:
+            dict: Representation identical to the DRF serializer's
+        """
+        return {name: accessor(obj) for name, accessor in self.accessors}
+
+    def serialize_with(self, obj, **overrides):
+        """
+        Serialize one object, taking some field values from `overrides`
+
+        Used to plug separately fetched values (e.g. the first page of a nested
+        list) into the representation without changing the field order.
+
+        Args:
+            obj: Model instance
+            **overrides: field name -> value
+
+        Returns:
+            dict: Representation
+        """
+        return {
+            name: overrides[name] if name in overrides else accessor(obj)
+            for name, accessor in self.accessors
+        }
+
+    def serialize_many(self, objs):
+        """
+        Serialize an iterable of objects
+
+        Args:
+            objs (iterable): Model instances
+
+        Returns:
+            list: List of representations
+        """
+        accessors = self.accessors
+        return [{name: accessor(obj) for name, accessor in accessors} for obj in objs]
+
+    def data(self, instance, many=False):
+        """
+        Serialize with the compiled path, or the DRF serializer when API_FAST_SERIALIZERS is off
+
+        Args:
+            instance: Model instance, or iterable of instances when many=True
+            many (bool): Serialize a list
+
+        Returns:
+            dict or list: Serialized data
+        """
+        if not getattr(settings, 'API_FAST_SERIALIZERS', True):
+            serializer = self.serializer_class(instance, many=many)
+            if self.names is not None:
+                # Drop unselected fields before serializing: their columns are deferred
+                fields = (serializer.child if many else serializer).fields
+                for name in [name for name in fields if name not in self.names]:
+                    del fields[name]
+            return serializer.data
+        return self.serialize_many(instance) if many else self.serialize(instance)
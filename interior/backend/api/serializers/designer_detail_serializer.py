@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models import Designer, Project
+from .compiled import CompiledSerializer, constant, reads
 
 
 class ProjectBasicSerializer(serializers.ModelSerializer):
@@ -46,6 +47,9 @@ class DesignerDetailSerializer(serializers.ModelSerializer):
     verified = serializers.SerializerMethodField()
     specialties = serializers.SerializerMethodField()
     
+    # Maximum number of images in `portfolio`
+    PORTFOLIO_LIMIT = 10
+    
     class Meta:
         model = Designer
         fields = [
@@ -75,35 +79,45 @@ class DesignerDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
+    @reads('projects__image')
     def get_portfolio(self, obj):
-        """Get portfolio images from projects (thumbnail images from each project)"""
-        # Use prefetched projects if available
-        if hasattr(obj, 'prefetched_projects') and obj.prefetched_projects:
-            return [p.image for p in obj.prefetched_projects if p.image]
+        """Get portfolio images from projects (thumbnail images of the first projects, capped)"""
+        # Use prefetched projects if available (planned querysets prefetch them)
+        if 'projects' in getattr(obj, '_prefetched_objects_cache', {}):
+            projects = sorted(obj.projects.all(), key=lambda p: p.id)
+            return [p.image for p in projects if p.image][:self.PORTFOLIO_LIMIT]
         # Fallback: query projects
         portfolio_images = list(
             obj.projects.exclude(image__isnull=True)
                         .exclude(image='')
                         .order_by('id')
-                        .values_list('image', flat=True)[:10]
+                        .values_list('image', flat=True)[:self.PORTFOLIO_LIMIT]
         )
         return portfolio_images
     
+    @constant
     def get_rating(self, obj):
         """Default rating (not in DB, return 4.5 as default)"""
         return 4.5
     
+    @constant
     def get_reviewsCount(self, obj):
         """Default reviews count (not in DB, return 0 as default)"""
         return 0
     
+    @constant
     def get_verified(self, obj):
         """Default verified status (not in DB, return True as default)"""
         return True
     
+    @constant
     def get_specialties(self, obj):
         """Get specialties from category or return empty array"""
         # Could be enhanced based on your data structure
         # For now, return empty array as frontend expects an array
         return []
 
+
+# Fast path: same output as DesignerDetailSerializer(obj).data, without DRF field machinery
+compiled_project_basic_serializer = CompiledSerializer(ProjectBasicSerializer)
+compiled_designer_detail_serializer = CompiledSerializer(DesignerDetailSerializer)
@@ -1,13 +1,12 @@
 from rest_framework import serializers
 from ..models import Designer
+from .compiled import CompiledSerializer, reads
 
 
 class DesignerListingSerializer(serializers.ModelSerializer):
     """Serializer for Designer listing page - basic information only"""
     
     # Add computed fields
-    project_count = serializers.IntegerField(read_only=True)
-    featured_image = serializers.SerializerMethodField()
     intro = serializers.SerializerMethodField()
     
     class Meta:
@@ -25,21 +24,10 @@ class DesignerListingSerializer(serializers.ModelSerializer):
             'intro',
             'created_at',
         ]
-        read_only_fields = ['id', 'created_at']
-    
-    def get_featured_image(self, obj):
-        """Get the first project image as featured image (optimized via prefetch_related)"""
-        # Use prefetched projects if available (avoids extra query)
-        if hasattr(obj, 'prefetched_projects') and obj.prefetched_projects:
-            first_project = obj.prefetched_projects[0] if obj.prefetched_projects else None
-            if first_project:
-                return first_project.image
-        # Fallback: use projects manager (will query DB if not prefetched)
-        first_project = obj.projects.first()
-        if first_project:
-            return first_project.image
-        return None
+        # project_count / featured_image are denormalized columns maintained from projects
+        read_only_fields = ['id', 'project_count', 'featured_image', 'created_at']
     
+    @reads('about_us')
     def get_intro(self, obj):
         """Get truncated description (about_us field) - max 100 characters"""
         description = obj.about_us or ""
@@ -47,3 +35,6 @@ class DesignerListingSerializer(serializers.ModelSerializer):
             return description[:100] + "..."
         return description
 
+
+# Fast path: same output as DesignerListingSerializer(objs, many=True).data
+compiled_designer_listing_serializer = CompiledSerializer(DesignerListingSerializer)
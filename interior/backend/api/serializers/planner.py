@@ -0,0 +1,200 @@
+"""
+Query planning from serializer declarations
+
+`plan_serializer` walks a DRF serializer's readable fields and derives the
+minimal query that serializes it without extra queries:
+
+    - plain fields (`source=` included) load only their column (QuerySet.only())
+    - dotted sources through forward foreign keys become select_related() joins
+    - nested serializers on reverse / many-to-many relations become Prefetch
+      objects whose querysets are planned from the nested serializer in turn
+    - SerializerMethodFields contribute the paths declared with @reads(...)
+      ('about_us', 'projects__image'); undeclared ones load every column
+
+Services apply a plan to their base queryset instead of hand-writing only() and
+Prefetch lists, so adding a field to a serializer updates the query with it.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+class QueryPlan:
+    """Columns, joins and prefetches needed to serialize instances of one model"""
+
+    def __init__(self, model):
+        self.model = model
+        # None = unknown requirement, load every column
+        self.columns = {model._meta.pk.name}
+        self.select = {}
+        self.prefetch = {}
+
+    def load_all_columns(self):
+        self.columns = None
+
+    def add_column(self, name):
+        if self.columns is not None:
+            self.columns.add(name)
+
+    def relation(self, name):
+        """
+        Plan of the model reached through relation `name` (created on first use)
+
+        Args:
+            name (str): Forward FK / one-to-one, reverse relation or many-to-many name
+
+        Returns:
+            QueryPlan or None: Related plan, or None if `name` is not a relation
+        """
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation:
+            return None
+
+        if field.concrete and (field.many_to_one or field.one_to_one):
+            # Forward relation: join it, keeping the FK column on this model
+            self.add_column(field.name)
+            if field.name not in self.select:
+                self.select[field.name] = QueryPlan(field.related_model)
+            return self.select[field.name]
+
+        accessor = field.get_accessor_name() if field.auto_created else field.name
+        if accessor not in self.prefetch:
+            child = QueryPlan(field.related_model)
+            if field.one_to_many or field.one_to_one:
+                # Reverse FK: the prefetch matches rows back through the FK column
+                child.add_column(field.field.name)
+            self.prefetch[accessor] = child
+        return self.prefetch[accessor]
+
+    def add_path(self, attrs):
+        """
+        Require an attribute path, e.g. ['about_us'] or ['designer', 'business_name']
+
+        Args:
+            attrs (list): Attribute names from the model outwards
+        """
+        try:
+            field = self.model._meta.get_field(attrs[0])
+        except FieldDoesNotExist:
+            # Property or method on the model: its inputs are unknown
+            self.load_all_columns()
+            return
+
+        if len(attrs) == 1:
+            if not field.is_relation:
+                self.add_column(field.name)
+            else:
+                self.relation(field.name)
+            return
+
+        child = self.relation(field.name)
+        if child is None:
+            # Attribute of a column value (e.g. created_at.year)
+            self.add_column(field.name)
+        else:
+            child.add_path(attrs[1:])
+
+    def only_paths(self, prefix=''):
+        """only() arguments for this plan and its joined relations, or None to load everything"""
+        if self.columns is None:
+            return None
+        paths = [prefix + column for column in sorted(self.columns)]
+        for name, child in self.select.items():
+            child_paths = child.only_paths(f'{prefix}{name}__')
+            if child_paths is None:
+                return None
+            paths += child_paths
+        return paths
+
+    def select_paths(self, prefix=''):
+        paths = []
+        for name, child in self.select.items():
+            paths.append(prefix + name)
+            paths += child.select_paths(f'{prefix}{name}__')
+        return paths
+
+    def prefetches(self, prefix=''):
+        objects = []
+        for name, child in self.prefetch.items():
+            objects.append(Prefetch(prefix + name, queryset=child.apply(child.model._default_manager.all())))
+        for name, child in self.select.items():
+            objects += child.prefetches(f'{prefix}{name}__')
+        return objects
+
+    def apply(self, queryset, extra_columns=()):
+        """
+        Apply the plan to a queryset of the plan's model
+
+        Args:
+            queryset (QuerySet): Base queryset (filters, ordering)
+            extra_columns (iterable): Columns the caller needs besides the serialized
+                                      ones (ordering keys, FKs used for prefetching)
+
+        Returns:
+            QuerySet: Queryset with only() / select_related() / prefetch_related()
+        """
+        select_paths = self.select_paths()
+        if select_paths:
+            queryset = queryset.select_related(*select_paths)
+        only_paths = self.only_paths()
+        if only_paths is not None:
+            queryset = queryset.only(*only_paths, *extra_columns)
+        prefetches = self.prefetches()
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+
+def _plan_field(plan, serializer, field):
+    if isinstance(field, serializers.SerializerMethodField):
+        paths = getattr(getattr(serializer, field.method_name), 'reads', None)
+        if paths is None:
+            plan.load_all_columns()
+            return
+        for path in paths:
+            plan.add_path(path.split('__'))
+        return
+
+    if isinstance(field, serializers.BaseSerializer):
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        child = plan
+        for attr in field.source_attrs:
+            child = child.relation(attr) if child is not None else None
+        if child is None:
+            plan.load_all_columns()
+            return
+        for nested_field in nested._readable_fields:
+            _plan_field(child, nested, nested_field)
+        return
+
+    if field.source == '*':
+        plan.load_all_columns()
+        return
+    plan.add_path(field.source_attrs)
+
+
+def plan_serializer(serializer_class, names=None, provided=()):
+    """
+    Derive the query plan for a serializer
+
+    Args:
+        serializer_class: DRF ModelSerializer class
+        names (iterable): Fields to plan for (None = every readable field)
+        provided (iterable): Fields whose values the caller supplies itself
+                             (e.g. separately paginated nested lists)
+
+    Returns:
+        QueryPlan: Plan for serializer_class.Meta.model
+    """
+    serializer = serializer_class()
+    plan = QueryPlan(serializer_class.Meta.model)
+    for field in serializer._readable_fields:
+        if names is not None and field.field_name not in names:
+            continue
+        if field.field_name in provided:
+            continue
+        _plan_field(plan, serializer, field)
+    return plan
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from ..models import Project, Image
+from .compiled import CompiledSerializer
 
 
 class ImageSerializer(serializers.ModelSerializer):
@@ -39,3 +40,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at']
 
+
+# Fast path: same output as ProjectDetailSerializer(obj).data
+compiled_image_serializer = CompiledSerializer(ImageSerializer)
+compiled_project_detail_serializer = CompiledSerializer(ProjectDetailSerializer)
@@ -0,0 +1,28 @@
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Run blocking database code in a worker thread, off the request's thread
+
+    Async ORM queries of one request all run on that request's single sync thread,
+    one after the other. Calls made through this helper use the worker thread's own
+    connection instead, so they run concurrently with the request's async ORM
+    queries and with each other. The worker's connection is closed afterwards
+    unless CONN_MAX_AGE allows reusing it.
+
+    Args:
+        func (callable): Synchronous function
+        *args, **kwargs: Its arguments
+
+    Returns:
+        The function's return value
+    """
+    def call():
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return await sync_to_async(call, thread_sensitive=False)()
@@ -0,0 +1,182 @@
+import hashlib
+import json
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, DatabaseError
+from .. import metrics
+from ..models import CatalogVersion
+
+
+class CountService:
+    """
+    Count strategy layer for paginated listings
+
+    Strategies:
+        - exact: COUNT(*) over the filtered queryset, cached per normalized filter set
+        - estimate: query-planner / table-statistics estimate; falls back to a cached
+                    exact count when the backend has no estimate or the estimate is small
+        - none: no count at all
+    """
+
+    EXACT = 'exact'
+    ESTIMATE = 'estimate'
+    NONE = 'none'
+    STRATEGIES = (EXACT, ESTIMATE, NONE)
+
+    # Reported in the pagination block (whether an exact count came from the cache is
+    # not: the payload must not depend on cache state, see SnapshotService)
+    USED_EXACT = 'exact'
+    USED_ESTIMATE = 'estimate'
+    USED_NONE = 'none'
+
+    CACHE_PREFIX = 'listing_count'
+
+    @staticmethod
+    def normalize_strategy(strategy):
+        """
+        Map a raw `count` query parameter to a known strategy (default: exact)
+
+        Args:
+            strategy (str): Raw query parameter value
+
+        Returns:
+            str: One of STRATEGIES
+        """
+        strategy = (strategy or '').strip().lower()
+        return strategy if strategy in CountService.STRATEGIES else CountService.EXACT
+
+    @staticmethod
+    def cache_key(namespace, filters, version=None):
+        """
+        Build the cache key for a normalized filter set
+
+        Filters are matched case-insensitively, so values are stripped and lower-cased
+        and empty values dropped before hashing. The catalog version is part of the key,
+        so cached counts are dropped as soon as designers change.
+
+        Args:
+            namespace (str): Listing name (e.g. 'designers')
+            filters (dict): Filters applied to the listing
+            version (int): Catalog version (default: current)
+
+        Returns:
+            str: Cache key
+        """
+        normalized = {
+            k: str(v).strip().lower()
+            for k, v in (filters or {}).items()
+            if v is not None and str(v).strip()
+        }
+        digest = hashlib.sha1(
+            json.dumps(normalized, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        if version is None:
+            version, _ = CatalogVersion.current()
+        return f'{CountService.CACHE_PREFIX}:{namespace}:v{version}:{digest}'
+
+    @staticmethod
+    def get_count(queryset, namespace, filters=None, strategy=EXACT, version=None):
+        """
+        Count rows of a filtered queryset using the requested strategy
+
+        Args:
+            queryset (QuerySet): Filtered queryset (without annotations / prefetches)
+            namespace (str): Listing name used in the cache key
+            filters (dict): Filters applied to the queryset (cache key input)
+            strategy (str): One of STRATEGIES
+            version (int): Catalog version for the cache key (default: current)
+
+        Returns:
+            tuple: (count or None, strategy actually used)
+        """
+        if strategy == CountService.NONE:
+            return None, CountService.USED_NONE
+
+        if strategy == CountService.ESTIMATE:
+            estimate = CountService.estimate(queryset, filtered=bool(filters))
+            threshold = getattr(settings, 'LISTING_COUNT_ESTIMATE_THRESHOLD', 10000)
+            if estimate is not None and estimate >= threshold:
+                return estimate, CountService.USED_ESTIMATE
+
+        return CountService.get_exact_count(queryset, namespace, filters, version=version)
+
+    @staticmethod
+    def get_exact_count(queryset, namespace, filters=None, version=None):
+        """
+        Exact COUNT(*) cached per normalized filter set
+
+        Args:
+            queryset (QuerySet): Filtered queryset
+            namespace (str): Listing name used in the cache key
+            filters (dict): Filters applied to the queryset
+            version (int): Catalog version for the cache key (default: current)
+
+        Returns:
+            tuple: (count, 'exact')
+        """
+        key = CountService.cache_key(namespace, filters, version=version)
+        count = cache.get(key)
+        metrics.cache_lookup('count', count is not None)
+        if count is not None:
+            return count, CountService.USED_EXACT
+
+        count = queryset.count()
+        cache.set(key, count, getattr(settings, 'LISTING_COUNT_CACHE_TTL', 60))
+        return count, CountService.USED_EXACT
+
+    @staticmethod
+    def estimate(queryset, filtered=True):
+        """
+        Ask the database for an approximate row count without scanning the table
+
+        Unfiltered querysets use table statistics; filtered ones use the planner's
+        row estimate. SQLite keeps neither, so it always returns None.
+
+        Args:
+            queryset (QuerySet): Queryset to estimate
+            filtered (bool): Whether the queryset has a WHERE clause
+
+        Returns:
+            int or None: Estimated row count, or None if unavailable
+        """
+        connection = connections[queryset.db]
+        table = queryset.model._meta.db_table
+
+        try:
+            with connection.cursor() as cursor:
+                if connection.vendor == 'postgresql':
+                    if not filtered:
+                        cursor.execute(
+                            'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                            [table],
+                        )
+                        row = cursor.fetchone()
+                        # reltuples is -1 for tables that were never analyzed
+                        return int(row[0]) if row and row[0] >= 0 else None
+                    sql, params = queryset.values('id').query.sql_with_params()
+                    cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                    plan = cursor.fetchone()[0]
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    return int(plan[0]['Plan']['Plan Rows'])
+
+                if connection.vendor == 'mysql':
+                    if not filtered:
+                        cursor.execute(
+                            'SELECT TABLE_ROWS FROM information_schema.TABLES '
+                            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s',
+                            [table],
+                        )
+                        row = cursor.fetchone()
+                        return int(row[0]) if row and row[0] is not None else None
+                    sql, params = queryset.values('id').query.sql_with_params()
+                    cursor.execute(f'EXPLAIN {sql}', params)
+                    columns = [col[0] for col in cursor.description]
+                    row = dict(zip(columns, cursor.fetchone()))
+                    rows = row.get('rows') or 0
+                    filtered_pct = row.get('filtered') or 100
+                    return int(rows * float(filtered_pct) / 100)
+        except (DatabaseError, KeyError, IndexError, TypeError, ValueError):
+            return None
+
+        return None
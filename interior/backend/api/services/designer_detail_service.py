@@ -1,39 +1,278 @@
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.db.models import Prefetch
+from django.db.models import Prefetch, prefetch_related_objects
 from ..models import Designer, Project
-from ..serializers.designer_detail_serializer import DesignerDetailSerializer
+from ..serializers.designer_detail_serializer import (
+    DesignerDetailSerializer,
+    compiled_designer_detail_serializer,
+    compiled_project_basic_serializer,
+)
+from .pagination import CursorPagination
 
 
 class DesignerDetailService:
     """Service layer for Designer detail-related business logic"""
     
+    # Projects are listed oldest first (same order as before pagination)
+    PROJECT_ORDERING = 'id'
+    
     @staticmethod
-    def get_designer_detail(designer_id):
+    def get_designer_detail(designer_id, fields=None):
         """
         Get detailed information about a single designer (optimized query)
         
+        Only the first DESIGNER_PROJECTS_PAGE_SIZE projects are included (the rest
+        are paged through /api/designers/<id>/projects/ starting at
+        `projects_pagination.next_cursor`) and the portfolio is capped at
+        DesignerDetailSerializer.PORTFOLIO_LIMIT images, so the response size does
+        not grow with the number of projects.
+        
         Args:
             designer_id (int): ID of the designer
+            fields (tuple): Optional sparse fieldset (detail serializer field names);
+                            unselected columns and nested lists are not loaded
+        
+        Returns:
+            dict: Designer detail data with the first page of projects
+        """
+        serializer = compiled_designer_detail_serializer.restrict(fields)
+        
+        # Get designer or raise 404
+        designer = get_object_or_404(DesignerDetailService._designers_queryset(serializer), id=designer_id)
+        
+        page_size = getattr(settings, 'DESIGNER_PROJECTS_PAGE_SIZE', 12)
+        
+        projects = None
+        if serializer.includes('projects'):
+            # Fetch one extra project to know whether a next page exists
+            projects = list(
+                DesignerDetailService._projects_queryset().filter(designer_id=designer.id)[:page_size + 1]
+            )
+        
+        portfolio = None
+        if serializer.includes('portfolio') and (projects is None or len(projects) > page_size):
+            # The page does not hold every project: one capped portfolio query
+            portfolio = list(
+                DesignerDetailService._portfolio_queryset()
+                .filter(designer_id=designer.id)
+                .values_list('image', flat=True)[:DesignerDetailSerializer.PORTFOLIO_LIMIT]
+            )
+        
+        return DesignerDetailService._serialize_detail(serializer, designer, projects, page_size, portfolio)
+    
+    @staticmethod
+    async def aget_designer_detail(designer_id, fields=None):
+        """
+        Async get_designer_detail (same arguments and result, async ORM)
+        
+        Raises:
+            Http404: If the designer does not exist
+        """
+        serializer = compiled_designer_detail_serializer.restrict(fields)
+        
+        try:
+            designer = await DesignerDetailService._designers_queryset(serializer).aget(id=designer_id)
+        except Designer.DoesNotExist:
+            raise Http404('Designer not found')
+        
+        page_size = getattr(settings, 'DESIGNER_PROJECTS_PAGE_SIZE', 12)
+        
+        projects = None
+        if serializer.includes('projects'):
+            projects = [
+                project async for project in
+                DesignerDetailService._projects_queryset().filter(designer_id=designer.id)[:page_size + 1]
+            ]
+        
+        portfolio = None
+        if serializer.includes('portfolio') and (projects is None or len(projects) > page_size):
+            portfolio = [
+                image async for image in
+                DesignerDetailService._portfolio_queryset()
+                .filter(designer_id=designer.id)
+                .values_list('image', flat=True)[:DesignerDetailSerializer.PORTFOLIO_LIMIT]
+            ]
+        
+        return DesignerDetailService._serialize_detail(serializer, designer, projects, page_size, portfolio)
+    
+    @staticmethod
+    def get_designers_batch(designer_ids, fields=None):
+        """
+        Get designer details for many IDs at once (same data as get_designer_detail)
+        
+        Designers, their first pages of projects and (only for designers with more
+        projects than fit on a page) their portfolio thumbnails are each loaded
+        with a single IN query; per-designer limits use windowed prefetches.
+        
+        Args:
+            designer_ids (list): Designer IDs (unique)
+            fields (tuple): Optional sparse fieldset (detail serializer field names)
         
         Returns:
-            dict: Designer detail data with all projects and images
-        """
-        # Optimized queryset: prefetch projects in a single query
-        # Note: We don't prefetch images here since ProjectBasicSerializer doesn't include them
-        # This prevents N+1 query problems and improves performance
-        queryset = Designer.objects.prefetch_related(
-            Prefetch(
-                'projects',
-                queryset=Project.objects.order_by('id'),
-                to_attr='prefetched_projects'
+            tuple: (list of designer detail data in the order of designer_ids,
+                    list of IDs that do not exist)
+        """
+        serializer = compiled_designer_detail_serializer.restrict(fields)
+        page_size = getattr(settings, 'DESIGNER_PROJECTS_PAGE_SIZE', 12)
+        limit = DesignerDetailSerializer.PORTFOLIO_LIMIT
+        
+        queryset = DesignerDetailService._designers_queryset(serializer).filter(id__in=designer_ids)
+        if serializer.includes('projects'):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'projects',
+                    queryset=DesignerDetailService._projects_queryset(extra_columns=('designer',))[:page_size + 1],
+                    to_attr='first_projects'
+                )
             )
+        designers = list(queryset)
+        
+        if serializer.includes('portfolio'):
+            without_full_page = [
+                designer for designer in designers
+                if not hasattr(designer, 'first_projects') or len(designer.first_projects) > page_size
+            ]
+            if without_full_page:
+                prefetch_related_objects(
+                    without_full_page,
+                    Prefetch(
+                        'projects',
+                        queryset=DesignerDetailService._portfolio_queryset().only('id', 'designer', 'image')[:limit],
+                        to_attr='portfolio_projects'
+                    )
+                )
+        
+        details = {
+            designer.id: DesignerDetailService._serialize_detail(
+                serializer,
+                designer,
+                getattr(designer, 'first_projects', None),
+                page_size,
+                [project.image for project in designer.portfolio_projects]
+                if hasattr(designer, 'portfolio_projects') else None
+            )
+            for designer in designers
+        }
+        found = [details[designer_id] for designer_id in designer_ids if designer_id in details]
+        missing = [designer_id for designer_id in designer_ids if designer_id not in details]
+        return found, missing
+    
+    @staticmethod
+    def _designers_queryset(serializer):
+        """Designer queryset loading only what the (restricted) detail serializer reads"""
+        # projects / portfolio are fetched (paged, capped) by the service itself
+        return serializer.plan(provided=('projects', 'portfolio')).apply(
+            Designer.objects.all(),
+            # projects_pagination.total
+            extra_columns=('project_count',) if serializer.includes('projects') else ()
         )
+    
+    @staticmethod
+    def _projects_queryset(serializer=compiled_project_basic_serializer, extra_columns=()):
+        """Projects in PROJECT_ORDERING, loading only what the project serializer reads"""
+        return CursorPagination.order_by(
+            serializer.plan().apply(Project.objects.all(), extra_columns=extra_columns),
+            DesignerDetailService.PROJECT_ORDERING
+        )
+    
+    @staticmethod
+    def _portfolio_queryset():
+        """Projects with a thumbnail, in portfolio order"""
+        return (
+            Project.objects.exclude(image__isnull=True)
+                           .exclude(image='')
+                           .order_by('id')
+        )
+    
+    @staticmethod
+    def _serialize_detail(serializer, designer, projects, page_size, portfolio=None):
+        """
+        Serialize a designer with the first page of its projects
         
-        # Get designer or raise 404
-        designer = get_object_or_404(queryset, id=designer_id)
+        Args:
+            serializer (CompiledSerializer): Detail serializer (possibly restricted)
+            designer (Designer): Designer instance
+            projects (list): First page_size + 1 projects in PROJECT_ORDERING,
+                             or None when `projects` is not selected
+            page_size (int): Projects per page
+            portfolio (list): Portfolio image URLs; derived from `projects` when None
+                              (only valid when `projects` holds every project)
         
-        # Serialize data
-        serializer = DesignerDetailSerializer(designer)
+        Returns:
+            dict: Designer detail data
+        """
+        overrides = {}
+        pagination = None
         
-        return serializer.data
-
+        if projects is not None:
+            projects, has_next, next_cursor = CursorPagination.split_page(
+                projects, page_size, DesignerDetailService.PROJECT_ORDERING
+            )
+            overrides['projects'] = compiled_project_basic_serializer.data(projects, many=True)
+            pagination = {
+                'total': designer.project_count,
+                'page_size': page_size,
+                'has_next': has_next,
+                'next_cursor': next_cursor,
+            }
+        
+        if serializer.includes('portfolio'):
+            # Portfolio = thumbnails of the first projects that have one
+            if portfolio is None:
+                portfolio = [
+                    project['thumbnail'] for project in overrides['projects'] if project['thumbnail']
+                ][:DesignerDetailSerializer.PORTFOLIO_LIMIT]
+            overrides['portfolio'] = portfolio
+        
+        # Serialize data (compiled fast path)
+        designer_data = serializer.serialize_with(designer, **overrides)
+        if pagination is not None:
+            designer_data['projects_pagination'] = pagination
+        
+        return designer_data
+    
+    @staticmethod
+    def get_designer_projects(designer_id, page_size, cursor=None, fields=None):
+        """
+        Get one page of a designer's projects (keyset pagination by id)
+        
+        Args:
+            designer_id (int): ID of the designer
+            page_size (int): Projects per page
+            cursor (str): Optional `next_cursor` of the previous page
+            fields (tuple): Optional sparse fieldset (project serializer field names)
+        
+        Returns:
+            dict: Contains projects list and cursor pagination info
+        
+        Raises:
+            Http404: If the designer does not exist
+            InvalidCursorError: If the cursor is malformed or issued for another ordering
+        """
+        if not Designer.objects.filter(id=designer_id).exists():
+            raise Http404('Designer not found')
+        return DesignerDetailService._get_projects_page(
+            designer_id, page_size, cursor, compiled_project_basic_serializer.restrict(fields)
+        )
+    
+    @staticmethod
+    def _get_projects_page(designer_id, page_size, cursor=None, serializer=compiled_project_basic_serializer):
+        ordering = DesignerDetailService.PROJECT_ORDERING
+        queryset = DesignerDetailService._projects_queryset(serializer).filter(designer_id=designer_id)
+        
+        if cursor:
+            value, last_id = CursorPagination.decode(cursor, ordering, Project)
+            queryset = CursorPagination.seek(queryset, ordering, value, last_id)
+        
+        # Fetch one extra row to know whether a next page exists
+        projects, has_next, next_cursor = CursorPagination.split_page(
+            list(queryset[:page_size + 1]), page_size, ordering
+        )
+        
+        return {
+            'projects': serializer.data(projects, many=True),
+            'page_size': page_size,
+            'has_next': has_next,
+            'next_cursor': next_cursor,
+        }
@@ -1,78 +1,310 @@
-from django.db.models import Count, Q, Prefetch
-from ..models import Designer, Project
-from ..serializers.designer_listing_serializer import DesignerListingSerializer
+import asyncio
+from ..models import Designer
+from ..serializers.designer_listing_serializer import compiled_designer_listing_serializer
+from .concurrency import run_in_thread
+from .count_service import CountService
+from .pagination import CursorPagination
+from .search_backend import get_search_backend
+
+
+class InvalidOrderingError(ValueError):
+    """Raised when the listing `ordering` is not one of DesignerService.ORDERINGS"""
 
 
 class DesignerService:
     """Service layer for Designer-related business logic"""
     
+    # Ordering value that sorts search results by full-text rank
+    RELEVANCE = 'relevance'
+    
+    # Supported listing orderings: public name -> ordering on a NOT NULL stored column.
+    # Each is backed by a (column, id) index (see Designer.Meta.indexes), so with the
+    # id tie-breaker every page is an index-ordered scan, never a filesort.
+    ORDERINGS = {
+        'id': 'id',
+        '-id': '-id',
+        'name': 'sort_name',
+        'newest': '-created_at',
+        'most_projects': '-project_count',
+        'price': 'sort_price',
+    }
+    
     @staticmethod
-    def get_designers_list(filters=None, ordering=None, page=1, page_size=20):
+    def get_designers_list(filters=None, ordering=None, page=1, page_size=20, cursor=None,
+                           count_strategy=CountService.EXACT, fields=None, catalog_version=None):
         """
         Get list of designers with basic information (optimized query)
         
         Args:
-            filters (dict): Optional filters (category, search, etc.)
-            ordering (str): Optional ordering field (default: 'id')
+            filters (dict): Optional filters (category, category_exact, city, price, search)
+            ordering (str): Optional ordering, one of ORDERINGS or 'relevance'
+                            (default: 'relevance' when searching, otherwise 'id')
             page (int): Page number (default: 1)
             page_size (int): Items per page (default: 20)
+            cursor (str): Optional cursor token. When not None the list is paged
+                          with keyset pagination instead of page/offset ('' = first page)
+            count_strategy (str): How to compute the total: 'exact' (cached per filter set),
+                                  'estimate' (planner estimate for large results) or 'none'
+            fields (tuple): Optional sparse fieldset (listing serializer field names);
+                            only the columns those fields read are loaded
+            catalog_version (int): Catalog version the request already read, for the
+                                   count cache key (default: read it)
         
         Returns:
             dict: Contains designers list and pagination info
+        
+        Raises:
+            InvalidOrderingError: If the ordering is not supported
+            InvalidCursorError: If the cursor is malformed or issued for another ordering
+        """
+        filtered, queryset, ordering, serializer = DesignerService._listing_queryset(filters, ordering, fields)
+        
+        if cursor is not None:
+            return DesignerService._get_cursor_page(queryset, ordering, page_size, cursor, serializer)
+        
+        queryset = DesignerService._order_for_offset(queryset, ordering)
+        
+        # Get total count before pagination (cached / estimated / skipped per strategy)
+        total_count, count_strategy = CountService.get_count(
+            filtered, 'designers', filters=filters, strategy=count_strategy, version=catalog_version
+        )
+        
+        # Apply pagination (always paginated)
+        offset = (page - 1) * page_size
+        
+        if total_count is None:
+            # No count: fetch one extra row to know whether a next page exists
+            designers = list(queryset[offset:offset + page_size + 1])
+        else:
+            designers = list(queryset[offset:offset + page_size])
+        
+        return DesignerService._offset_page(serializer, designers, total_count, count_strategy, page, page_size)
+    
+    @staticmethod
+    async def aget_designers_list(filters=None, ordering=None, page=1, page_size=20, cursor=None,
+                                  count_strategy=CountService.EXACT, fields=None, catalog_version=None):
+        """
+        Async get_designers_list (same arguments and result)
+        
+        The page is read with the async ORM while the total is counted concurrently
+        on a worker thread's own connection, so a page costs about one query's
+        latency instead of two.
+        
+        Raises:
+            InvalidOrderingError: If the ordering is not supported
+            InvalidCursorError: If the cursor is malformed or issued for another ordering
         """
-        # Optimized queryset: annotate project_count, prefetch only first project for featured_image
-        # Note: Django's Prefetch doesn't support slicing in the queryset, so we'll handle it in serializer
-        queryset = Designer.objects.annotate(
-            project_count=Count('projects')
-        ).prefetch_related(
-            Prefetch(
-                'projects',
-                queryset=Project.objects.order_by('id').only('id', 'image', 'designer_id'),
-                to_attr='prefetched_projects'
+        filtered, queryset, ordering, serializer = DesignerService._listing_queryset(filters, ordering, fields)
+        
+        if cursor is not None:
+            return await run_in_thread(
+                DesignerService._get_cursor_page, queryset, ordering, page_size, cursor, serializer
             )
+        
+        queryset = DesignerService._order_for_offset(queryset, ordering)
+        offset = (page - 1) * page_size
+        
+        async def fetch_page():
+            # The count is not known yet: one extra row tells whether a next page exists
+            return [designer async for designer in queryset[offset:offset + page_size + 1]]
+        
+        (total_count, count_strategy), designers = await asyncio.gather(
+            run_in_thread(
+                CountService.get_count, filtered, 'designers',
+                filters=filters, strategy=count_strategy, version=catalog_version,
+            ),
+            fetch_page(),
         )
         
+        return DesignerService._offset_page(serializer, designers, total_count, count_strategy, page, page_size)
+    
+    @staticmethod
+    def _listing_queryset(filters, ordering, fields):
+        """
+        Build the (unevaluated) listing querysets
+        
+        Args:
+            filters (dict): Optional filters (category, category_exact, city, price, search)
+            ordering (str): Requested ordering (ORDERINGS), or None / 'relevance'
+            fields (tuple): Optional sparse fieldset
+        
+        Returns:
+            tuple: (filtered queryset to count, page queryset, resolved ordering field,
+                    listing serializer restricted to `fields`)
+        
+        Raises:
+            InvalidOrderingError: If the ordering is not supported
+        """
+        if ordering and ordering != DesignerService.RELEVANCE and ordering not in DesignerService.ORDERINGS:
+            raise InvalidOrderingError(
+                f'Unknown ordering {ordering!r}. Available: '
+                f'{", ".join([*DesignerService.ORDERINGS, DesignerService.RELEVANCE])}'
+            )
+        
+        # Filters only touch Designer columns
+        filtered = Designer.objects.all()
+        search_term = (filters or {}).get('search')
+        search_backend = get_search_backend()
+        
         # Apply filters
         if filters:
             # Category filter
             if filters.get('category'):
-                queryset = queryset.filter(category__icontains=filters['category'])
+                filtered = filtered.filter(category__icontains=filters['category'])
+            if filters.get('category_exact'):
+                # Whole value, as counted by the category facet
+                filtered = filtered.filter(category__iexact=filters['category_exact'])
+            
+            # City / price bucket filters (stored columns, values of the facets endpoint)
+            if filters.get('city'):
+                filtered = filtered.filter(city__iexact=filters['city'])
+            if filters.get('price'):
+                filtered = filtered.filter(price_bucket=filters['price'])
             
-            # Search filter (search in business_name, address, category)
-            if filters.get('search'):
-                search_term = filters['search']
-                queryset = queryset.filter(
-                    Q(business_name__icontains=search_term) |
-                    Q(address__icontains=search_term) |
-                    Q(category__icontains=search_term)
-                )
-        
-        # Apply ordering (default: id ascending - id=1, then id=2, etc.)
-        if ordering:
-            queryset = queryset.order_by(ordering)
+            # Search filter (full-text index over business_name, address, category)
+            if search_term:
+                filtered = search_backend.filter(filtered, search_term)
+        
+        # project_count and featured_image are stored on Designer, so the page is a
+        # single join-free query (no Count('projects') annotation, no project prefetch)
+        queryset = filtered
+        
+        # Default ordering: relevance when searching, otherwise id ascending
+        if not ordering:
+            ordering = DesignerService.RELEVANCE if search_term else 'id'
+        
+        # Relevance ordering sorts on the full-text rank (higher first)
+        if ordering == DesignerService.RELEVANCE:
+            if search_term:
+                queryset = search_backend.annotate_rank(queryset, search_term)
+                ordering = '-search_rank'
+            else:
+                ordering = 'id'
         else:
-            queryset = queryset.order_by('id')
+            ordering = DesignerService.ORDERINGS[ordering]
         
-        # Get total count before pagination
-        total_count = queryset.count()
+        # Load only what the selected fields read (plus the ordering key)
+        serializer = compiled_designer_listing_serializer.restrict(fields)
+        order_field = ordering.lstrip('-')
+        queryset = serializer.plan().apply(
+            queryset, extra_columns=() if order_field == 'search_rank' else (order_field,)
+        )
+        return filtered, queryset, ordering, serializer
+    
+    @staticmethod
+    def _order_for_offset(queryset, ordering):
+        """Apply ordering for page/offset pagination (ties are broken by id, like the indexes)"""
+        if ordering == '-search_rank':
+            return queryset.order_by(ordering, 'id')
+        return CursorPagination.order_by(queryset, ordering)
+    
+    @staticmethod
+    def _offset_page(serializer, designers, total_count, count_strategy, page, page_size):
+        """
+        Build the page/offset result
         
-        # Apply pagination (always paginated)
-        offset = (page - 1) * page_size
-        queryset = queryset[offset:offset + page_size]
+        Args:
+            serializer (CompiledSerializer): Listing serializer
+            designers (list): The page's rows, plus at most one extra row
+            total_count (int): Total, or None when not counted
+            count_strategy (str): Strategy used for the total
+            page (int): Page number
+            page_size (int): Items per page
         
-        # Serialize data
-        serializer = DesignerListingSerializer(queryset, many=True)
+        Returns:
+            dict: Contains designers list and pagination info
+        """
+        if total_count is None:
+            has_next = len(designers) > page_size
+            total_pages = None
+        else:
+            total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
+            has_next = page < total_pages
         
-        # Calculate pagination metadata
-        total_pages = (total_count + page_size - 1) // page_size if page_size > 0 else 0
+        # Serialize data (compiled fast path)
+        designers_data = serializer.data(designers[:page_size], many=True)
         
         return {
-            'designers': serializer.data,
+            'designers': designers_data,
             'total': total_count,
             'page': page,
             'page_size': page_size,
             'total_pages': total_pages,
-            'has_next': page < total_pages,
-            'has_previous': page > 1
+            'has_next': has_next,
+            'has_previous': page > 1,
+            'count_strategy': count_strategy
+        }
+    
+    @staticmethod
+    def build_listing_payload(result):
+        """
+        Build the listing response body from a get_designers_list result
+        
+        Args:
+            result (dict): Return value of get_designers_list
+        
+        Returns:
+            dict: Response payload (data + pagination block)
+        """
+        if 'next_cursor' in result:
+            return {
+                'success': True,
+                'data': result['designers'],
+                'pagination': {
+                    'mode': 'cursor',
+                    'page_size': result['page_size'],
+                    'has_next': result['has_next'],
+                    'next_cursor': result['next_cursor'],
+                    'count': len(result['designers'])
+                }
+            }
+        
+        return {
+            'success': True,
+            'data': result['designers'],
+            'pagination': {
+                'total': result['total'],
+                'page': result['page'],
+                'page_size': result['page_size'],
+                'total_pages': result['total_pages'],
+                'has_next': result['has_next'],
+                'has_previous': result['has_previous'],
+                'count': len(result['designers']),
+                'count_strategy': result['count_strategy']
+            }
+        }
+    
+    @staticmethod
+    def _get_cursor_page(queryset, ordering, page_size, cursor, serializer):
+        """
+        Fetch one page with keyset pagination (seek past the cursor, no OFFSET, no COUNT)
+        
+        Args:
+            queryset (QuerySet): Filtered listing queryset
+            ordering (str): Ordering field
+            page_size (int): Items per page
+            cursor (str): Cursor token ('' = first page)
+            serializer (CompiledSerializer): Listing serializer (possibly restricted)
+        
+        Returns:
+            dict: Contains designers list and cursor pagination info
+        """
+        queryset = CursorPagination.order_by(queryset, ordering)
+        
+        if cursor:
+            value, last_id = CursorPagination.decode(cursor, ordering, Designer)
+            queryset = CursorPagination.seek(queryset, ordering, value, last_id)
+        
+        # Fetch one extra row to know whether a next page exists
+        designers, has_next, next_cursor = CursorPagination.split_page(
+            list(queryset[:page_size + 1]), page_size, ordering
+        )
+        
+        designers_data = serializer.data(designers, many=True)
+        
+        return {
+            'designers': designers_data,
+            'page_size': page_size,
+            'has_next': has_next,
+            'next_cursor': next_cursor,
         }
-
@@ -0,0 +1,175 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import Http404
+from django.utils import timezone
+from .. import metrics
+from ..models import ApiDocument, Designer, Project
+from ..renderers import FastJSONRenderer
+from .designer_detail_service import DesignerDetailService
+from .project_detail_service import ProjectDetailService
+
+
+class DocumentStoreService:
+    """
+    Materialized response bodies for the designer and project detail pages
+
+    Documents hold the exact bytes the live detail views would render. Writes to
+    the catalog invalidate the affected documents (see api.signals), so a document
+    is either current or absent; absent documents are served by the live query path
+    until `build_api_documents` or the scraper rebuilds them. Builds are
+    conditional on the document's generation (see ApiDocument), so a build racing
+    with a write cannot store a stale body.
+    """
+
+    @staticmethod
+    def enabled():
+        return getattr(settings, 'API_DOCUMENT_STORE_ENABLED', True)
+
+    @staticmethod
+    def get_body(kind, object_id):
+        """
+        Get the stored response body
+
+        Args:
+            kind (str): ApiDocument.KIND_DESIGNER or ApiDocument.KIND_PROJECT
+            object_id (int): Designer or project ID
+
+        Returns:
+            bytes or None: JSON body, or None if not materialized
+        """
+        if not DocumentStoreService.enabled():
+            return None
+        body = (
+            ApiDocument.objects.filter(kind=kind, object_id=object_id)
+                               .values_list('body', flat=True)
+                               .first()
+        )
+        metrics.cache_lookup('document', body is not None)
+        return bytes(body) if body is not None else None
+
+    @staticmethod
+    async def aget_body(kind, object_id):
+        """Async get_body (async ORM)"""
+        if not DocumentStoreService.enabled():
+            return None
+        body = await (
+            ApiDocument.objects.filter(kind=kind, object_id=object_id)
+                               .values_list('body', flat=True)
+                               .afirst()
+        )
+        metrics.cache_lookup('document', body is not None)
+        return bytes(body) if body is not None else None
+
+    @staticmethod
+    def render(kind, object_id):
+        """
+        Render the live detail response body
+
+        Args:
+            kind (str): Document kind
+            object_id (int): Designer or project ID
+
+        Returns:
+            bytes: JSON body (same bytes as the live view)
+
+        Raises:
+            Http404: If the object does not exist
+        """
+        if kind == ApiDocument.KIND_DESIGNER:
+            data = DesignerDetailService.get_designer_detail(object_id)
+        else:
+            data = ProjectDetailService.get_project_detail(object_id)
+
+        return FastJSONRenderer().render({
+            'success': True,
+            'data': data
+        })
+
+    @staticmethod
+    def build(kind, object_id):
+        """
+        (Re)build one document; removes it if the object no longer exists
+
+        Args:
+            kind (str): Document kind
+            object_id (int): Designer or project ID
+
+        Returns:
+            bool: True if a document was written
+        """
+        documents = ApiDocument.objects.filter(kind=kind, object_id=object_id)
+        # Read before rendering: an invalidation after this point bumps it
+        generation = documents.values_list('generation', flat=True).first()
+        
+        try:
+            body = DocumentStoreService.render(kind, object_id)
+        except Http404:
+            DocumentStoreService.invalidate(kind, [object_id])
+            return False
+        
+        if generation is None:
+            try:
+                with transaction.atomic():
+                    ApiDocument.objects.create(kind=kind, object_id=object_id, body=body)
+            except IntegrityError:
+                # Invalidated (tombstone) or built concurrently: leave it to the next build
+                return False
+            return True
+        
+        return bool(documents.filter(generation=generation).update(body=body, built_at=timezone.now()))
+
+    @staticmethod
+    def build_for_designer(designer_id):
+        """
+        Rebuild a designer's document and the documents of all its projects
+
+        Args:
+            designer_id (int): Designer ID
+
+        Returns:
+            int: Number of documents written
+        """
+        if not DocumentStoreService.enabled():
+            return 0
+        built = int(DocumentStoreService.build(ApiDocument.KIND_DESIGNER, designer_id))
+        project_ids = Project.objects.filter(designer_id=designer_id).values_list('id', flat=True)
+        for project_id in project_ids.iterator():
+            built += int(DocumentStoreService.build(ApiDocument.KIND_PROJECT, project_id))
+        return built
+
+    @staticmethod
+    def missing_ids(kind):
+        """
+        IDs of designers or projects that have no document yet
+
+        Args:
+            kind (str): Document kind
+
+        Returns:
+            QuerySet: Flat values_list of IDs, ordered by ID
+        """
+        model = Designer if kind == ApiDocument.KIND_DESIGNER else Project
+        built = ApiDocument.objects.filter(kind=kind, body__isnull=False).values('object_id')
+        return model.objects.exclude(id__in=built).order_by('id').values_list('id', flat=True)
+
+    @staticmethod
+    def invalidate(kind, object_ids):
+        """
+        Clear documents so the live path serves them until they are rebuilt
+
+        Args:
+            kind (str): Document kind
+            object_ids (iterable): Designer or project IDs
+        """
+        object_ids = [object_id for object_id in object_ids if object_id is not None]
+        if not object_ids:
+            return
+        # Tombstones first, so a build that found no row cannot insert its body afterwards
+        ApiDocument.objects.bulk_create(
+            [ApiDocument(kind=kind, object_id=object_id, body=None) for object_id in object_ids],
+            ignore_conflicts=True,
+        )
+        ApiDocument.objects.filter(kind=kind, object_id__in=object_ids).update(
+            body=None, generation=F('generation') + 1, built_at=timezone.now()
+        )
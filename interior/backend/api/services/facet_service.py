@@ -0,0 +1,70 @@
+from django.db.models import Count
+from ..models import Designer, DesignerFacet
+from ..models.designer import PRICE_BUCKETS
+from .search_backend import get_search_backend
+
+
+class FacetService:
+    """Designer counts per category, city and price bucket (listing filter chips)"""
+
+    @staticmethod
+    def get_facets(search=None, limit=20):
+        """
+        Get the facet counts, optionally scoped to a full-text search
+
+        Without a search the counts come from the DesignerFacet aggregate table (a
+        top-N read per facet). With a search they are grouped over the matching
+        designers only, on the stored city / price_bucket columns.
+
+        Args:
+            search (str): Optional search term (same matching as the listing's `search`)
+            limit (int): Most values returned per category / city facet
+
+        Returns:
+            dict: {'category': [...], 'city': [...], 'price': [...]} of
+                  {'value', 'count'} items, most designers first; price buckets
+                  (with a 'label') in price order
+        """
+        if search:
+            counts = FacetService._search_counts(search)
+        else:
+            counts = {
+                facet: list(
+                    DesignerFacet.objects.filter(facet=facet, count__gt=0)
+                    .order_by('-count', 'value')
+                    .values_list('value', 'count')[:limit]
+                )
+                for facet in (DesignerFacet.FACET_CATEGORY, DesignerFacet.FACET_CITY)
+            }
+            counts[DesignerFacet.FACET_PRICE] = list(
+                DesignerFacet.objects.filter(facet=DesignerFacet.FACET_PRICE, count__gt=0).values_list('value', 'count')
+            )
+
+        facets = {
+            facet: [
+                {'value': value, 'count': count}
+                for value, count in sorted(counts[facet], key=lambda item: (-item[1], item[0]))[:limit]
+            ]
+            for facet in (DesignerFacet.FACET_CATEGORY, DesignerFacet.FACET_CITY)
+        }
+        price_counts = dict(counts[DesignerFacet.FACET_PRICE])
+        facets[DesignerFacet.FACET_PRICE] = [
+            {'value': key, 'label': label, 'count': price_counts[key]}
+            for _, key, label in PRICE_BUCKETS
+            if price_counts.get(key)
+        ]
+        return facets
+
+    @staticmethod
+    def _search_counts(search):
+        """(value, count) pairs per facet over the designers matching `search` (one GROUP BY per facet)"""
+        matching = get_search_backend().filter(Designer.objects.all(), search)
+        counts = {}
+        for facet, field in DesignerFacet.DESIGNER_FIELDS.items():
+            totals = {}
+            for row in matching.order_by().values(field).annotate(total=Count('id')):
+                value = (row[field] or '').strip()
+                if value:
+                    totals[value] = totals.get(value, 0) + row['total']
+            counts[facet] = list(totals.items())
+        return counts
@@ -0,0 +1,202 @@
+import base64
+import datetime
+import decimal
+import json
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the ordering"""
+
+
+def _encode_value(value):
+    """JSON fallback for ordering keys; keeps full datetime precision (unlike DjangoJSONEncoder)"""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor')
+
+
+class CursorPagination:
+    """
+    Keyset (cursor) pagination helpers
+
+    A cursor is an opaque, URL-safe token holding the ordering it was issued for
+    and the (ordering key, id) tuple of the last row on the previous page. The next
+    page is fetched by seeking past that tuple instead of skipping `offset` rows,
+    so every page costs the same no matter how deep the client scrolls.
+
+    NULL ordering keys are sorted last for ascending orderings and first for
+    descending ones (the same on every database backend), and `id` is always
+    used as the tie-breaker so the order is total.
+    """
+
+    @staticmethod
+    def parse_ordering(ordering):
+        """
+        Split an ordering string into (field name, descending flag)
+
+        Args:
+            ordering (str): Ordering like 'business_name' or '-created_at'
+
+        Returns:
+            tuple: (field_name, descending)
+        """
+        descending = ordering.startswith('-')
+        return ordering.lstrip('-'), descending
+
+    @staticmethod
+    def _is_nullable(model, field):
+        """True unless `field` is a NOT NULL model column (annotations count as nullable)"""
+        try:
+            return model._meta.get_field(field).null
+        except FieldDoesNotExist:
+            return True
+
+    @staticmethod
+    def order_by(queryset, ordering):
+        """
+        Apply a total, NULL-stable ordering suitable for keyset pagination
+
+        Args:
+            queryset (QuerySet): Queryset to order
+            ordering (str): Ordering like 'business_name' or '-created_at'
+
+        Returns:
+            QuerySet: Ordered queryset
+        """
+        field, descending = CursorPagination.parse_ordering(ordering)
+        if field == 'id':
+            return queryset.order_by('-id' if descending else 'id')
+        if not CursorPagination._is_nullable(queryset.model, field):
+            # Plain ordering keeps (field, id) indexes usable (NULL handling wraps the column)
+            return queryset.order_by(ordering, '-id' if descending else 'id')
+        if descending:
+            return queryset.order_by(F(field).desc(nulls_first=True), '-id')
+        return queryset.order_by(F(field).asc(nulls_last=True), 'id')
+
+    @staticmethod
+    def seek(queryset, ordering, value, last_id):
+        """
+        Filter a queryset to the rows strictly after (value, last_id)
+
+        Args:
+            queryset (QuerySet): Queryset to filter
+            ordering (str): Ordering the cursor was issued for
+            value: Ordering key of the last row on the previous page
+            last_id (int): ID of the last row on the previous page
+
+        Returns:
+            QuerySet: Filtered queryset
+        """
+        field, descending = CursorPagination.parse_ordering(ordering)
+
+        if field == 'id':
+            return queryset.filter(id__lt=last_id) if descending else queryset.filter(id__gt=last_id)
+
+        if descending:
+            # NULLs come first in descending order
+            if value is None:
+                condition = (
+                    Q(**{f'{field}__isnull': True, 'id__lt': last_id}) |
+                    Q(**{f'{field}__isnull': False})
+                )
+            else:
+                condition = (
+                    Q(**{f'{field}__lt': value}) |
+                    Q(**{field: value, 'id__lt': last_id})
+                )
+        else:
+            # NULLs come last in ascending order
+            if value is None:
+                condition = Q(**{f'{field}__isnull': True, 'id__gt': last_id})
+            else:
+                condition = (
+                    Q(**{f'{field}__gt': value}) |
+                    Q(**{field: value, 'id__gt': last_id}) |
+                    Q(**{f'{field}__isnull': True})
+                )
+
+        return queryset.filter(condition)
+
+    @staticmethod
+    def split_page(rows, page_size, ordering):
+        """
+        Split rows fetched with one extra row (limit page_size + 1) into a page
+
+        Args:
+            rows (list): Rows in page order, at most page_size + 1
+            page_size (int): Items per page
+            ordering (str): Ordering the rows were fetched with
+
+        Returns:
+            tuple: (page rows, has_next, next_cursor or None)
+        """
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = CursorPagination.encode(ordering, rows[-1]) if has_next else None
+        return rows, has_next, next_cursor
+
+    @staticmethod
+    def encode(ordering, obj):
+        """
+        Build the opaque cursor pointing just past `obj`
+
+        Args:
+            ordering (str): Ordering the page was fetched with
+            obj: Last model instance on the page
+
+        Returns:
+            str: URL-safe cursor token
+        """
+        field, _ = CursorPagination.parse_ordering(ordering)
+        payload = {
+            'o': ordering,
+            'v': getattr(obj, field),
+            'id': obj.id,
+        }
+        raw = json.dumps(payload, default=_encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(token, ordering, model):
+        """
+        Decode a cursor token issued for `ordering`
+
+        Args:
+            token (str): Cursor token from the client
+            ordering (str): Ordering of the current request
+            model: Model class the ordering field belongs to
+
+        Returns:
+            tuple: (value, last_id) to pass to `seek`
+
+        Raises:
+            InvalidCursorError: If the token is malformed or was issued for another ordering
+        """
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            issued_ordering = payload['o']
+            value = payload['v']
+            last_id = int(payload['id'])
+        except (ValueError, TypeError, KeyError, UnicodeError):
+            raise InvalidCursorError('Malformed cursor')
+
+        if issued_ordering != ordering:
+            raise InvalidCursorError('Cursor was issued for a different ordering')
+
+        field, _ = CursorPagination.parse_ordering(ordering)
+        if value is not None:
+            try:
+                value = model._meta.get_field(field).to_python(value)
+            except FieldDoesNotExist:
+                # Annotated ordering keys (project_count, search_rank) are numbers
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise InvalidCursorError('Malformed cursor')
+            except ValidationError:
+                raise InvalidCursorError('Malformed cursor')
+
+        return value, last_id
@@ -1,37 +1,207 @@
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.db.models import Prefetch
 from ..models import Project, Image
-from ..serializers.project_detail_serializer import ProjectDetailSerializer
+from ..serializers.project_detail_serializer import (
+    compiled_project_detail_serializer,
+    compiled_image_serializer,
+)
+from .pagination import CursorPagination
 
 
 class ProjectDetailService:
     """Service layer for Project detail-related business logic"""
     
+    # Images are listed in ascending id order (same order as before pagination),
+    # served by the (project, id) index
+    IMAGE_ORDERING = 'id'
+    
     @staticmethod
-    def get_project_detail(project_id):
+    def get_project_detail(project_id, fields=None):
         """
         Get detailed information about a single project (optimized query)
         
+        Only the first PROJECT_IMAGES_PAGE_SIZE images are included; the rest are
+        paged through /api/projects/<id>/images/ starting at
+        `images_pagination.next_cursor`, so the response size no longer grows with
+        the number of images.
+        
         Args:
             project_id (int): ID of the project
+            fields (tuple): Optional sparse fieldset (detail serializer field names);
+                            unselected columns and images are not loaded
         
         Returns:
-            dict: Project detail data with all images
-        """
-        # Optimized queryset: prefetch images in a single query
-        # This prevents N+1 query problems
-        queryset = Project.objects.prefetch_related(
-            Prefetch(
-                'images',
-                queryset=Image.objects.order_by('id').only('id', 'image_id', 'image_url', 'title', 'project_id', 'created_at')
+            dict: Project detail data with the first page of images
+        """
+        serializer = compiled_project_detail_serializer.restrict(fields)
+        
+        # Get project or raise 404
+        project = get_object_or_404(ProjectDetailService._projects_queryset(serializer), id=project_id)
+        
+        page_size = getattr(settings, 'PROJECT_IMAGES_PAGE_SIZE', 24)
+        
+        images = None
+        if serializer.includes('images'):
+            # Fetch one extra image to know whether a next page exists
+            images = list(ProjectDetailService._images_queryset().filter(project_id=project.id)[:page_size + 1])
+        
+        return ProjectDetailService._serialize_detail(serializer, project, images, page_size)
+    
+    @staticmethod
+    async def aget_project_detail(project_id, fields=None):
+        """
+        Async get_project_detail (same arguments and result, async ORM)
+        
+        Raises:
+            Http404: If the project does not exist
+        """
+        serializer = compiled_project_detail_serializer.restrict(fields)
+        
+        try:
+            project = await ProjectDetailService._projects_queryset(serializer).aget(id=project_id)
+        except Project.DoesNotExist:
+            raise Http404('Project not found')
+        
+        page_size = getattr(settings, 'PROJECT_IMAGES_PAGE_SIZE', 24)
+        
+        images = None
+        if serializer.includes('images'):
+            images = [
+                image async for image in
+                ProjectDetailService._images_queryset().filter(project_id=project.id)[:page_size + 1]
+            ]
+        
+        return ProjectDetailService._serialize_detail(serializer, project, images, page_size)
+    
+    @staticmethod
+    def get_projects_batch(project_ids, fields=None):
+        """
+        Get project details for many IDs at once (same data as get_project_detail)
+        
+        Projects and their first pages of images are each loaded with a single IN
+        query (the per-project image limit uses a windowed prefetch).
+        
+        Args:
+            project_ids (list): Project IDs (unique)
+            fields (tuple): Optional sparse fieldset (detail serializer field names)
+        
+        Returns:
+            tuple: (list of project detail data in the order of project_ids,
+                    list of IDs that do not exist)
+        """
+        serializer = compiled_project_detail_serializer.restrict(fields)
+        page_size = getattr(settings, 'PROJECT_IMAGES_PAGE_SIZE', 24)
+        
+        projects = ProjectDetailService._projects_queryset(serializer).filter(id__in=project_ids)
+        if serializer.includes('images'):
+            projects = projects.prefetch_related(
+                Prefetch(
+                    'images',
+                    queryset=ProjectDetailService._images_queryset()[:page_size + 1],
+                    to_attr='first_images'
+                )
             )
+        
+        details = {
+            project.id: ProjectDetailService._serialize_detail(
+                serializer, project, getattr(project, 'first_images', None), page_size
+            )
+            for project in projects
+        }
+        found = [details[project_id] for project_id in project_ids if project_id in details]
+        missing = [project_id for project_id in project_ids if project_id not in details]
+        return found, missing
+    
+    @staticmethod
+    def _projects_queryset(serializer):
+        """Project queryset loading only what the (restricted) detail serializer reads"""
+        # images are fetched (paged) by the service itself
+        return serializer.plan(provided=('images',)).apply(Project.objects.all())
+    
+    @staticmethod
+    def _images_queryset(serializer=compiled_image_serializer):
+        """Images in IMAGE_ORDERING, loading only what the image serializer reads"""
+        # project for prefetching
+        queryset = serializer.plan().apply(Image.objects.all(), extra_columns=('project',))
+        return CursorPagination.order_by(queryset, ProjectDetailService.IMAGE_ORDERING)
+    
+    @staticmethod
+    def _serialize_detail(serializer, project, images, page_size):
+        """
+        Serialize a project with the first page of its images
+        
+        Args:
+            serializer (CompiledSerializer): Detail serializer (possibly restricted)
+            project (Project): Project instance
+            images (list): First page_size + 1 images in IMAGE_ORDERING,
+                           or None when `images` is not selected
+            page_size (int): Images per page
+        
+        Returns:
+            dict: Project detail data
+        """
+        if images is None:
+            return serializer.serialize(project)
+        
+        images, has_next, next_cursor = CursorPagination.split_page(
+            images, page_size, ProjectDetailService.IMAGE_ORDERING
         )
         
-        # Get project or raise 404
-        project = get_object_or_404(queryset, id=project_id)
+        # Serialize data (compiled fast path)
+        project_data = serializer.serialize_with(
+            project, images=compiled_image_serializer.data(images, many=True)
+        )
+        project_data['images_pagination'] = {
+            'page_size': page_size,
+            'has_next': has_next,
+            'next_cursor': next_cursor,
+        }
+        
+        return project_data
+    
+    @staticmethod
+    def get_project_images(project_id, page_size, cursor=None, fields=None):
+        """
+        Get one page of a project's images (keyset pagination, in IMAGE_ORDERING)
+        
+        Args:
+            project_id (int): ID of the project
+            page_size (int): Images per page
+            cursor (str): Optional `next_cursor` of the previous page
+            fields (tuple): Optional sparse fieldset (image serializer field names)
         
-        # Serialize data
-        serializer = ProjectDetailSerializer(project)
+        Returns:
+            dict: Contains images list and cursor pagination info
         
-        return serializer.data
-
+        Raises:
+            Http404: If the project does not exist
+            InvalidCursorError: If the cursor is malformed or issued for another ordering
+        """
+        if not Project.objects.filter(id=project_id).exists():
+            raise Http404('Project not found')
+        return ProjectDetailService._get_images_page(
+            project_id, page_size, cursor, compiled_image_serializer.restrict(fields)
+        )
+    
+    @staticmethod
+    def _get_images_page(project_id, page_size, cursor=None, serializer=compiled_image_serializer):
+        ordering = ProjectDetailService.IMAGE_ORDERING
+        queryset = ProjectDetailService._images_queryset(serializer).filter(project_id=project_id)
+        
+        if cursor:
+            value, last_id = CursorPagination.decode(cursor, ordering, Image)
+            queryset = CursorPagination.seek(queryset, ordering, value, last_id)
+        
+        # Fetch one extra row to know whether a next page exists
+        images, has_next, next_cursor = CursorPagination.split_page(
+            list(queryset[:page_size + 1]), page_size, ordering
+        )
+        
+        return {
+            'images': serializer.data(images, many=True),
+            'page_size': page_size,
+            'has_next': has_next,
+            'next_cursor': next_cursor,
+        }
@@ -0,0 +1,201 @@
+import gzip
+import hashlib
+import json
+from django.conf import settings
+from django.core.cache import cache, caches
+from .. import metrics
+from ..models import CatalogVersion
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+class ResponseCache:
+    """
+    Cache of API response payloads keyed by normalized query parameters
+
+    Every key embeds the current catalog version, so any write to Designer, Project
+    or Image (which bumps the version) makes all earlier entries unreachable at once.
+    The TTL only bounds how long unreachable entries occupy memory.
+    """
+
+    PREFIX = 'api_response'
+
+    @staticmethod
+    def tag(response, key):
+        """
+        Record the cache key a response was built for
+
+        CompressedResponseCacheMiddleware stores the compressed variants of the
+        response under the same key.
+
+        Args:
+            response: HttpResponse (or DRF Response)
+            key (str): ResponseCache key of the payload
+
+        Returns:
+            The response
+        """
+        response.response_cache_key = key
+        return response
+
+    @staticmethod
+    def normalize_params(params):
+        """
+        Normalize query parameters: drop empty values, strip whitespace, sort keys
+
+        Args:
+            params (dict): Parameters that affect the response
+
+        Returns:
+            dict: Normalized parameters
+        """
+        normalized = {}
+        for key, value in (params or {}).items():
+            if value is None:
+                continue
+            value = str(value).strip()
+            if value:
+                normalized[key] = value
+        return dict(sorted(normalized.items()))
+
+    @staticmethod
+    def key(namespace, params, version=None):
+        """
+        Build the cache key for a response
+
+        Args:
+            namespace (str): Endpoint name (e.g. 'designer-listing')
+            params (dict): Parameters that affect the response
+            version (int): Catalog version (default: current)
+
+        Returns:
+            str: Cache key
+        """
+        if version is None:
+            version, _ = CatalogVersion.current()
+        digest = hashlib.sha1(
+            json.dumps(ResponseCache.normalize_params(params)).encode('utf-8')
+        ).hexdigest()
+        return f'{ResponseCache.PREFIX}:{namespace}:v{version}:{digest}'
+
+    @staticmethod
+    def get(key):
+        """Get a cached payload, or None"""
+        if not getattr(settings, 'API_RESPONSE_CACHE_ENABLED', True):
+            return None
+        data = cache.get(key)
+        metrics.cache_lookup('response', data is not None)
+        return data
+
+    @staticmethod
+    def set(key, data):
+        """Store a payload"""
+        if not getattr(settings, 'API_RESPONSE_CACHE_ENABLED', True):
+            return
+        cache.set(key, data, getattr(settings, 'API_RESPONSE_CACHE_TTL', 86400))
+
+    @staticmethod
+    async def aget(key):
+        """Async get"""
+        if not getattr(settings, 'API_RESPONSE_CACHE_ENABLED', True):
+            return None
+        data = await cache.aget(key)
+        metrics.cache_lookup('response', data is not None)
+        return data
+
+    @staticmethod
+    async def aset(key, data):
+        """Async set"""
+        if not getattr(settings, 'API_RESPONSE_CACHE_ENABLED', True):
+            return
+        await cache.aset(key, data, getattr(settings, 'API_RESPONSE_CACHE_TTL', 86400))
+
+
+class CompressedResponseCache:
+    """
+    Compressed variants of API response bodies, compressed once and cached
+
+    Variants live in their own cache alias (CACHES['compressed']) under the key
+    identifying the response: its ResponseCache key, or the path and strong ETag for
+    views without one (the ETag embeds the object's updated_at, the catalog version
+    and the query). Both change whenever the body does, so variants are never stale,
+    and a hit costs one cache lookup instead of a compression pass. Responses with
+    neither key are compressed on every request.
+    """
+
+    PREFIX = 'api_compressed'
+    ALIAS = 'compressed'
+
+    # Preference order when the client accepts several encodings equally
+    ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+    # Variants are built once per body, so favour ratio over speed
+    GZIP_LEVEL = 9
+    BROTLI_QUALITY = 9
+
+    @staticmethod
+    def compress(encoding, body):
+        """
+        Compress a body
+
+        Args:
+            encoding (str): 'br' or 'gzip'
+            body (bytes): Uncompressed body
+
+        Returns:
+            bytes: Compressed body
+        """
+        if encoding == 'br':
+            return brotli.compress(body, quality=CompressedResponseCache.BROTLI_QUALITY)
+        # mtime=0 keeps the bytes deterministic (same body, same variant)
+        return gzip.compress(body, compresslevel=CompressedResponseCache.GZIP_LEVEL, mtime=0)
+
+    @staticmethod
+    def key(request, response):
+        """
+        Cache key for the variants of a response
+
+        Args:
+            request: HttpRequest
+            response: HttpResponse
+
+        Returns:
+            str or None: Key, or None if the response has no stable identity
+        """
+        cache_key = getattr(response, 'response_cache_key', None)
+        if cache_key:
+            return f'{CompressedResponseCache.PREFIX}:{cache_key}'
+        etag = response.get('ETag', '')
+        if etag.startswith('"'):
+            return f'{CompressedResponseCache.PREFIX}:{request.path}:{etag}'
+        return None
+
+    @staticmethod
+    def get(key, body, encoding):
+        """
+        Get the compressed variant of a body, compressing and storing it on a miss
+
+        Args:
+            key (str): Variant key (see key()), or None to compress without caching
+            body (bytes): Uncompressed body
+            encoding (str): One of ENCODINGS
+
+        Returns:
+            tuple: (compressed bytes, True if it came from the cache)
+        """
+        if key is None:
+            return CompressedResponseCache.compress(encoding, body), False
+
+        variant_cache = caches[CompressedResponseCache.ALIAS]
+        variants = variant_cache.get(key) or {}
+        hit = encoding in variants
+        metrics.cache_lookup('compressed', hit)
+        if hit:
+            return variants[encoding], True
+
+        variants[encoding] = CompressedResponseCache.compress(encoding, body)
+        variant_cache.set(key, variants, getattr(settings, 'API_RESPONSE_CACHE_TTL', 86400))
+        return variants[encoding], False
@@ -0,0 +1,267 @@
+import re
+from django.conf import settings
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+
+# Columns covered by the designer full-text index (same set the legacy icontains search used)
+SEARCH_COLUMNS = ('business_name', 'address', 'category')
+
+
+def tokenize(term):
+    """
+    Split a search term into lower-cased word tokens
+
+    Only word characters are kept, so tokens are safe to embed in every backend's
+    full-text query syntax.
+
+    Args:
+        term (str): Raw search term
+
+    Returns:
+        list: Tokens
+    """
+    return re.findall(r'\w+', (term or '').lower())
+
+
+class IContainsSearchBackend:
+    """Legacy search: OR of icontains predicates (full table scan, no ranking)"""
+
+    vendor = None
+
+    def install(self, connection):
+        """Nothing to install"""
+
+    def uninstall(self, connection):
+        """Nothing to uninstall"""
+
+    def filter(self, queryset, term):
+        """
+        Restrict a Designer queryset to rows matching the search term
+
+        Args:
+            queryset (QuerySet): Designer queryset
+            term (str): Raw search term
+
+        Returns:
+            QuerySet: Filtered queryset
+        """
+        return queryset.filter(
+            Q(business_name__icontains=term) |
+            Q(address__icontains=term) |
+            Q(category__icontains=term)
+        )
+
+    def annotate_rank(self, queryset, term):
+        """
+        Annotate `search_rank` (higher is more relevant)
+
+        Args:
+            queryset (QuerySet): Designer queryset
+            term (str): Raw search term
+
+        Returns:
+            QuerySet: Annotated queryset
+        """
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class FullTextSearchBackend(IContainsSearchBackend):
+    """
+    Base class for native full-text backends
+
+    Every token must match (as a prefix, so partially typed words still match).
+    Terms without any word token fall back to the icontains search.
+    """
+
+    def build_query(self, tokens):
+        """Build the backend-specific full-text query string from tokens"""
+        raise NotImplementedError
+
+    def match_sql(self):
+        """SQL predicate with one %s placeholder for the full-text query"""
+        raise NotImplementedError
+
+    def rank_sql(self):
+        """SQL expression with one %s placeholder returning relevance (higher is better)"""
+        raise NotImplementedError
+
+    def filter(self, queryset, term):
+        tokens = tokenize(term)
+        if not tokens:
+            return super().filter(queryset, term)
+        return queryset.filter(
+            RawSQL(self.match_sql(), [self.build_query(tokens)], output_field=BooleanField())
+        )
+
+    def annotate_rank(self, queryset, term):
+        tokens = tokenize(term)
+        if not tokens:
+            return super().annotate_rank(queryset, term)
+        return queryset.annotate(
+            search_rank=RawSQL(self.rank_sql(), [self.build_query(tokens)], output_field=FloatField())
+        )
+
+
+class PostgresSearchBackend(FullTextSearchBackend):
+    """PostgreSQL: GIN index over a tsvector expression, ranked with ts_rank"""
+
+    vendor = 'postgresql'
+    index_name = 'designers_search_gin'
+    vector_sql = (
+        "to_tsvector('simple', "
+        "coalesce(\"designers\".\"business_name\", '') || ' ' || "
+        "coalesce(\"designers\".\"address\", '') || ' ' || "
+        "coalesce(\"designers\".\"category\", ''))"
+    )
+
+    def install(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {self.index_name} '
+                f'ON "designers" USING GIN (({self.vector_sql}))'
+            )
+
+    def uninstall(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX IF EXISTS {self.index_name}')
+
+    def build_query(self, tokens):
+        return ' & '.join(f'{token}:*' for token in tokens)
+
+    def match_sql(self):
+        return f"{self.vector_sql} @@ to_tsquery('simple', %s)"
+
+    def rank_sql(self):
+        return f"ts_rank({self.vector_sql}, to_tsquery('simple', %s))"
+
+
+class MySQLSearchBackend(FullTextSearchBackend):
+    """MySQL: InnoDB FULLTEXT index, boolean-mode MATCH ... AGAINST"""
+
+    vendor = 'mysql'
+    index_name = 'designers_search_fulltext'
+    match_columns = ', '.join(f'`designers`.`{column}`' for column in SEARCH_COLUMNS)
+
+    def install(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT COUNT(*) FROM information_schema.STATISTICS '
+                'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s',
+                ['designers', self.index_name],
+            )
+            if cursor.fetchone()[0]:
+                return
+            cursor.execute(
+                f'ALTER TABLE `designers` ADD FULLTEXT INDEX {self.index_name} '
+                f'({", ".join(SEARCH_COLUMNS)})'
+            )
+
+    def uninstall(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE `designers` DROP INDEX {self.index_name}')
+
+    def build_query(self, tokens):
+        return ' '.join(f'+{token}*' for token in tokens)
+
+    def match_sql(self):
+        return f'MATCH ({self.match_columns}) AGAINST (%s IN BOOLEAN MODE)'
+
+    def rank_sql(self):
+        return self.match_sql()
+
+
+class SQLiteSearchBackend(FullTextSearchBackend):
+    """
+    SQLite: external-content FTS5 table kept in sync by triggers, ranked with bm25
+
+    SQLite rebuilds a table to apply most schema changes, which drops its triggers,
+    so `install` is idempotent and also runs after every migrate (see apps.py).
+    """
+
+    vendor = 'sqlite'
+    fts_table = 'designers_fts'
+    triggers = ('designers_fts_ai', 'designers_fts_ad', 'designers_fts_au')
+
+    def install(self, connection):
+        columns = ', '.join(SEARCH_COLUMNS)
+        new_values = ', '.join(f'new.{column}' for column in SEARCH_COLUMNS)
+        old_values = ', '.join(f'old.{column}' for column in SEARCH_COLUMNS)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'designers'"
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            if all(trigger in existing for trigger in self.triggers):
+                return
+
+            cursor.execute(
+                f'CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5('
+                f"{columns}, content='designers', content_rowid='id')"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS designers_fts_ai AFTER INSERT ON designers BEGIN '
+                f'INSERT INTO {self.fts_table}(rowid, {columns}) VALUES (new.id, {new_values}); END'
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS designers_fts_ad AFTER DELETE ON designers BEGIN '
+                f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) "
+                f"VALUES ('delete', old.id, {old_values}); END"
+            )
+            cursor.execute(
+                f'CREATE TRIGGER IF NOT EXISTS designers_fts_au AFTER UPDATE ON designers BEGIN '
+                f"INSERT INTO {self.fts_table}({self.fts_table}, rowid, {columns}) "
+                f"VALUES ('delete', old.id, {old_values}); "
+                f'INSERT INTO {self.fts_table}(rowid, {columns}) VALUES (new.id, {new_values}); END'
+            )
+            # Re-index rows written while the triggers were missing
+            cursor.execute(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('rebuild')")
+
+    def uninstall(self, connection):
+        with connection.cursor() as cursor:
+            for trigger in self.triggers:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+            cursor.execute(f'DROP TABLE IF EXISTS {self.fts_table}')
+
+    def build_query(self, tokens):
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def match_sql(self):
+        return (
+            f'"designers"."id" IN '
+            f'(SELECT rowid FROM {self.fts_table} WHERE {self.fts_table} MATCH %s)'
+        )
+
+    def rank_sql(self):
+        # bm25() is lower-is-better, negate it so every backend ranks higher-is-better
+        return (
+            f'(SELECT -bm25({self.fts_table}) FROM {self.fts_table} '
+            f'WHERE {self.fts_table} MATCH %s AND rowid = "designers"."id")'
+        )
+
+
+BACKENDS = {
+    backend.vendor: backend
+    for backend in (PostgresSearchBackend, MySQLSearchBackend, SQLiteSearchBackend)
+}
+
+
+def get_search_backend(connection=None):
+    """
+    Pick the search backend for a database connection
+
+    DESIGNER_SEARCH_BACKEND = 'auto' (default) uses the native full-text index of the
+    connection's vendor; 'icontains' forces the legacy substring search.
+
+    Args:
+        connection: Database connection (default: the 'default' connection)
+
+    Returns:
+        IContainsSearchBackend: Search backend instance
+    """
+    connection = connection or connections['default']
+    if getattr(settings, 'DESIGNER_SEARCH_BACKEND', 'auto') == 'icontains':
+        return IContainsSearchBackend()
+    return BACKENDS.get(connection.vendor, IContainsSearchBackend)()
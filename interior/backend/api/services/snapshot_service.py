@@ -0,0 +1,187 @@
+import gzip
+import os
+from pathlib import Path
+from django.conf import settings
+from django.http import Http404
+from ..models import ApiDocument, Designer, Project
+from ..renderers import FastJSONRenderer
+from .designer_service import DesignerService
+from .document_store_service import DocumentStoreService
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+class SnapshotService:
+    """
+    Static export of the read API for nginx
+
+    Every unfiltered listing page, designer detail and project detail is written
+    as a JSON file (plus .gz / .br siblings for gzip_static / brotli_static) under
+    API_SNAPSHOT_ROOT, mirroring the URL it answers:
+
+        api/designers/pages/<page_size>/<page>.json    /api/designers/?page=&page_size=
+        api/designers/<id>.json                        /api/designers/<id>/
+        api/projects/<id>.json                         /api/projects/<id>/
+
+    Files are only rewritten when their bytes change (atomically, via rename), so
+    unchanged files keep their mtime and nginx's ETag / Last-Modified stay valid.
+    """
+
+    LISTING = 'listing'
+    KINDS = (LISTING, ApiDocument.KIND_DESIGNER, ApiDocument.KIND_PROJECT)
+
+    @staticmethod
+    def root():
+        return Path(getattr(settings, 'API_SNAPSHOT_ROOT', settings.BASE_DIR / 'api-snapshot'))
+
+    @staticmethod
+    def page_sizes():
+        return list(getattr(settings, 'API_SNAPSHOT_PAGE_SIZES', [20]))
+
+    @staticmethod
+    def listing_path(page_size, page):
+        return f'api/designers/pages/{page_size}/{page}.json'
+
+    @staticmethod
+    def detail_path(kind, object_id):
+        return f'api/{kind}s/{object_id}.json'
+
+    @staticmethod
+    def keys(kind):
+        """
+        Everything to export for one kind
+
+        Args:
+            kind (str): LISTING, 'designer' or 'project'
+
+        Returns:
+            list: (page_size, page) pairs for listings, IDs for details
+        """
+        if kind == SnapshotService.LISTING:
+            total = Designer.objects.count()
+            return [
+                (page_size, page)
+                for page_size in SnapshotService.page_sizes()
+                # An empty catalog still answers page 1
+                for page in range(1, max(1, (total + page_size - 1) // page_size) + 1)
+            ]
+        model = Designer if kind == ApiDocument.KIND_DESIGNER else Project
+        return list(model.objects.order_by('id').values_list('id', flat=True))
+
+    @staticmethod
+    def render(kind, key):
+        """
+        Render one file
+
+        Args:
+            kind (str): LISTING, 'designer' or 'project'
+            key: (page_size, page) for listings, the object ID for details
+
+        Returns:
+            tuple: (relative path, JSON body bytes)
+        """
+        if kind == SnapshotService.LISTING:
+            page_size, page = key
+            result = DesignerService.get_designers_list(page=page, page_size=page_size)
+            body = FastJSONRenderer().render(DesignerService.build_listing_payload(result))
+            return SnapshotService.listing_path(page_size, page), body
+
+        # Materialized documents hold exactly the live bytes; render the rest
+        body = DocumentStoreService.get_body(kind, key) or DocumentStoreService.render(kind, key)
+        return SnapshotService.detail_path(kind, key), body
+
+    @staticmethod
+    def _replace(path, body):
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def write(root, relative_path, body):
+        """
+        Write a file and its precompressed siblings if the content changed
+
+        Args:
+            root (Path): Snapshot root
+            relative_path (str): Path below the root
+            body (bytes): JSON body
+
+        Returns:
+            bool: True if anything was (re)written
+        """
+        path = Path(root) / relative_path
+        gz_path = path.with_name(path.name + '.gz')
+        br_path = path.with_name(path.name + '.br')
+
+        unchanged = path.exists() and path.read_bytes() == body
+        if unchanged and gz_path.exists() and (brotli is None or br_path.exists()):
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # mtime=0 keeps the gzip bytes deterministic
+        SnapshotService._replace(gz_path, gzip.compress(body, compresslevel=9, mtime=0))
+        if brotli is not None:
+            SnapshotService._replace(br_path, brotli.compress(body))
+        # The plain file goes last: its presence marks the set as complete
+        if not unchanged:
+            SnapshotService._replace(path, body)
+        return True
+
+    @staticmethod
+    def export(root, kind, keys):
+        """
+        Export a batch of files (runs in worker processes)
+
+        Args:
+            root (str): Snapshot root
+            kind (str): LISTING, 'designer' or 'project'
+            keys (list): Keys from `keys(kind)`
+
+        Returns:
+            tuple: (relative paths exported, number of files rewritten)
+        """
+        paths = []
+        written = 0
+        for key in keys:
+            try:
+                relative_path, body = SnapshotService.render(kind, key)
+            except Http404:
+                # Deleted since the key list was read: stale cleanup removes its file
+                continue
+            paths.append(relative_path)
+            written += int(SnapshotService.write(root, relative_path, body))
+        return paths, written
+
+    @staticmethod
+    def remove_stale(root, keep):
+        """
+        Delete exported files that are no longer part of the snapshot
+
+        Args:
+            root (Path): Snapshot root
+            keep (set): Relative paths of the JSON files to keep
+
+        Returns:
+            int: Number of JSON files removed
+        """
+        root = Path(root)
+        api_root = root / 'api'
+        if not api_root.exists():
+            return 0
+
+        removed = 0
+        for path in list(api_root.rglob('*')):
+            if not path.is_file():
+                continue
+            relative_path = path.relative_to(root).as_posix()
+            for suffix in ('.gz', '.br', ''):
+                if relative_path.endswith('.json' + suffix):
+                    base = relative_path[:len(relative_path) - len(suffix)]
+                    if base not in keep:
+                        path.unlink()
+                        removed += int(not suffix)
+                    break
+        return removed
@@ -0,0 +1,209 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+from .models import ApiDocument, CatalogVersion, Designer, DesignerFacet, Image, Project
+from .transaction_hooks import run_once_on_commit
+
+# Set by receivers_suspended(): the catalog receivers below do nothing
+_suspended = ContextVar('api_catalog_receivers_suspended', default=False)
+
+
+@contextmanager
+def receivers_suspended():
+    """
+    Skip the catalog receivers for writes made inside the block
+
+    For bulk writers (the scraper), which would otherwise pay a stats refresh, a facet
+    update, a catalog bump and a document invalidation per row. They call
+    refresh_designers() once for everything they wrote instead.
+    """
+    token = _suspended.set(True)
+    try:
+        yield
+    finally:
+        _suspended.reset(token)
+
+
+def _skip(raw=False):
+    """True if a receiver should do nothing (fixture loading or receivers_suspended())"""
+    return raw or _suspended.get()
+
+
+def refresh_designers(designer_ids, previous_facets):
+    """
+    Do once what the receivers skipped under receivers_suspended()
+
+    Recomputes the designers' project stats, moves their facet counts, invalidates the
+    documents of the designers and their projects, and bumps the catalog version.
+
+    Args:
+        designer_ids (iterable): Designers written, or whose projects / images were
+        previous_facets (dict): DesignerFacet.values_by_designer() read before the writes;
+                                designers missing from it are counted as new
+    """
+    designer_ids = list(designer_ids)
+    Designer.refresh_project_stats(designer_ids)
+
+    current_facets = DesignerFacet.values_by_designer(Designer.objects.filter(pk__in=designer_ids))
+    for designer_id, current in current_facets.items():
+        previous = previous_facets.get(designer_id, set())
+        if current != previous:
+            DesignerFacet.apply(added=current - previous, removed=previous - current)
+
+    from .services.document_store_service import DocumentStoreService
+
+    project_ids = list(Project.objects.filter(designer_id__in=designer_ids).values_list('id', flat=True))
+    for kind, object_ids in ((ApiDocument.KIND_DESIGNER, designer_ids), (ApiDocument.KIND_PROJECT, project_ids)):
+        run_once_on_commit(
+            ('api_documents', kind, tuple(object_ids)),
+            lambda kind=kind, object_ids=object_ids: DocumentStoreService.invalidate(kind, object_ids),
+        )
+    CatalogVersion.bump()
+
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using, **kwargs):
+    """
+    Re-install the designer full-text index after migrations
+
+    SQLite rebuilds a table to apply most column changes, which silently drops the
+    FTS5 sync triggers. Installing is idempotent on every backend.
+    """
+    if sender.name != 'api':
+        return
+
+    from django.db import connections
+    from django.db.migrations.recorder import MigrationRecorder
+    from .services.search_backend import BACKENDS
+
+    connection = connections[using]
+    backend = BACKENDS.get(connection.vendor)
+    if backend is None:
+        return
+
+    # Only once the search index migration has been applied (not on a rollback past it)
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ('api', '0002_designer_search_index') in applied:
+        backend().install(connection)
+
+
+@receiver(pre_save, sender=Project)
+def remember_previous_designer(sender, instance, raw=False, **kwargs):
+    """Remember the designer a project belonged to, so a move refreshes both designers"""
+    instance._previous_designer_id = None
+    if instance.pk and not _skip(raw):
+        instance._previous_designer_id = (
+            Project.objects.filter(pk=instance.pk).values_list('designer_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Project)
+def refresh_designer_stats_on_save(sender, instance, raw=False, **kwargs):
+    """Keep Designer.project_count / featured_image in sync when a project is written"""
+    if _skip(raw):
+        return
+    designer_ids = {instance.designer_id, getattr(instance, '_previous_designer_id', None)}
+    designer_ids.discard(None)
+    Designer.refresh_project_stats(designer_ids)
+
+
+@receiver(post_delete, sender=Project)
+def refresh_designer_stats_on_delete(sender, instance, **kwargs):
+    """Keep Designer.project_count / featured_image in sync when a project is deleted"""
+    if _skip():
+        return
+    Designer.refresh_project_stats([instance.designer_id])
+
+
+@receiver(pre_save, sender=Designer)
+def remember_previous_facets(sender, instance, raw=False, using=None, update_fields=None, **kwargs):
+    """Remember the facet values a designer was counted under before this save"""
+    instance._previous_facets = set()
+    if _skip(raw) or not instance.pk:
+        return
+    columns = list(DesignerFacet.DESIGNER_FIELDS.values())
+    if update_fields is not None and not set(columns) & set(update_fields):
+        # None of the facet columns is written
+        instance._previous_facets = None
+        return
+    # Read from the database being written (a replica may lag behind)
+    row = Designer.objects.using(using).filter(pk=instance.pk).values(*columns).first()
+    if row is not None:
+        instance._previous_facets = DesignerFacet.values_of(row)
+
+
+@receiver(post_save, sender=Designer)
+def update_facets_on_save(sender, instance, raw=False, **kwargs):
+    """Move a designer's facet counts from its previous values to its current ones"""
+    previous = getattr(instance, '_previous_facets', set())
+    if _skip(raw) or previous is None:
+        return
+    current = DesignerFacet.values_of(instance)
+    if current != previous:
+        DesignerFacet.apply(added=current - previous, removed=previous - current, using=kwargs.get('using'))
+
+
+@receiver(post_delete, sender=Designer)
+def update_facets_on_delete(sender, instance, **kwargs):
+    """Drop a deleted designer from its facet counts"""
+    if _skip():
+        return
+    DesignerFacet.apply(removed=DesignerFacet.values_of(instance), using=kwargs.get('using'))
+
+
+@receiver(post_save, sender=Designer)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Image)
+@receiver(post_delete, sender=Designer)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Image)
+def bump_catalog_version(sender, raw=False, **kwargs):
+    """Invalidate cached API responses whenever catalog rows change"""
+    if _skip(raw):
+        return
+    CatalogVersion.bump()
+
+
+def _invalidate_documents(kind, *object_ids):
+    """Drop materialized detail documents (once per transaction and object)"""
+    from .services.document_store_service import DocumentStoreService
+
+    for object_id in object_ids:
+        if object_id is not None:
+            run_once_on_commit(
+                ('api_document', kind, object_id),
+                lambda object_id=object_id: DocumentStoreService.invalidate(kind, [object_id]),
+            )
+
+
+@receiver(post_save, sender=Designer)
+@receiver(post_delete, sender=Designer)
+def invalidate_designer_document(sender, instance, raw=False, **kwargs):
+    """A designer's detail document embeds its own fields"""
+    if _skip(raw):
+        return
+    _invalidate_documents(ApiDocument.KIND_DESIGNER, instance.pk)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_documents(sender, instance, raw=False, **kwargs):
+    """A project appears in its own document and in its designer's (and former designer's) document"""
+    if _skip(raw):
+        return
+    _invalidate_documents(ApiDocument.KIND_PROJECT, instance.pk)
+    _invalidate_documents(
+        ApiDocument.KIND_DESIGNER,
+        instance.designer_id,
+        getattr(instance, '_previous_designer_id', None),
+    )
+
+
+@receiver(post_save, sender=Image)
+@receiver(post_delete, sender=Image)
+def invalidate_image_document(sender, instance, raw=False, **kwargs):
+    """Images appear in their project's document"""
+    if _skip(raw):
+        return
+    _invalidate_documents(ApiDocument.KIND_PROJECT, instance.project_id)
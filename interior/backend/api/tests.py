@@ -1,4 +1,1085 @@
-from django.test import TestCase
+import gzip
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from .db.instrumentation import track_queries
+from .db.router import ReplicaRouter, mark_unavailable, replica_reads, replica_status, replicas
+from .middleware import ReplicaRoutingMiddleware
+from .models import ApiDocument, CatalogVersion, Designer, DesignerFacet, Image, Project
+from .serializers import (
+    DesignerDetailSerializer,
+    DesignerListingSerializer,
+    ProjectDetailSerializer,
+    compiled_designer_detail_serializer,
+    compiled_designer_listing_serializer,
+    compiled_project_detail_serializer,
+)
+from .serializers.compiled import CACHE_MAXSIZE, CompiledSerializer
+from .services.count_service import CountService
+from .services.designer_service import DesignerService
+from .services.document_store_service import DocumentStoreService
+from .services.pagination import CursorPagination, InvalidCursorError
+from .services.response_cache import CompressedResponseCache
+from .services.search_backend import (
+    IContainsSearchBackend,
+    SQLiteSearchBackend,
+    get_search_backend,
+    tokenize,
+)
+from .signals import receivers_suspended, refresh_designers
+from .view.designer_detail_view import designer_detail_async
+from .view.designer_view import designer_listing, designer_listing_async
+from .view.project_detail_view import project_detail_async
 
-# Create your tests here.
 
+def make_catalog(designers=5, projects=3, images=2):
+    """Designers with projects and images (saved through the ORM, so signals run)"""
+    created = []
+    for d in range(designers):
+        designer = Designer.objects.create(
+            business_name=f'Studio {d}',
+            category='Interior Designer' if d % 2 else 'Architect',
+            address=f'{d}, MG Road, Pune, Maharashtra 411001',
+            typical_job_cost='₹2,00,000 - ₹5,00,000' if d % 2 else None,
+            about_us='Modern homes and kitchens',
+        )
+        for p in range(projects):
+            project = Project.objects.create(
+                designer=designer,
+                project_id=f'p-{designer.id}-{p}',
+                project_title=f'Project {p}',
+                image=f'https://img.example/{d}/{p}.jpg',
+            )
+            for i in range(images):
+                Image.objects.create(
+                    project=project, image_id=f'i-{i}', image_url=f'https://img.example/{d}/{p}/{i}.jpg'
+                )
+        created.append(designer)
+    return created
+
+
+# Cold caches: every request runs its full set of queries
+COLD = dict(
+    API_RESPONSE_CACHE_ENABLED=False,
+    API_DOCUMENT_STORE_ENABLED=False,
+    LISTING_COUNT_CACHE_TTL=0,
+    API_QUERY_BUDGET_ENFORCE=True,
+)
+
+
+@override_settings(**COLD)
+class QueryBudgetTests(TestCase):
+    """Every @query_budget view stays within its budget, anonymous or logged in"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog()
+        # Worst cases: more projects / images than the first embedded page
+        cls.designer = make_catalog(designers=1, projects=15, images=1)[0]
+        cls.project = cls.designer.projects.order_by('id').first()
+        Image.objects.bulk_create([
+            Image(project=cls.project, image_id=f'extra-{i}', image_url=f'https://img.example/x/{i}.jpg')
+            for i in range(30)
+        ])
+        User.objects.create_user('staff', password='secret', is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def urls(self):
+        designer_ids = ','.join(str(pk) for pk in Designer.objects.values_list('id', flat=True))
+        project_ids = ','.join(str(pk) for pk in Project.objects.values_list('id', flat=True)[:20])
+        return [
+            '/api/designers/',
+            '/api/designers/?page=2&page_size=2',
+            '/api/designers/?cursor=',
+            '/api/designers/?search=studio',
+            '/api/designers/?category=architect&ordering=name',
+            '/api/designers/?count=estimate',
+            f'/api/designers/{self.designer.id}/',
+            f'/api/designers/{self.designer.id}/projects/?cursor=',
+            f'/api/projects/{self.project.id}/',
+            f'/api/projects/{self.project.id}/images/?cursor=',
+            '/api/designers/facets/',
+            '/api/designers/facets/?search=studio',
+            f'/api/designers/batch/?ids={designer_ids}',
+            f'/api/designers/batch?ids={designer_ids}',
+            f'/api/projects/batch/?ids={project_ids}',
+            f'/api/projects/batch?ids={project_ids}',
+        ]
+
+    def assert_within_budget(self, client):
+        for url in self.urls():
+            with self.subTest(url=url):
+                budget = resolve(url.split('?')[0]).func.query_budget
+                cache.clear()
+                with track_queries() as stats:
+                    response = client.get(url)
+                self.assertEqual(response.status_code, 200, response.content[:300])
+                self.assertLessEqual(stats.budgeted_count, budget)
+
+    def test_anonymous(self):
+        self.assert_within_budget(self.client)
+
+    def test_logged_in(self):
+        # Session and user lookups are counted, but not charged to the budget
+        self.client.login(username='staff', password='secret')
+        self.assert_within_budget(self.client)
+        with track_queries() as stats:
+            self.client.get('/api/designers/')
+        self.assertGreater(stats.excluded, 0)
+
+    def test_overrun_fails_the_view_when_enforced(self):
+        original = designer_listing.query_budget
+        designer_listing.query_budget = 1
+        try:
+            with self.assertLogs('api.middleware', 'WARNING'):
+                response = self.client.get('/api/designers/')
+            self.assertEqual(response.status_code, 500)
+            self.assertIn("exceeds the view's budget of 1", response.json()['error'])
+
+            # Not enforced: logged only, the response is served as built
+            with override_settings(API_QUERY_BUDGET_ENFORCE=False), self.assertLogs('api.middleware', 'WARNING'):
+                response = self.client.get('/api/designers/')
+            self.assertEqual(response.status_code, 200)
+        finally:
+            designer_listing.query_budget = original
+
+
+@override_settings(**COLD)
+class AsyncQueryBudgetTests(TransactionTestCase):
+    """The async views (API_ASYNC_VIEWS) stay within their budgets
+
+    A TransactionTestCase: the async listing counts on a worker thread's own
+    connection, which must see committed rows.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.designer = make_catalog(designers=3, projects=15, images=1)[0]
+        self.project = self.designer.projects.order_by('id').first()
+
+    def test_async_views(self):
+        factory = RequestFactory()
+        designer, project = self.designer, self.project
+        cases = [
+            (designer_listing_async, '/api/designers/', {}),
+            (designer_detail_async, f'/api/designers/{designer.id}/', {'designer_id': designer.id}),
+            (project_detail_async, f'/api/projects/{project.id}/', {'project_id': project.id}),
+        ]
+        for view, url, kwargs in cases:
+            with self.subTest(url=url):
+                with track_queries() as stats:
+                    response = async_to_sync(view)(factory.get(url), **kwargs)
+                self.assertEqual(response.status_code, 200, response.content[:300])
+                self.assertLessEqual(stats.budgeted_count, view.query_budget)
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False)
+class SearchBackendTests(TestCase):
+    """The full-text search matches prefixes of every word, stays in sync with writes and ranks matches"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kitchens = Designer.objects.create(
+            business_name='Kitchen Kraft', category='Kitchen Designer',
+            address='4, Kitchen Lane, Pune, Maharashtra 411001',
+        )
+        cls.studio = Designer.objects.create(
+            business_name='Studio Nine', category='Interior Designer',
+            address='7, Kitchen Lane, Pune, Maharashtra 411001',
+        )
+        cls.architect = Designer.objects.create(
+            business_name='Studio Arc', category='Architect',
+            address='2, MG Road, Mumbai, Maharashtra 400001',
+        )
+
+    def search(self, term, **params):
+        body = self.client.get('/api/designers/', {'search': term, **params}).json()
+        return [designer['id'] for designer in body['data']]
+
+    def test_backend_follows_the_database_vendor(self):
+        self.assertIsInstance(get_search_backend(connection), SQLiteSearchBackend)
+        with override_settings(DESIGNER_SEARCH_BACKEND='icontains'):
+            self.assertIs(type(get_search_backend(connection)), IContainsSearchBackend)
+
+    def test_prefixes_of_every_word_must_match(self):
+        self.assertEqual(tokenize('Studio, ARC!'), ['studio', 'arc'])
+        self.assertCountEqual(self.search('stud'), [self.studio.id, self.architect.id])
+        self.assertEqual(self.search('stud arch'), [self.architect.id])
+        self.assertEqual(self.search('mumbai kitchen'), [])
+
+    def test_term_without_words_falls_back_to_icontains(self):
+        self.assertEqual(self.search('&'), [])
+        self.assertCountEqual(self.search(','), Designer.objects.values_list('id', flat=True))
+
+    def test_relevance_orders_by_rank(self):
+        # Kitchen Kraft matches in every column, Studio Nine only in its address
+        self.assertEqual(self.search('kitchen'), [self.kitchens.id, self.studio.id])
+        self.assertEqual(self.search('kitchen', ordering='-id'), [self.studio.id, self.kitchens.id])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.architect.business_name = 'Blueprint Works'
+        self.architect.save()
+        self.assertEqual(self.search('blueprint'), [self.architect.id])
+        self.assertEqual(self.search('studio'), [self.studio.id])
+
+        self.studio.delete()
+        self.assertEqual(self.search('studio'), [])
+        self.assertEqual(self.search('kitchen'), [self.kitchens.id])
+
+    def test_install_reindexes_rows_written_without_triggers(self):
+        backend = SQLiteSearchBackend()
+        with connection.cursor() as cursor:
+            for trigger in backend.triggers:
+                cursor.execute(f'DROP TRIGGER {trigger}')
+        missed = Designer.objects.create(business_name='Terracotta House', category='Architect')
+        self.assertEqual(self.search('terracotta'), [])
+
+        backend.install(connection)
+        backend.install(connection)
+        self.assertEqual(self.search('terracotta'), [missed.id])
+
+
+@override_settings(API_DOCUMENT_STORE_ENABLED=True)
+class DocumentStoreTests(TestCase):
+    """Materialized documents are never left stale by a build racing a write"""
+
+    def setUp(self):
+        self.designer = make_catalog(designers=1)[0]
+        self.kind = ApiDocument.KIND_DESIGNER
+
+    def build_racing_write(self):
+        """Build, with the designer renamed (and invalidated) between render and write"""
+        render = DocumentStoreService.render
+
+        def render_then_write(kind, object_id):
+            body = render(kind, object_id)
+            Designer.objects.filter(id=object_id).update(business_name='Renamed')
+            DocumentStoreService.invalidate(kind, [object_id])
+            return body
+
+        with mock.patch.object(DocumentStoreService, 'render', side_effect=render_then_write):
+            return DocumentStoreService.build(self.kind, self.designer.id)
+
+    def test_build_and_invalidate(self):
+        self.assertTrue(DocumentStoreService.build(self.kind, self.designer.id))
+        self.assertIn(b'Studio 0', DocumentStoreService.get_body(self.kind, self.designer.id))
+        self.assertNotIn(self.designer.id, DocumentStoreService.missing_ids(self.kind))
+
+        DocumentStoreService.invalidate(self.kind, [self.designer.id])
+        self.assertIsNone(DocumentStoreService.get_body(self.kind, self.designer.id))
+        self.assertIn(self.designer.id, DocumentStoreService.missing_ids(self.kind))
+
+        self.assertTrue(DocumentStoreService.build(self.kind, self.designer.id))
+        self.assertIsNotNone(DocumentStoreService.get_body(self.kind, self.designer.id))
+
+    def test_stale_build_of_existing_document_is_discarded(self):
+        DocumentStoreService.build(self.kind, self.designer.id)
+        self.assertFalse(self.build_racing_write())
+        self.assertIsNone(DocumentStoreService.get_body(self.kind, self.designer.id))
+
+    def test_stale_build_of_new_document_is_discarded(self):
+        ApiDocument.objects.all().delete()
+        self.assertFalse(self.build_racing_write())
+        self.assertIsNone(DocumentStoreService.get_body(self.kind, self.designer.id))
+
+        self.assertTrue(DocumentStoreService.build(self.kind, self.designer.id))
+        self.assertIn(b'Renamed', DocumentStoreService.get_body(self.kind, self.designer.id))
+
+
+class CompiledSerializerCacheTests(TestCase):
+    """Per-fieldset caches are bounded however many field sets clients send"""
+
+    def test_restrict_and_plan_caches_are_bounded(self):
+        compiled = CompiledSerializer(DesignerListingSerializer)
+        names = compiled.field_names
+        fieldsets = [
+            [name for bit, name in enumerate(names) if mask & (1 << bit)]
+            for mask in range(1, CACHE_MAXSIZE * 2 + 1)
+        ]
+        for fieldset in fieldsets:
+            compiled.restrict(fieldset)
+            compiled.plan(provided=fieldset)
+        self.assertEqual(len(compiled._restricted), CACHE_MAXSIZE)
+        self.assertEqual(len(compiled._plans), CACHE_MAXSIZE)
+
+        # Recently used field sets stay cached
+        self.assertIs(compiled.restrict(fieldsets[-1]), compiled.restrict(fieldsets[-1]))
+
+
+@override_settings(API_COMPRESSION_MIN_SIZE=1)
+class CompressionTests(TestCase):
+    """Compressed variants are cached in their own alias, keyed by the response's identity"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.designer = make_catalog(designers=2)[0]
+
+    def setUp(self):
+        cache.clear()
+        caches[CompressedResponseCache.ALIAS].clear()
+
+    def get(self, url):
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        return response, gzip.decompress(response.content)
+
+    def test_listing_variants_are_keyed_by_the_response_cache_key(self):
+        patcher = mock.patch.object(CompressedResponseCache, 'compress', wraps=CompressedResponseCache.compress)
+        with patcher as compress:
+            _, body = self.get('/api/designers/')
+            _, again = self.get('/api/designers/')
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(body, again)
+        self.assertEqual(body, self.client.get('/api/designers/').content)
+
+        keys = list(caches[CompressedResponseCache.ALIAS]._cache)
+        self.assertEqual(len(keys), 1)
+        self.assertIn(':api_compressed:api_response:designer-listing:', keys[0])
+
+    def test_detail_variants_are_keyed_by_path_and_etag(self):
+        url = f'/api/designers/{self.designer.id}/'
+        response, _ = self.get(url)
+        etag = response['ETag'][2:]
+        self.assertIsNotNone(caches[CompressedResponseCache.ALIAS].get(f'api_compressed:{url}:{etag}'))
+
+        # A write changes the ETag, so the old variant is not served
+        self.designer.business_name = 'Renamed'
+        self.designer.save()
+        _, body = self.get(url)
+        self.assertIn(b'Renamed', body)
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False)
+class CursorPaginationTests(TestCase):
+    """Cursor tokens round-trip, and tampered or foreign tokens are rejected with 400"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog(designers=7, projects=1, images=0)
+
+    def test_encode_decode_round_trip(self):
+        designer = Designer.objects.order_by('id').last()
+        for ordering in ('id', '-created_at', 'sort_name'):
+            with self.subTest(ordering=ordering):
+                token = CursorPagination.encode(ordering, designer)
+                value, last_id = CursorPagination.decode(token, ordering, Designer)
+                field, _ = CursorPagination.parse_ordering(ordering)
+                self.assertEqual(value, getattr(designer, field))
+                self.assertEqual(last_id, designer.id)
+
+    def test_tampered_tokens_are_rejected(self):
+        token = CursorPagination.encode('-created_at', Designer.objects.first())
+        for bad in ('not-a-cursor', token[:-4], token[::-1], 'eyJvIjoiLWNyZWF0ZWRfYXQifQ'):
+            with self.subTest(token=bad), self.assertRaises(InvalidCursorError):
+                CursorPagination.decode(bad, '-created_at', Designer)
+        # Issued for another ordering
+        with self.assertRaises(InvalidCursorError):
+            CursorPagination.decode(token, 'sort_name', Designer)
+        # Ordering key that does not parse as the field's type
+        forged = CursorPagination.encode('-created_at', Designer(id=1, created_at='yesterday'))
+        with self.assertRaises(InvalidCursorError):
+            CursorPagination.decode(forged, '-created_at', Designer)
+
+    def test_pages_cover_the_listing_once(self):
+        seen, cursor = [], ''
+        while True:
+            body = self.client.get('/api/designers/', {'cursor': cursor, 'page_size': 3}).json()
+            seen += [designer['id'] for designer in body['data']]
+            if not body['pagination']['has_next']:
+                break
+            cursor = body['pagination']['next_cursor']
+        self.assertEqual(sorted(seen), sorted(Designer.objects.values_list('id', flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        response = self.client.get('/api/designers/', {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid cursor')
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False)
+class ListingOrderingTests(TestCase):
+    """Only whitelisted orderings are accepted, each sorted with id breaking ties"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for name, cost, projects in [
+            ('Zen Interiors', '₹5,00,000', 1),
+            ('alpha studio', None, 3),
+            ('Mid Works', '₹1,00,000', 0),
+            ('Beta Homes', '₹9,00,000', 3),
+        ]:
+            designer = Designer.objects.create(business_name=name, typical_job_cost=cost)
+            for p in range(projects):
+                Project.objects.create(designer=designer, project_id=f'p-{designer.id}-{p}')
+
+    def expected(self, field):
+        """Designer ids sorted on a stored column, id in the same direction"""
+        descending = field.startswith('-')
+        rows = Designer.objects.values_list(field.lstrip('-'), 'id')
+        return [pk for _, pk in sorted(rows, reverse=descending)]
+
+    def listing_ids(self, **params):
+        response = self.client.get('/api/designers/', params)
+        self.assertEqual(response.status_code, 200, response.content[:300])
+        return [designer['id'] for designer in response.json()['data']]
+
+    def test_each_ordering_sorts_pages_and_cursors(self):
+        for ordering, field in DesignerService.ORDERINGS.items():
+            with self.subTest(ordering=ordering):
+                expected = self.expected(field)
+                self.assertEqual(self.listing_ids(ordering=ordering), expected)
+                self.assertEqual(self.listing_ids(ordering=ordering, cursor=''), expected)
+
+    def test_orderings_read_naturally(self):
+        names = dict(Designer.objects.values_list('id', 'business_name'))
+        by_name = [names[pk] for pk in self.listing_ids(ordering='name')]
+        self.assertEqual(by_name, ['alpha studio', 'Beta Homes', 'Mid Works', 'Zen Interiors'])
+        by_price = [names[pk] for pk in self.listing_ids(ordering='price')]
+        self.assertEqual(by_price, ['Mid Works', 'Zen Interiors', 'Beta Homes', 'alpha studio'])
+        most_projects = [names[pk] for pk in self.listing_ids(ordering='most_projects')]
+        self.assertEqual(most_projects[:2], ['Beta Homes', 'alpha studio'])
+
+    def test_relevance_without_search_is_by_id(self):
+        self.assertEqual(self.listing_ids(ordering='relevance'), self.expected('id'))
+        self.assertEqual(self.listing_ids(), self.expected('id'))
+
+    def test_unknown_ordering_is_a_bad_request(self):
+        for ordering in ('about_us', 'business_name', '-project_count', 'nope'):
+            with self.subTest(ordering=ordering):
+                response = self.client.get('/api/designers/', {'ordering': ordering})
+                self.assertEqual(response.status_code, 400)
+                body = response.json()
+                self.assertEqual(body['error'], 'Invalid ordering')
+                self.assertIn('most_projects', body['message'])
+
+
+def walk_cursor(client, url, first_cursor='', **params):
+    """Follow next_cursor from first_cursor to the last page, returning the ids of every page"""
+    pages, cursor = [], first_cursor
+    while True:
+        response = client.get(url, {'cursor': cursor, **params})
+        assert response.status_code == 200, response.content[:300]
+        body = response.json()
+        pages.append([item['id'] for item in body['data']])
+        if not body['pagination']['has_next']:
+            return pages
+        cursor = body['pagination']['next_cursor']
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False, API_DOCUMENT_STORE_ENABLED=False, PROJECT_IMAGES_PAGE_SIZE=3)
+class ProjectImagesPaginationTests(TestCase):
+    """A project embeds its first images; /api/projects/<id>/images/ pages through the rest in id order"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = make_catalog(designers=1, projects=1, images=7)[0].projects.get()
+        cls.image_ids = list(cls.project.images.order_by('id').values_list('id', flat=True))
+
+    def url(self):
+        return f'/api/projects/{self.project.id}/images/'
+
+    def test_detail_embeds_the_first_page(self):
+        data = self.client.get(f'/api/projects/{self.project.id}/').json()['data']
+        self.assertEqual([image['id'] for image in data['images']], self.image_ids[:3])
+        self.assertEqual(data['images_pagination']['page_size'], 3)
+        self.assertTrue(data['images_pagination']['has_next'])
+
+        # The embedded cursor continues where the detail stopped
+        pages = walk_cursor(self.client, self.url(), data['images_pagination']['next_cursor'])
+        self.assertEqual(pages, [self.image_ids[3:6], self.image_ids[6:]])
+
+    def test_pages_cover_the_images_in_id_order(self):
+        pages = walk_cursor(self.client, self.url())
+        self.assertEqual(pages, [self.image_ids[:3], self.image_ids[3:6], self.image_ids[6:]])
+        self.assertEqual(walk_cursor(self.client, self.url(), page_size=5), [self.image_ids[:5], self.image_ids[5:]])
+
+    def test_page_size_is_clamped(self):
+        for page_size, expected in (('0', 3), ('nope', 3), ('1000', 100)):
+            with self.subTest(page_size=page_size):
+                body = self.client.get(self.url(), {'page_size': page_size}).json()
+                self.assertEqual(body['pagination']['page_size'], expected)
+
+    def test_errors(self):
+        self.assertEqual(self.client.get('/api/projects/999999/images/').status_code, 404)
+        response = self.client.get(self.url(), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid cursor')
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False, API_DOCUMENT_STORE_ENABLED=False, DESIGNER_PROJECTS_PAGE_SIZE=3)
+class DesignerProjectsPaginationTests(TestCase):
+    """A designer embeds its first projects; /api/designers/<id>/projects/ pages through the rest in id order"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.designer = make_catalog(designers=1, projects=7, images=0)[0]
+        cls.project_ids = list(cls.designer.projects.order_by('id').values_list('id', flat=True))
+
+    def url(self):
+        return f'/api/designers/{self.designer.id}/projects/'
+
+    def test_detail_embeds_the_first_page(self):
+        data = self.client.get(f'/api/designers/{self.designer.id}/').json()['data']
+        self.assertEqual([project['id'] for project in data['projects']], self.project_ids[:3])
+        self.assertEqual(data['projects_pagination']['page_size'], 3)
+        self.assertTrue(data['projects_pagination']['has_next'])
+
+        # The embedded cursor continues where the detail stopped
+        pages = walk_cursor(self.client, self.url(), data['projects_pagination']['next_cursor'])
+        self.assertEqual(pages, [self.project_ids[3:6], self.project_ids[6:]])
+
+    def test_pages_cover_the_projects_in_id_order(self):
+        pages = walk_cursor(self.client, self.url())
+        self.assertEqual(pages, [self.project_ids[:3], self.project_ids[3:6], self.project_ids[6:]])
+        self.assertEqual(walk_cursor(self.client, self.url(), page_size=7), [self.project_ids])
+
+    def test_page_size_is_clamped(self):
+        for page_size, expected in (('0', 3), ('nope', 3), ('1000', 100)):
+            with self.subTest(page_size=page_size):
+                body = self.client.get(self.url(), {'page_size': page_size}).json()
+                self.assertEqual(body['pagination']['page_size'], expected)
+
+    def test_errors(self):
+        self.assertEqual(self.client.get('/api/designers/999999/projects/').status_code, 404)
+        response = self.client.get(self.url(), {'cursor': 'garbage'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Invalid cursor')
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False, LISTING_COUNT_CACHE_TTL=60)
+class CountStrategyTests(TestCase):
+    """count=exact (cached per filter set), estimate and none"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog(designers=5, projects=1, images=0)
+
+    def setUp(self):
+        cache.clear()
+
+    def pagination(self, **params):
+        return self.client.get('/api/designers/', {'page_size': 2, **params}).json()['pagination']
+
+    def test_exact_is_cached_per_filter_set(self):
+        first = self.pagination()
+        self.assertEqual((first['total'], first['count_strategy']), (5, CountService.USED_EXACT))
+        self.assertEqual(first['total_pages'], 3)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.pagination(page=2)
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql'].upper()])
+        # The payload does not tell a cached count from a fresh one
+        self.assertEqual((second['total'], second['count_strategy']), (5, CountService.USED_EXACT))
+
+        filtered = self.pagination(category='architect')
+        self.assertEqual((filtered['total'], filtered['count_strategy']), (3, CountService.USED_EXACT))
+
+    def test_estimate_falls_back_to_exact_below_the_threshold(self):
+        pagination = self.pagination(count='estimate')
+        self.assertEqual(pagination['total'], 5)
+        self.assertEqual(pagination['count_strategy'], CountService.USED_EXACT)
+
+        with mock.patch.object(CountService, 'estimate', return_value=123456):
+            pagination = self.pagination(count='estimate')
+        self.assertEqual((pagination['total'], pagination['count_strategy']), (123456, CountService.USED_ESTIMATE))
+
+    def test_none_skips_the_count(self):
+        pagination = self.pagination(count='none')
+        self.assertEqual(pagination['count_strategy'], CountService.USED_NONE)
+        self.assertIsNone(pagination['total'])
+        self.assertIsNone(pagination['total_pages'])
+        self.assertTrue(pagination['has_next'])
+        self.assertFalse(self.pagination(count='none', page=3)['has_next'])
+
+    def test_unknown_strategy_means_exact(self):
+        self.assertEqual(CountService.normalize_strategy(' ESTIMATE '), CountService.ESTIMATE)
+        self.assertEqual(CountService.normalize_strategy('bogus'), CountService.EXACT)
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False, API_DOCUMENT_STORE_ENABLED=False)
+class ConditionalGetTests(TestCase):
+    """ETag / Last-Modified validators answer repeat requests with 304 until data changes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.designer = make_catalog(designers=2)[0]
+        cls.project = cls.designer.projects.order_by('id').first()
+
+    def urls(self):
+        return [
+            '/api/designers/',
+            '/api/designers/facets/',
+            f'/api/designers/{self.designer.id}/',
+            f'/api/designers/{self.designer.id}/projects/',
+            f'/api/projects/{self.project.id}/',
+            f'/api/projects/{self.project.id}/images/',
+            f'/api/designers/batch/?ids={self.designer.id}',
+        ]
+
+    def test_matching_etag_is_not_modified(self):
+        for url in self.urls():
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('no-cache', response['Cache-Control'])
+                etag = response['ETag']
+
+                not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(not_modified.status_code, 304)
+                self.assertEqual(not_modified.content, b'')
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+    def test_representations_have_distinct_etags(self):
+        url = f'/api/designers/{self.designer.id}/'
+        full = self.client.get(url)['ETag']
+        sparse = self.client.get(url, {'fields': 'id'})['ETag']
+        self.assertNotEqual(full, sparse)
+        self.assertEqual(self.client.get(url, {'fields': 'id'}, HTTP_IF_NONE_MATCH=full).status_code, 200)
+
+    def test_write_changes_the_etag(self):
+        url = f'/api/designers/{self.designer.id}/'
+        etag = self.client.get(url)['ETag']
+        self.designer.business_name = 'Renamed'
+        self.designer.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_unknown_object_is_still_not_found(self):
+        self.assertEqual(self.client.get('/api/designers/999999/').status_code, 404)
+
+    def test_errors_carry_no_validators(self):
+        bad_requests = [
+            ('/api/designers/', {'ordering': 'nope'}),
+            ('/api/designers/', {'cursor': 'garbage'}),
+            (f'/api/designers/{self.designer.id}/', {'fields': 'nope'}),
+            (f'/api/projects/{self.project.id}/images/', {'cursor': 'garbage'}),
+        ]
+        for url, params in bad_requests:
+            with self.subTest(url=url, params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.has_header('ETag'))
+                self.assertFalse(response.has_header('Last-Modified'))
+
+        response = async_to_sync(designer_listing_async)(RequestFactory().get('/api/designers/', {'ordering': 'nope'}))
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
+
+
+class FastPathSerializerTests(TestCase):
+    """Compiled serializers produce exactly the DRF serializers' output"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog(designers=4, projects=2, images=3)
+        # Awkward values: missing optional fields, long text, unicode
+        Designer.objects.create(business_name='Ümlaut & Co', about_us='x' * 1000, category='')
+
+    def assert_same(self, compiled, drf_class, queryset):
+        objs = list(queryset)
+        self.assertEqual(compiled.serialize_many(objs), drf_class(objs, many=True).data)
+        self.assertEqual(compiled.serialize(objs[0]), drf_class(objs[0]).data)
+
+    def test_designer_listing(self):
+        self.assert_same(compiled_designer_listing_serializer, DesignerListingSerializer, Designer.objects.order_by('id'))
+
+    def test_designer_detail(self):
+        self.assert_same(compiled_designer_detail_serializer, DesignerDetailSerializer, Designer.objects.order_by('id'))
+
+    def test_project_detail(self):
+        self.assert_same(compiled_project_detail_serializer, ProjectDetailSerializer, Project.objects.order_by('id'))
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False, API_DOCUMENT_STORE_ENABLED=False, LISTING_COUNT_CACHE_TTL=0)
+    def test_responses_match_with_fast_serializers_off(self):
+        designer = Designer.objects.order_by('id').first()
+        project = designer.projects.order_by('id').first()
+        for url in ('/api/designers/', f'/api/designers/{designer.id}/', f'/api/projects/{project.id}/'):
+            with self.subTest(url=url):
+                fast = self.client.get(url).json()
+                with override_settings(API_FAST_SERIALIZERS=False):
+                    slow = self.client.get(url).json()
+                self.assertEqual(fast, slow)
+
+
+class QueryPlanTests(TestCase):
+    """Querysets planned from the serializers load everything the output needs, in a fixed number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog(designers=4, projects=2, images=3)
+
+    def assert_plan(self, compiled, drf_class, queryset):
+        expected = drf_class(list(queryset), many=True).data
+        for fields in (None, ('id',), compiled.field_names[1:3]):
+            with self.subTest(fields=fields):
+                restricted = compiled.restrict(fields)
+                rows = list(restricted.plan().apply(queryset))
+                # Deferred or missing relations would show up as extra queries here
+                with self.assertNumQueries(0):
+                    data = restricted.serialize_many(rows)
+                self.assertEqual(data, [{name: item[name] for name in restricted.field_names} for item in expected])
+
+    def test_designer_listing(self):
+        self.assert_plan(compiled_designer_listing_serializer, DesignerListingSerializer, Designer.objects.order_by('id'))
+
+    def test_designer_detail(self):
+        self.assert_plan(compiled_designer_detail_serializer, DesignerDetailSerializer, Designer.objects.order_by('id'))
+
+    def test_project_detail(self):
+        self.assert_plan(compiled_project_detail_serializer, ProjectDetailSerializer, Project.objects.order_by('id'))
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False, API_DOCUMENT_STORE_ENABLED=False)
+class FieldsetTests(TestCase):
+    """?fields= / ?exclude= select top-level fields and reject unknown names"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.designer = make_catalog(designers=2)[0]
+
+    def test_fields_and_exclude(self):
+        body = self.client.get('/api/designers/', {'fields': 'id,business_name'}).json()
+        self.assertTrue(all(list(item) == ['id', 'business_name'] for item in body['data']))
+
+        body = self.client.get(f'/api/designers/{self.designer.id}/', {'exclude': 'projects,portfolio'}).json()
+        self.assertNotIn('projects', body['data'])
+        self.assertNotIn('projects_pagination', body['data'])
+        self.assertIn('name', body['data'])
+
+    def test_order_follows_the_serializer(self):
+        body = self.client.get('/api/designers/', {'fields': 'business_name, id'}).json()
+        self.assertEqual(list(body['data'][0]), ['id', 'business_name'])
+
+    def test_invalid_fieldsets_are_bad_requests(self):
+        for params in ({'fields': 'id,password'}, {'exclude': 'nope'}, {'fields': 'id', 'exclude': 'id'}):
+            with self.subTest(params=params):
+                response = self.client.get('/api/designers/', params)
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['error'], 'Invalid fields')
+        message = self.client.get('/api/designers/', {'fields': 'password'}).json()['message']
+        self.assertIn('Unknown field(s): password', message)
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=False)
+class BatchTests(TestCase):
+    """Batch endpoints return found items in request order and list the missing ids"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.designers = make_catalog(designers=3, projects=1, images=0)
+
+    def test_missing_ids_are_reported(self):
+        first, second, _ = self.designers
+        response = self.client.get('/api/designers/batch/', {'ids': f'{second.id},999999,{first.id},{second.id}'})
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['id'] for item in body['data']], [second.id, first.id])
+        self.assertEqual(body['missing'], [999999])
+
+        body = self.client.get('/api/projects/batch/', {'ids': '999998,999999'}).json()
+        self.assertEqual((body['data'], body['missing']), ([], [999998, 999999]))
+
+    @override_settings(API_BATCH_MAX_IDS=2)
+    def test_invalid_ids_are_bad_requests(self):
+        for ids in ('', 'a,b', '0', '-1', '1,2,3'):
+            with self.subTest(ids=ids):
+                response = self.client.get('/api/designers/batch/', {'ids': ids})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['error'], 'Invalid ids')
+
+
+class DesignerFacetTests(TestCase):
+    """Facet counts follow designer creates, edits and deletes, and match a rebuild"""
+
+    def counts(self):
+        return {(row.facet, row.value): row.count for row in DesignerFacet.objects.filter(count__gt=0)}
+
+    def assert_matches_rebuild(self):
+        incremental = self.counts()
+        DesignerFacet.rebuild()
+        self.assertEqual(incremental, self.counts())
+
+    def test_increments_and_decrements(self):
+        make_catalog(designers=4, projects=0)
+        self.assertEqual(self.counts()[('category', 'Architect')], 2)
+        self.assertEqual(self.counts()[('city', 'Pune')], 4)
+        self.assert_matches_rebuild()
+
+        designer = Designer.objects.filter(category='Architect').first()
+        designer.category = 'Interior Designer'
+        designer.address = '1, Linking Road, Mumbai, Maharashtra 400050'
+        designer.save()
+        counts = self.counts()
+        self.assertEqual(counts[('category', 'Architect')], 1)
+        self.assertEqual(counts[('category', 'Interior Designer')], 3)
+        self.assertEqual((counts[('city', 'Pune')], counts[('city', 'Mumbai')]), (3, 1))
+        self.assert_matches_rebuild()
+
+        designer.delete()
+        counts = self.counts()
+        self.assertNotIn(('city', 'Mumbai'), counts)
+        self.assertEqual(counts[('category', 'Interior Designer')], 2)
+        self.assert_matches_rebuild()
+
+    def test_saves_without_facet_columns_leave_counts(self):
+        designer = make_catalog(designers=1, projects=0)[0]
+        before = self.counts()
+        designer.about_us = 'Updated'
+        designer.save(update_fields=['about_us'])
+        self.assertEqual(self.counts(), before)
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False)
+    def test_counts_match_the_listing_totals(self):
+        make_catalog(designers=4, projects=0)
+        # A category containing another one must not be counted under it
+        Designer.objects.create(
+            business_name='Greenscape', category='Landscape Architect',
+            address='9, FC Road, Mumbai, Maharashtra 400001', typical_job_cost='₹12,00,000',
+        )
+        parameters = {'category': 'category_exact', 'city': 'city', 'price': 'price'}
+        for search in (None, 'studio'):
+            facets = self.client.get('/api/designers/facets/', {'search': search} if search else {}).json()['data']
+            for facet, parameter in parameters.items():
+                for item in facets[facet]:
+                    with self.subTest(search=search, facet=facet, value=item['value']):
+                        params = {parameter: item['value'], **({'search': search} if search else {})}
+                        total = self.client.get('/api/designers/', params).json()['pagination']['total']
+                        self.assertEqual(total, item['count'])
+        self.assertEqual(
+            self.client.get('/api/designers/', {'category': 'Architect'}).json()['pagination']['total'], 3
+        )
+
+    @override_settings(API_RESPONSE_CACHE_ENABLED=False)
+    def test_endpoint(self):
+        make_catalog(designers=3, projects=0)
+        data = self.client.get('/api/designers/facets/').json()['data']
+        self.assertEqual(data['city'], [{'value': 'Pune', 'count': 3}])
+        self.assertEqual(sum(item['count'] for item in data['category']), 3)
+        self.assertEqual(sum(item['count'] for item in data['price']), 1)
+
+
+@override_settings(API_SNAPSHOT_PAGE_SIZES=[2, 20], LISTING_COUNT_CACHE_TTL=60)
+class SnapshotExportTests(TestCase):
+    """Snapshot files only change when the data does"""
+
+    @classmethod
+    def setUpTestData(cls):
+        make_catalog(designers=5, projects=1, images=1)
+
+    def export(self, root):
+        out = io.StringIO()
+        call_command('export_api_snapshot', output=root, workers=1, stdout=out)
+        return out.getvalue()
+
+    def test_reexport_writes_nothing(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache.clear()
+            self.assertIn(' 0 unchanged', self.export(root))
+            first = {path: path.read_bytes() for path in Path(root).rglob('*.json')}
+            self.assertIn('api/designers/pages/2/3.json', {p.relative_to(root).as_posix() for p in first})
+
+            # Warm count cache on the second run: the pages must not differ
+            self.assertIn(' 0 rewritten', self.export(root))
+            cache.clear()
+            self.assertIn(' 0 rewritten', self.export(root))
+            self.assertEqual(first, {path: path.read_bytes() for path in Path(root).rglob('*.json')})
+
+            Designer.objects.filter(id=Designer.objects.order_by('id').first().id).update(business_name='Renamed')
+            self.assertNotIn(' 0 rewritten', self.export(root))
+
+
+@override_settings(API_DOCUMENT_STORE_ENABLED=True)
+class BulkWriteTests(TransactionTestCase):
+    """
+    Writes under receivers_suspended() cost no per-row bookkeeping, and refresh_designers() catches up
+
+    A TransactionTestCase: the catalog bump and document invalidation run on commit.
+    """
+
+    def setUp(self):
+        self.designer, self.other = make_catalog(designers=2, projects=2, images=2)
+        self.moved = self.other.projects.order_by('id').first()
+        for designer in (self.designer, self.other):
+            DocumentStoreService.build(ApiDocument.KIND_DESIGNER, designer.id)
+
+    def scrape(self, images):
+        """What the scraper's save_to_database does for one designer"""
+        designers = Designer.objects.filter(id__in=[self.designer.id, self.other.id])
+        previous = DesignerFacet.values_by_designer(designers)
+        with CaptureQueriesContext(connection) as queries:
+            with receivers_suspended(), transaction.atomic():
+                self.designer.category = 'Landscape Architect'
+                self.designer.address = '1, Linking Road, Mumbai, Maharashtra 400050'
+                self.designer.save()
+                for project in (*self.designer.projects.all(), self.moved):
+                    project.designer = self.designer
+                    project.save()
+                    Image.objects.filter(project=project)._raw_delete(connection.alias)
+                    Image.objects.bulk_create([
+                        Image(project=project, image_id=f'n-{i}', image_url=f'https://img.example/n/{i}.jpg')
+                        for i in range(images)
+                    ])
+                refresh_designers([self.designer.id, self.other.id], previous)
+        return len(queries)
+
+    def test_refresh_matches_the_receivers(self):
+        version, _ = CatalogVersion.current()
+        self.scrape(images=3)
+
+        self.assertEqual(CatalogVersion.current()[0], version + 1)
+        self.designer.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.designer.project_count, self.other.project_count), (3, 1))
+
+        incremental = {(row.facet, row.value): row.count for row in DesignerFacet.objects.filter(count__gt=0)}
+        DesignerFacet.rebuild()
+        rebuilt = {(row.facet, row.value): row.count for row in DesignerFacet.objects.filter(count__gt=0)}
+        self.assertEqual(incremental, rebuilt)
+        self.assertIn(('city', 'Mumbai'), incremental)
+
+        for designer in (self.designer, self.other):
+            self.assertIsNone(DocumentStoreService.get_body(ApiDocument.KIND_DESIGNER, designer.id))
+        self.assertIsNone(DocumentStoreService.get_body(ApiDocument.KIND_PROJECT, self.moved.id))
+
+    def test_queries_do_not_grow_with_images(self):
+        self.scrape(images=2)
+        few = self.scrape(images=2)
+        self.assertEqual(self.scrape(images=40), few)
+
+
+@override_settings(API_RESPONSE_CACHE_ENABLED=True, LISTING_COUNT_CACHE_TTL=60)
+class ResponseCacheTests(TransactionTestCase):
+    """
+    Cached listing / facet responses are keyed on one catalog version read per request
+
+    A TransactionTestCase: writes bump the catalog version on commit.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.designer = make_catalog(designers=3, projects=1, images=0)[0]
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        version_reads = [query for query in queries if CatalogVersion._meta.db_table in query['sql']]
+        return response, len(version_reads)
+
+    def test_version_is_read_once(self):
+        for url in ('/api/designers/', '/api/designers/?category=architect', '/api/designers/facets/'):
+            with self.subTest(url=url):
+                miss, reads = self.get(url)
+                self.assertEqual((miss['X-Cache'], reads), ('MISS', 1))
+                hit, reads = self.get(url)
+                self.assertEqual((hit['X-Cache'], reads), ('HIT', 1))
+                self.assertEqual(hit.content, miss.content)
+
+    def test_write_invalidates(self):
+        self.get('/api/designers/')
+        self.designer.business_name = 'Renamed'
+        self.designer.save()
+        response, _ = self.get('/api/designers/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertIn(b'Renamed', response.content)
+
+
+class ReplicaRouterTests(TestCase):
+    """Reads inside replica_reads() go to one reachable replica; writes and everything else use the primary"""
+
+    REPLICAS = {'replica_1': 1, 'replica_2': 3}
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+        patches = [
+            mock.patch('api.db.router.replicas', return_value=self.REPLICAS),
+            mock.patch('api.middleware.replicas', return_value=self.REPLICAS),
+            mock.patch('api.db.router._connectable', side_effect=lambda alias: alias not in self.unreachable),
+            mock.patch.dict('api.db.router._unavailable', clear=True),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.unreachable = set()
+
+    def test_replicas_must_be_configured_databases(self):
+        with override_settings(DB_REPLICAS={'default': 1, 'missing': 1, 'disabled': 0}):
+            self.assertEqual(replicas(), {'default': 1})
+
+    def test_reads_outside_the_scope_use_the_primary(self):
+        self.assertIsNone(self.router.db_for_read(Designer))
+        self.assertEqual(self.router.db_for_write(Designer), 'default')
+
+    def test_scope_picks_one_replica(self):
+        with replica_reads():
+            alias = self.router.db_for_read(Designer)
+            self.assertIn(alias, self.REPLICAS)
+            self.assertEqual({self.router.db_for_read(model) for model in (Designer, Project, Image)}, {alias})
+            # Threads the request hands work to share its scope
+            self.assertEqual(async_to_sync(sync_to_async(self.router.db_for_read))(Designer), alias)
+        self.assertIsNone(self.router.db_for_read(Designer))
+
+    def test_nested_scopes_are_restored(self):
+        with replica_reads():
+            with replica_reads(primary=True):
+                self.assertIsNone(self.router.db_for_read(Designer))
+            self.assertIn(self.router.db_for_read(Designer), self.REPLICAS)
+
+    def test_reads_after_a_write_use_the_primary(self):
+        with replica_reads() as scope:
+            self.assertIsNotNone(self.router.db_for_read(Designer))
+            self.assertEqual(self.router.db_for_write(Designer), 'default')
+            self.assertTrue(scope.wrote)
+            self.assertIsNone(self.router.db_for_read(Designer))
+
+    def test_unreachable_replicas_are_skipped(self):
+        self.unreachable = {'replica_2'}
+        for _ in range(10):
+            with replica_reads():
+                self.assertEqual(self.router.db_for_read(Designer), 'replica_1')
+
+        mark_unavailable('replica_1')
+        self.assertEqual(replica_status()['replica_1'], {'weight': 1, 'available': False})
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Designer), 'default')
+
+    def test_replicas_are_not_migrated(self):
+        self.assertFalse(self.router.allow_migrate('replica_1', 'api'))
+        self.assertIsNone(self.router.allow_migrate('default', 'api'))
+
+    def test_middleware_keeps_writers_on_the_primary(self):
+        seen = []
+
+        def view(request):
+            seen.append(self.router.db_for_read(Designer))
+            if request.method == 'POST':
+                self.router.db_for_write(Designer)
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(view)
+        factory = RequestFactory()
+        response = middleware(factory.get('/api/designers/'))
+        self.assertNotIn(ReplicaRoutingMiddleware.COOKIE_NAME, response.cookies)
+        response = middleware(factory.post('/api/designers/'))
+        self.assertIn(ReplicaRoutingMiddleware.COOKIE_NAME, response.cookies)
+
+        sticky = factory.get('/api/designers/')
+        sticky.COOKIES[ReplicaRoutingMiddleware.COOKIE_NAME] = '1'
+        middleware(sticky)
+        middleware(factory.get('/admin/'))
+        self.assertIn(seen[0], self.REPLICAS)
+        self.assertEqual(seen[1:], [None, None, None])
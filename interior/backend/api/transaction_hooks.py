@@ -0,0 +1,37 @@
+"""
+Helpers for work that should run once per transaction, after it commits
+"""
+from django.db import connections, transaction
+
+
+def run_once_on_commit(key, func, using='default'):
+    """
+    Run `func` after the current transaction commits, at most once per `key`
+
+    Outside a transaction `func` runs immediately. Inside one, repeated calls with
+    the same key (e.g. one per row of a cascade delete) queue a single callback. A
+    rolled back transaction drops its on_commit callbacks, so the key is only
+    treated as pending while its callback is still queued.
+
+    Args:
+        key (hashable): Identity of the work (e.g. ('document', 'project', 42))
+        func (callable): Work to run
+        using (str): Database alias
+    """
+    connection = connections[using]
+
+    if not connection.in_atomic_block:
+        func()
+        return
+
+    pending = connection.__dict__.setdefault('_run_once_on_commit', {})
+    callback = pending.get(key)
+    if callback is not None and any(entry[1] is callback for entry in connection.run_on_commit):
+        return
+
+    def callback():
+        pending.pop(key, None)
+        func()
+
+    pending[key] = callback
+    transaction.on_commit(callback, using=using)
@@ -0,0 +1,48 @@
+"""
+Helpers for the async (ASGI) read views
+
+DRF's @api_view only wraps synchronous views, so the async views are plain Django
+views. These helpers give them the same method handling and JSON bodies as their
+DRF counterparts (FastJSONRenderer, DRF's 405 message).
+"""
+from functools import wraps
+from django.http import HttpResponse
+from rest_framework import status
+from ..renderers import FastJSONRenderer
+
+
+def json_response(payload, status=status.HTTP_200_OK, headers=None):
+    """
+    JSON response with the bytes the DRF views render
+
+    Args:
+        payload: Response data
+        status (int): HTTP status code
+        headers (dict): Extra headers
+
+    Returns:
+        HttpResponse: application/json response
+    """
+    return HttpResponse(
+        FastJSONRenderer().render(payload), content_type='application/json', status=status, headers=headers
+    )
+
+
+def async_api_view(view):
+    """
+    Allow GET / HEAD only on an async view (405 with DRF's error body otherwise)
+
+    Like @api_view, the view is exempt from CSRF checks (csrf_exempt() only wraps
+    sync views in this Django version, so the flag is set directly).
+    """
+    @wraps(view)
+    async def wrapped(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return json_response(
+                {'detail': f'Method "{request.method}" not allowed.'},
+                status=status.HTTP_405_METHOD_NOT_ALLOWED,
+                headers={'Allow': 'GET, HEAD'},
+            )
+        return await view(request, *args, **kwargs)
+    wrapped.csrf_exempt = True
+    return wrapped
@@ -0,0 +1,118 @@
+from django.conf import settings
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from ..db.instrumentation import query_budget
+from ..services.designer_detail_service import DesignerDetailService
+from ..services.project_detail_service import ProjectDetailService
+from ..serializers import compiled_designer_detail_serializer, compiled_project_detail_serializer
+from .conditional import designer_batch_conditional, project_batch_conditional
+from .fieldsets import InvalidFieldsError, invalid_fields_response, parse_fieldset
+
+
+def parse_ids(request):
+    """
+    Read the `ids` query parameter (comma-separated and/or repeated) into unique ints
+    
+    Args:
+        request: DRF request
+    
+    Returns:
+        list: IDs in request order, duplicates removed
+    
+    Raises:
+        ValueError: If an ID is not a positive integer, or none / too many are given
+    """
+    raw = ','.join(request.query_params.getlist('ids'))
+    ids = []
+    for value in raw.split(','):
+        value = value.strip()
+        if not value:
+            continue
+        if not value.isdigit() or int(value) < 1:
+            raise ValueError(f'Invalid id: {value!r}')
+        ids.append(int(value))
+    
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise ValueError('Pass at least one id, e.g. ?ids=1,2,3')
+    
+    max_ids = getattr(settings, 'API_BATCH_MAX_IDS', 200)
+    if len(ids) > max_ids:
+        raise ValueError(f'At most {max_ids} ids per request')
+    return ids
+
+
+def _batch_response(fetch, serializer, request, label):
+    try:
+        fields = parse_fieldset(request, serializer)
+    except InvalidFieldsError as e:
+        return invalid_fields_response(e)
+    
+    try:
+        ids = parse_ids(request)
+    except ValueError as e:
+        return Response({
+            'success': False,
+            'error': 'Invalid ids',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        data, missing = fetch(ids, fields=fields)
+        return Response({
+            'success': True,
+            'data': data,
+            'missing': missing
+        }, status=status.HTTP_200_OK)
+    
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e),
+            'message': f'Error fetching {label}'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@query_budget(6)
+@designer_batch_conditional
+@api_view(['GET'])
+def designer_batch(request):
+    """
+    API endpoint to get the details of several designers in one request
+    
+    Query Parameters:
+        - ids (str): Comma-separated designer IDs (at most API_BATCH_MAX_IDS)
+        - fields (str): Comma-separated fields to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
+    
+    Returns:
+        Response with designer details (same items as /api/designers/<id>/) in the
+        order requested, and the list of `missing` IDs that do not exist
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
+    """
+    return _batch_response(
+        DesignerDetailService.get_designers_batch, compiled_designer_detail_serializer, request, 'designers'
+    )
+
+
+@query_budget(5)
+@project_batch_conditional
+@api_view(['GET'])
+def project_batch(request):
+    """
+    API endpoint to get the details of several projects in one request
+    
+    Query Parameters:
+        - ids (str): Comma-separated project IDs (at most API_BATCH_MAX_IDS)
+        - fields (str): Comma-separated fields to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
+    
+    Returns:
+        Response with project details (same items as /api/projects/<id>/) in the
+        order requested, and the list of `missing` IDs that do not exist
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
+    """
+    return _batch_response(
+        ProjectDetailService.get_projects_batch, compiled_project_detail_serializer, request, 'projects'
+    )
@@ -0,0 +1,179 @@
+"""
+Conditional GET support (ETag / Last-Modified) for the read endpoints
+
+Validators are derived from the catalog version and the object's `updated_at`
+with primary-key lookups only, so `If-None-Match` / `If-Modified-Since` requests
+are answered with 304 before any heavy query or serialization runs.
+"""
+import hashlib
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import condition
+from ..models import CatalogVersion, Designer, Project
+
+
+def catalog_version(request):
+    """
+    Catalog version of a request: (version, updated_at), read once per request
+
+    The validators, the response cache key and the count cache key all use it, so
+    one response never mixes two versions.
+
+    Args:
+        request: Django or DRF request
+
+    Returns:
+        tuple: (version, updated_at)
+    """
+    # DRF's Request wraps the HttpRequest the condition decorators see
+    request = getattr(request, '_request', request)
+    if '_catalog_version' not in request.__dict__:
+        request._catalog_version = CatalogVersion.current()
+    return request._catalog_version
+
+
+def _validators(request, key, compute):
+    """Compute (etag, last_modified) once per request; both condition callbacks share it"""
+    memo = request.__dict__.setdefault('_conditional_validators', {})
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
+def _object_validators(request, model, kind, object_id):
+    def compute():
+        updated_at = model.objects.filter(pk=object_id).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            # Unknown id: let the view produce its 404
+            return None, None
+        version, catalog_updated_at = catalog_version(request)
+        etag = f'{kind}-{object_id}-{int(updated_at.timestamp() * 1000000)}-v{version}'
+        # Representations differ per query (sparse fieldsets, cursors)
+        query = request.META.get('QUERY_STRING', '')
+        if query:
+            etag += '-' + hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+        return f'"{etag}"', max(updated_at, catalog_updated_at)
+    return _validators(request, (kind, object_id), compute)
+
+
+def _query_validators(request, name):
+    """Validators for a response determined by the query string and the catalog version"""
+    def compute():
+        version, catalog_updated_at = catalog_version(request)
+        query = request.META.get('QUERY_STRING', '')
+        digest = hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+        return f'"{name}-v{version}-{digest}"', catalog_updated_at
+    return _validators(request, (name,), compute)
+
+
+def _finalize(response):
+    """
+    Keep validators on 200 / 304 responses only, and require revalidation on every use
+
+    Errors (400 for a bad cursor or ordering, 404, 500) must not carry an ETag: a
+    client would send it back and get a 304 for a request that never succeeded.
+    """
+    if response.status_code in (200, 304):
+        patch_cache_control(response, no_cache=True)
+    else:
+        for header in ('ETag', 'Last-Modified'):
+            if response.has_header(header):
+                del response[header]
+    return response
+
+
+def _conditional(etag_func, last_modified_func):
+    """Apply Django's condition() and require revalidation on every use (no-cache)"""
+    def decorator(view):
+        conditional_view = condition(etag_func=etag_func, last_modified_func=last_modified_func)(view)
+
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                _finalize(response)
+            return response
+        return wrapped
+    return decorator
+
+
+def _async_conditional(validators):
+    """
+    _conditional for async views (Django's condition() only wraps sync views)
+
+    Args:
+        validators (callable): (request, *args, **kwargs) -> (etag, last_modified);
+                               synchronous, run on the request's sync thread
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapped(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return await view(request, *args, **kwargs)
+
+            etag, last_modified = await sync_to_async(validators)(request, *args, **kwargs)
+            etag = quote_etag(etag) if etag is not None else None
+            last_modified = int(last_modified.timestamp()) if last_modified else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+
+            if last_modified and not response.has_header('Last-Modified'):
+                response.headers['Last-Modified'] = http_date(last_modified)
+            if etag:
+                response.headers.setdefault('ETag', etag)
+            return _finalize(response)
+        return wrapped
+    return decorator
+
+
+designer_detail_conditional = _conditional(
+    etag_func=lambda request, designer_id: _object_validators(request, Designer, 'designer', designer_id)[0],
+    last_modified_func=lambda request, designer_id: _object_validators(request, Designer, 'designer', designer_id)[1],
+)
+
+project_detail_conditional = _conditional(
+    etag_func=lambda request, project_id: _object_validators(request, Project, 'project', project_id)[0],
+    last_modified_func=lambda request, project_id: _object_validators(request, Project, 'project', project_id)[1],
+)
+
+# Paged nested lists share their parent's validators (project / image writes bump
+# the catalog version, which is part of the ETag)
+designer_projects_conditional = designer_detail_conditional
+project_images_conditional = project_detail_conditional
+
+designer_listing_conditional = _conditional(
+    etag_func=lambda request: _query_validators(request, 'designers')[0],
+    last_modified_func=lambda request: _query_validators(request, 'designers')[1],
+)
+
+designer_facets_conditional = _conditional(
+    etag_func=lambda request: _query_validators(request, 'designer-facets')[0],
+    last_modified_func=lambda request: _query_validators(request, 'designer-facets')[1],
+)
+
+designer_batch_conditional = _conditional(
+    etag_func=lambda request: _query_validators(request, 'designer-batch')[0],
+    last_modified_func=lambda request: _query_validators(request, 'designer-batch')[1],
+)
+
+project_batch_conditional = _conditional(
+    etag_func=lambda request: _query_validators(request, 'project-batch')[0],
+    last_modified_func=lambda request: _query_validators(request, 'project-batch')[1],
+)
+
+# Async views (API_ASYNC_VIEWS) use the same validators
+designer_detail_conditional_async = _async_conditional(
+    lambda request, designer_id: _object_validators(request, Designer, 'designer', designer_id)
+)
+
+project_detail_conditional_async = _async_conditional(
+    lambda request, project_id: _object_validators(request, Project, 'project', project_id)
+)
+
+designer_listing_conditional_async = _async_conditional(
+    lambda request: _query_validators(request, 'designers')
+)
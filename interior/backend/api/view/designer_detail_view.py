@@ -1,11 +1,25 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import Http404
+from django.http import Http404, HttpResponse
+from ..db.instrumentation import query_budget
 from ..services.designer_detail_service import DesignerDetailService
-from ..models import Designer
+from ..services.document_store_service import DocumentStoreService
+from ..models import ApiDocument
+from ..serializers import compiled_designer_detail_serializer
+from .async_support import async_api_view, json_response
+from .conditional import designer_detail_conditional, designer_detail_conditional_async
+from .fieldsets import (
+    InvalidFieldsError,
+    has_fieldset,
+    invalid_fields_payload,
+    invalid_fields_response,
+    parse_fieldset,
+)
 
 
+@query_budget(8)
+@designer_detail_conditional
 @api_view(['GET'])
 def designer_detail(request, designer_id):
     """
@@ -14,18 +28,35 @@ def designer_detail(request, designer_id):
     URL Parameters:
         - designer_id (int): ID of the designer
     
+    Query Parameters:
+        - fields (str): Comma-separated fields to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
+    
     Returns:
-        Response with designer detail including all projects and images
+        Response with designer detail including the first page of projects
+        (more via /api/designers/<id>/projects/?cursor=<projects_pagination.next_cursor>)
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
     """
     try:
+        fields = parse_fieldset(request, compiled_designer_detail_serializer)
+    except InvalidFieldsError as e:
+        return invalid_fields_response(e)
+    
+    try:
+        # Serve the materialized response body when one exists (JSON clients, full fieldset)
+        if not has_fieldset(request):
+            body = DocumentStoreService.get_body(ApiDocument.KIND_DESIGNER, designer_id)
+            if body is not None and request.accepted_renderer.format == 'json':
+                return HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+        
         # Get designer detail from service layer
-        designer_data = DesignerDetailService.get_designer_detail(designer_id)
+        designer_data = DesignerDetailService.get_designer_detail(designer_id, fields=fields)
         
         return Response({
             'success': True,
             'data': designer_data
         }, status=status.HTTP_200_OK)
-        
+    
     except Http404:
         return Response({
             'success': False,
@@ -39,3 +70,46 @@ def designer_detail(request, designer_id):
             'message': 'Error fetching designer detail'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+@query_budget(8)
+@designer_detail_conditional_async
+@async_api_view
+async def designer_detail_async(request, designer_id):
+    """
+    Async variant of designer_detail (same parameters and response body)
+    
+    Routed instead of designer_detail when API_ASYNC_VIEWS is on (ASGI deployment);
+    queries go through the async ORM, so the worker keeps serving other requests
+    while they run.
+    """
+    try:
+        fields = parse_fieldset(request, compiled_designer_detail_serializer)
+    except InvalidFieldsError as e:
+        return json_response(invalid_fields_payload(e), status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Serve the materialized response body when one exists (full fieldset)
+        if not has_fieldset(request):
+            body = await DocumentStoreService.aget_body(ApiDocument.KIND_DESIGNER, designer_id)
+            if body is not None:
+                return HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+        
+        designer_data = await DesignerDetailService.aget_designer_detail(designer_id, fields=fields)
+        
+        return json_response({
+            'success': True,
+            'data': designer_data
+        })
+    
+    except Http404:
+        return json_response({
+            'success': False,
+            'error': 'Designer not found',
+            'message': f'Designer with ID {designer_id} does not exist'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return json_response({
+            'success': False,
+            'error': str(e),
+            'message': 'Error fetching designer detail'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
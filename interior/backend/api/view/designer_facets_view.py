@@ -0,0 +1,63 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from ..db.instrumentation import query_budget
+from ..services.facet_service import FacetService
+from ..services.response_cache import ResponseCache
+from .conditional import catalog_version, designer_facets_conditional
+
+
+@query_budget(7)
+@designer_facets_conditional
+@api_view(['GET'])
+def designer_facets(request):
+    """
+    API endpoint with the number of designers per category, city and price bucket
+    (filter chips of the designer listing)
+    
+    Query Parameters:
+        - search (str): Count only the designers matching this search
+                        (same full-text matching as the listing's `search`)
+        - limit (int): Most values per category / city facet (default: 20, max 100)
+    
+    Returns:
+        Response with {'category': [...], 'city': [...], 'price': [...]} lists of
+        {'value', 'count'} (price buckets also have a 'label'); pass a value as the
+        listing's `category_exact`, `city` or `price` parameter to filter by it
+        (the listing's `total` is then the facet's count)
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
+    """
+    search = (request.query_params.get('search') or '').strip() or None
+    
+    try:
+        limit = int(request.query_params.get('limit', 20))
+        if limit < 1:
+            limit = 20
+        if limit > 100:
+            limit = 100
+    except (ValueError, TypeError):
+        limit = 20
+    
+    try:
+        cache_key = ResponseCache.key('designer-facets', {
+            'search': (search or '').lower(),
+            'limit': limit,
+        }, version=catalog_version(request)[0])
+        payload = ResponseCache.get(cache_key)
+        if payload is not None:
+            return ResponseCache.tag(Response(payload, status=status.HTTP_200_OK, headers={'X-Cache': 'HIT'}), cache_key)
+        
+        payload = {
+            'success': True,
+            'data': FacetService.get_facets(search=search, limit=limit)
+        }
+        
+        ResponseCache.set(cache_key, payload)
+        return ResponseCache.tag(Response(payload, status=status.HTTP_200_OK, headers={'X-Cache': 'MISS'}), cache_key)
+    
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e),
+            'message': 'Error fetching designer facets'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
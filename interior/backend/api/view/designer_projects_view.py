@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.http import Http404
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from ..db.instrumentation import query_budget
+from ..serializers.designer_detail_serializer import compiled_project_basic_serializer
+from ..services.pagination import InvalidCursorError
+from ..services.designer_detail_service import DesignerDetailService
+from .conditional import designer_projects_conditional
+from .fieldsets import InvalidFieldsError, invalid_fields_response, parse_fieldset
+
+
+@query_budget(6)
+@designer_projects_conditional
+@api_view(['GET'])
+def designer_projects(request, designer_id):
+    """
+    API endpoint to page through a designer's projects (oldest first)
+    
+    URL Parameters:
+        - designer_id (int): ID of the designer
+    
+    Query Parameters:
+        - cursor (str): `next_cursor` of the previous page, or
+                        `projects_pagination.next_cursor` of the designer detail
+                        (omit for the first page)
+        - page_size (int): Number of projects per page (default: DESIGNER_PROJECTS_PAGE_SIZE, max 100)
+        - fields (str): Comma-separated fields to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
+    
+    Returns:
+        Response with one page of projects and cursor pagination metadata
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
+    """
+    default_page_size = getattr(settings, 'DESIGNER_PROJECTS_PAGE_SIZE', 12)
+    try:
+        page_size = int(request.query_params.get('page_size', default_page_size))
+        if page_size < 1:
+            page_size = default_page_size
+        # Limit max page size to prevent abuse
+        if page_size > 100:
+            page_size = 100
+    except (ValueError, TypeError):
+        page_size = default_page_size
+    
+    try:
+        fields = parse_fieldset(request, compiled_project_basic_serializer)
+    except InvalidFieldsError as e:
+        return invalid_fields_response(e)
+    
+    try:
+        result = DesignerDetailService.get_designer_projects(
+            designer_id,
+            page_size=page_size,
+            cursor=request.query_params.get('cursor'),
+            fields=fields
+        )
+        
+        return Response({
+            'success': True,
+            'data': result['projects'],
+            'pagination': {
+                'mode': 'cursor',
+                'page_size': result['page_size'],
+                'has_next': result['has_next'],
+                'next_cursor': result['next_cursor'],
+                'count': len(result['projects'])
+            }
+        }, status=status.HTTP_200_OK)
+        
+    except Http404:
+        return Response({
+            'success': False,
+            'error': 'Designer not found',
+            'message': f'Designer with ID {designer_id} does not exist'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except InvalidCursorError as e:
+        return Response({
+            'success': False,
+            'error': 'Invalid cursor',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e),
+            'message': 'Error fetching designer projects'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
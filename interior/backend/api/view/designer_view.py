@@ -1,78 +1,177 @@
+from asgiref.sync import sync_to_async
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from ..services.designer_service import DesignerService
+from ..db.instrumentation import query_budget
+from ..services.count_service import CountService
+from ..services.designer_service import DesignerService, InvalidOrderingError
+from ..services.pagination import InvalidCursorError
+from ..services.response_cache import ResponseCache
+from ..serializers import compiled_designer_listing_serializer
+from .async_support import async_api_view, json_response
+from .conditional import catalog_version, designer_listing_conditional, designer_listing_conditional_async
+from .fieldsets import InvalidFieldsError, invalid_fields_payload, invalid_fields_response, parse_fieldset
 
 
+def parse_listing_params(params):
+    """
+    Read the listing query parameters
+    
+    Args:
+        params (QueryDict): Query parameters
+    
+    Returns:
+        dict: Keyword arguments for DesignerService.get_designers_list (without fields)
+    """
+    # Extract query parameters
+    filters = {
+        'category': params.get('category'),
+        'category_exact': params.get('category_exact'),
+        'city': params.get('city'),
+        'price': params.get('price'),
+        'search': params.get('search'),
+    }
+    
+    # Remove None values
+    filters = {k: v for k, v in filters.items() if v is not None}
+    
+    # Default ordering is 'id' (ascending: id=1, id=2, etc.), or 'relevance' when searching;
+    # other values are checked against DesignerService.ORDERINGS by the service
+    ordering = params.get('ordering')
+    
+    # Pagination parameters (always paginated)
+    try:
+        page = int(params.get('page', 1))
+        if page < 1:
+            page = 1
+    except (ValueError, TypeError):
+        page = 1
+    
+    try:
+        page_size = int(params.get('page_size', 20))
+        if page_size < 1:
+            page_size = 20
+        # Limit max page size to prevent abuse
+        if page_size > 100:
+            page_size = 100
+    except (ValueError, TypeError):
+        page_size = 20
+    
+    return {
+        'filters': filters if filters else None,
+        'ordering': ordering,
+        'page': page,
+        'page_size': page_size,
+        # Cursor mode is opt-in: present (even empty) `cursor` switches to keyset pagination
+        'cursor': params.get('cursor'),
+        'count_strategy': CountService.normalize_strategy(params.get('count')),
+    }
+
+
+def listing_cache_key(options, fields, version):
+    """
+    Response cache key of a listing request
+    
+    Args:
+        options (dict): parse_listing_params result
+        fields (tuple): Sparse fieldset, or None
+        version (int): Catalog version of the request
+    
+    Returns:
+        str: Cache key
+    """
+    filters = options['filters'] or {}
+    cursor = options['cursor']
+    return ResponseCache.key('designer-listing', {
+        'category': (filters.get('category') or '').lower(),
+        'category_exact': (filters.get('category_exact') or '').lower(),
+        'city': (filters.get('city') or '').lower(),
+        'price': filters.get('price') or '',
+        'search': (filters.get('search') or '').lower(),
+        'ordering': options['ordering'],
+        'page': options['page'] if cursor is None else None,
+        'page_size': options['page_size'],
+        'cursor': cursor,
+        'cursor_mode': cursor is not None,
+        'count': options['count_strategy'] if cursor is None else None,
+        'fields': ','.join(fields) if fields else None,
+    }, version=version)
+
+
+@query_budget(7)
+@designer_listing_conditional
 @api_view(['GET'])
 def designer_listing(request):
     """
     API endpoint to list all designers with basic information (paginated)
     
     Query Parameters:
-        - category (str): Filter by category
-        - search (str): Search in business name, address, category
-        - ordering (str): Order by field (e.g., 'id', '-id', 'business_name', '-created_at')
-                          Default: 'id' (ascending: id=1, then id=2, etc.)
+        - category (str): Filter by category (substring: 'Architect' also matches
+                          'Landscape Architect')
+        - category_exact (str): Filter by a whole category, ignoring case (a `category`
+                                value of /api/designers/facets/)
+        - city (str): Filter by city (a `city` value of /api/designers/facets/)
+        - price (str): Filter by price bucket (a `price` value of /api/designers/facets/,
+                       e.g. 'under_2l', '2l_5l', '5l_10l', '10l_plus')
+        - search (str): Full-text search in business name, address, category
+                        (every word must match, as a prefix)
+        - ordering (str): One of 'id', '-id', 'name' (A-Z), 'newest', 'most_projects',
+                          'price' (lowest typical job cost first, unknown last)
+                          or 'relevance' (search rank, best match first).
+                          Other values are rejected with 400.
+                          Default: 'relevance' when searching, otherwise 'id'
+                          (ascending: id=1, then id=2, etc.)
         - page (int): Page number for pagination (default: 1)
         - page_size (int): Number of items per page (default: 20)
+        - cursor (str): Opt-in keyset pagination. Pass an empty value for the first
+                        page, then the `next_cursor` of the previous response.
+                        `page` is ignored and no total count is computed in this mode.
+        - count (str): How to compute the total: 'exact' (default, cached per filter set),
+                       'estimate' (planner estimate for very large results) or 'none'
+        - fields (str): Comma-separated fields of each designer to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
     
     Returns:
         Response with paginated list of designers and metadata
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
     """
     try:
-        # Extract query parameters
-        filters = {
-            'category': request.query_params.get('category'),
-            'search': request.query_params.get('search'),
-        }
-        
-        # Remove None values
-        filters = {k: v for k, v in filters.items() if v is not None}
-        
-        # Default ordering is 'id' (ascending: id=1, id=2, etc.)
-        ordering = request.query_params.get('ordering', 'id')
-        
-        # Pagination parameters (always paginated)
-        try:
-            page = int(request.query_params.get('page', 1))
-            if page < 1:
-                page = 1
-        except (ValueError, TypeError):
-            page = 1
+        fields = parse_fieldset(request, compiled_designer_listing_serializer)
+    except InvalidFieldsError as e:
+        return invalid_fields_response(e)
+    
+    try:
+        options = parse_listing_params(request.query_params)
         
-        try:
-            page_size = int(request.query_params.get('page_size', 20))
-            if page_size < 1:
-                page_size = 20
-            # Limit max page size to prevent abuse
-            if page_size > 100:
-                page_size = 100
-        except (ValueError, TypeError):
-            page_size = 20
+        # Serve from the response cache when this exact (normalized) query was seen
+        # since the last catalog change
+        # One catalog version for the ETag, the response cache and the count cache
+        version, _ = catalog_version(request)
+        cache_key = listing_cache_key(options, fields, version)
+        payload = ResponseCache.get(cache_key)
+        if payload is not None:
+            return ResponseCache.tag(Response(payload, status=status.HTTP_200_OK, headers={'X-Cache': 'HIT'}), cache_key)
         
         # Get designers from service layer
-        result = DesignerService.get_designers_list(
-            filters=filters if filters else None,
-            ordering=ordering,
-            page=page,
-            page_size=page_size
-        )
+        result = DesignerService.get_designers_list(**options, fields=fields, catalog_version=version)
         
-        return Response({
-            'success': True,
-            'data': result['designers'],
-            'pagination': {
-                'total': result['total'],
-                'page': result['page'],
-                'page_size': result['page_size'],
-                'total_pages': result['total_pages'],
-                'has_next': result['has_next'],
-                'has_previous': result['has_previous'],
-                'count': len(result['designers'])
-            }
-        }, status=status.HTTP_200_OK)
+        payload = DesignerService.build_listing_payload(result)
         
+        ResponseCache.set(cache_key, payload)
+        return ResponseCache.tag(Response(payload, status=status.HTTP_200_OK, headers={'X-Cache': 'MISS'}), cache_key)
+    
+    except InvalidOrderingError as e:
+        return Response({
+            'success': False,
+            'error': 'Invalid ordering',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except InvalidCursorError as e:
+        return Response({
+            'success': False,
+            'error': 'Invalid cursor',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         return Response({
             'success': False,
@@ -80,3 +179,53 @@ def designer_listing(request):
             'message': 'Error fetching designers list'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+@query_budget(7)
+@designer_listing_conditional_async
+@async_api_view
+async def designer_listing_async(request):
+    """
+    Async variant of designer_listing (same query parameters and response body)
+    
+    Routed instead of designer_listing when API_ASYNC_VIEWS is on (ASGI deployment):
+    the page and the total count are queried concurrently, and the worker keeps
+    serving other requests while they run.
+    """
+    try:
+        fields = parse_fieldset(request, compiled_designer_listing_serializer)
+    except InvalidFieldsError as e:
+        return json_response(invalid_fields_payload(e), status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        options = parse_listing_params(request.GET)
+        
+        version, _ = await sync_to_async(catalog_version)(request)
+        cache_key = listing_cache_key(options, fields, version)
+        payload = await ResponseCache.aget(cache_key)
+        if payload is not None:
+            return ResponseCache.tag(json_response(payload, headers={'X-Cache': 'HIT'}), cache_key)
+        
+        result = await DesignerService.aget_designers_list(**options, fields=fields, catalog_version=version)
+        payload = DesignerService.build_listing_payload(result)
+        
+        await ResponseCache.aset(cache_key, payload)
+        return ResponseCache.tag(json_response(payload, headers={'X-Cache': 'MISS'}), cache_key)
+    
+    except InvalidOrderingError as e:
+        return json_response({
+            'success': False,
+            'error': 'Invalid ordering',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except InvalidCursorError as e:
+        return json_response({
+            'success': False,
+            'error': 'Invalid cursor',
+            'message': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return json_response({
+            'success': False,
+            'error': str(e),
+            'message': 'Error fetching designers list'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
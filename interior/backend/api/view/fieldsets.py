@@ -0,0 +1,76 @@
+"""
+Sparse fieldsets for the read endpoints
+
+`?fields=id,business_name` keeps only the listed top-level fields of each item,
+`?exclude=about_us,socials` drops fields. Services narrow their queries to the
+selected fields (QuerySet.only(), skipped nested lists), so lightweight clients
+save both payload bytes and database I/O.
+"""
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class InvalidFieldsError(ValueError):
+    """Raised when `fields` / `exclude` name a field the endpoint does not have"""
+
+
+def _split(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+def _params(request):
+    # DRF requests (sync views) or plain Django requests (async views)
+    return getattr(request, 'query_params', request.GET)
+
+
+def has_fieldset(request):
+    """True if the request asks for a sparse fieldset"""
+    params = _params(request)
+    return bool(_split(params.get('fields')) or _split(params.get('exclude')))
+
+
+def parse_fieldset(request, serializer):
+    """
+    Resolve `fields` / `exclude` against a compiled serializer
+
+    Args:
+        request: DRF or Django request
+        serializer (CompiledSerializer): Serializer of the endpoint's items
+
+    Returns:
+        tuple or None: Selected field names (serializer order), or None for all fields
+
+    Raises:
+        InvalidFieldsError: If a name is not a field of the serializer
+    """
+    params = _params(request)
+    fields = _split(params.get('fields'))
+    exclude = _split(params.get('exclude'))
+    if not fields and not exclude:
+        return None
+
+    available = serializer.field_names
+    unknown = [name for name in fields + exclude if name not in available]
+    if unknown:
+        raise InvalidFieldsError(
+            f'Unknown field(s): {", ".join(unknown)}. Available: {", ".join(available)}'
+        )
+
+    selected = [name for name in available if (not fields or name in fields) and name not in exclude]
+    if not selected:
+        raise InvalidFieldsError('No fields left to return')
+    return tuple(selected)
+
+
+def invalid_fields_payload(error):
+    """Response body for an InvalidFieldsError"""
+    return {
+        'success': False,
+        'error': 'Invalid fields',
+        'message': str(error)
+    }
+
+
+def invalid_fields_response(error):
+    """400 response for an InvalidFieldsError"""
+    return Response(invalid_fields_payload(error), status=status.HTTP_400_BAD_REQUEST)
@@ -1,11 +1,25 @@
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import Http404
+from django.http import Http404, HttpResponse
+from ..db.instrumentation import query_budget
 from ..services.project_detail_service import ProjectDetailService
-from ..models import Project
+from ..services.document_store_service import DocumentStoreService
+from ..models import ApiDocument
+from ..serializers import compiled_project_detail_serializer
+from .async_support import async_api_view, json_response
+from .conditional import project_detail_conditional, project_detail_conditional_async
+from .fieldsets import (
+    InvalidFieldsError,
+    has_fieldset,
+    invalid_fields_payload,
+    invalid_fields_response,
+    parse_fieldset,
+)
 
 
+@query_budget(7)
+@project_detail_conditional
 @api_view(['GET'])
 def project_detail(request, project_id):
     """
@@ -14,18 +28,35 @@ def project_detail(request, project_id):
     URL Parameters:
         - project_id (int): ID of the project
     
+    Query Parameters:
+        - fields (str): Comma-separated fields to return (sparse fieldset)
+        - exclude (str): Comma-separated fields to leave out
+    
     Returns:
-        Response with project detail including all images
+        Response with project detail including the first page of images
+        (more via /api/projects/<id>/images/?cursor=<images_pagination.next_cursor>)
+        (conditional GET: 304 when If-None-Match / If-Modified-Since still match)
     """
     try:
+        fields = parse_fieldset(request, compiled_project_detail_serializer)
+    except InvalidFieldsError as e:
+        return invalid_fields_response(e)
+    
+    try:
+        # Serve the materialized response body when one exists (JSON clients, full fieldset)
+        if not has_fieldset(request):
+            body = DocumentStoreService.get_body(ApiDocument.KIND_PROJECT, project_id)
+            if body is not None and request.accepted_renderer.format == 'json':
+                return HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+        
         # Get project detail from service layer
-        project_data = ProjectDetailService.get_project_detail(project_id)
+        project_data = ProjectDetailService.get_project_detail(project_id, fields=fields)
         
         return Response({
             'success': True,
             'data': project_data
         }, status=status.HTTP_200_OK)
-        
+    
     except Http404:
         return Response({
             'success': False,
@@ -39,3 +70,46 @@ def project_detail(request, project_id):
             'message': 'Error fetching project detail'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+@query_budget(7)
+@project_detail_conditional_async
+@async_api_view
+async def project_detail_async(request, project_id):
+    """
+    Async variant of project_detail (same parameters and response body)
+    
+    Routed instead of project_detail when API_ASYNC_VIEWS is on (ASGI deployment);
+    queries go through the async ORM, so the worker keeps serving other requests
+    while they run.
+    """
+    try:
+        fields = parse_fieldset(request, compiled_project_detail_serializer)
+    except InvalidFieldsError as e:
+        return json_response(invalid_fields_payload(e), status=status.HTTP_400_BAD_REQUEST)
+    
+    try:
+        # Serve the materialized response body when one exists (full fieldset)
+        if not has_fieldset(request):
+            body = await DocumentStoreService.aget_body(ApiDocument.KIND_PROJECT, project_id)
+            if body is not None:
+                return HttpResponse(body, content_type='application/json', status=status.HTTP_200_OK)
+        
+        project_data = await ProjectDetailService.aget_project_detail(project_id, fields=fields)
+        
+        return json_response({
+            'success': True,
+            'data': project_data
+        })
+    
+    except Http404:
+        return json_response({
+            'success': False,
+            'error': 'Project not found',
+            'message': f'Project with ID {project_id} does not exist'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return json_response({
+            'success': False,
+            'error': str(e),
+            'message': 'Error fetching project detail'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
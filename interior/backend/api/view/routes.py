@@ -2,29 +2,106 @@
 Routes configuration for API endpoints
 Centralized routing file for all API paths
 """
+from django.conf import settings
+from django.http import HttpResponse
 from django.urls import path
+from django.views.decorators.http import require_safe
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
-from .designer_view import designer_listing
-from .designer_detail_view import designer_detail
-from .project_detail_view import project_detail
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from .. import metrics as api_metrics
+from ..db import slow_queries as api_slow_queries
+from ..db.pool import pool_stats
+from ..db.router import replica_status
+from .designer_view import designer_listing, designer_listing_async
+from .designer_facets_view import designer_facets
+from .designer_detail_view import designer_detail, designer_detail_async
+from .designer_projects_view import designer_projects
+from .project_detail_view import project_detail, project_detail_async
+from .project_images_view import project_images
+from .batch_view import designer_batch, project_batch
 
 
 @api_view(['GET'])
 def health_check(request):
-    """Health check endpoint"""
-    return Response({'status': 'ok', 'message': 'API is running'})
+    """Health check endpoint (includes this worker's connection pool metrics and replica status when configured)"""
+    data = {'status': 'ok', 'message': 'API is running'}
+    pools = pool_stats()
+    if pools:
+        data['db_pools'] = pools
+    replicas = replica_status()
+    if replicas:
+        data['db_replicas'] = replicas
+    return Response(data)
+
+
+@require_safe
+def metrics(request):
+    """
+    Prometheus metrics endpoint (text exposition format)
+    
+    Aggregated over every gunicorn worker when PROMETHEUS_MULTIPROC_DIR is set
+    (see api.metrics); answers 503 when prometheus_client is not installed.
+    """
+    if not api_metrics.enabled():
+        return HttpResponse(
+            'Metrics are disabled (API_METRICS_ENABLED is off or prometheus_client is not installed)\n',
+            status=503, content_type='text/plain; charset=utf-8'
+        )
+    body, content_type = api_metrics.render()
+    response = HttpResponse(body, content_type=content_type)
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def slow_queries(request):
+    """
+    Slow statements captured by this worker (staff only, newest first)
+    
+    Each entry holds the endpoint and its normalized parameters, the SQL and its
+    parameters, the api/services frame that issued it and, when sampled, its
+    EXPLAIN plan. Every worker keeps its own buffer; the rotating log file
+    (API_SLOW_QUERY_LOG) has the captures of all workers.
+    """
+    return Response({
+        'success': True,
+        'data': api_slow_queries.recent(),
+        'threshold_ms': getattr(settings, 'API_SLOW_QUERY_MS', 0),
+    })
+
+
+# Async read path for ASGI deployments (uvicorn workers), see API_ASYNC_VIEWS
+if settings.API_ASYNC_VIEWS:
+    designer_listing_view = designer_listing_async
+    designer_detail_view = designer_detail_async
+    project_detail_view = project_detail_async
+else:
+    designer_listing_view = designer_listing
+    designer_detail_view = designer_detail
+    project_detail_view = project_detail
 
 
 urlpatterns = [
     # Health check
     path('health/', health_check, name='health-check'),
+    path('metrics/', metrics, name='metrics'),
+    path('slow-queries/', slow_queries, name='slow-queries'),
     
     # Designer routes
-    path('designers/', designer_listing, name='designer-listing'),
-    path('designers/<int:designer_id>/', designer_detail, name='designer-detail'),
+    path('designers/', designer_listing_view, name='designer-listing'),
+    path('designers/batch/', designer_batch, name='designer-batch'),
+    # Also without the slash: APPEND_SLASH would cost batch clients a redirect
+    path('designers/batch', designer_batch, name='designer-batch-noslash'),
+    path('designers/facets/', designer_facets, name='designer-facets'),
+    path('designers/<int:designer_id>/', designer_detail_view, name='designer-detail'),
+    path('designers/<int:designer_id>/projects/', designer_projects, name='designer-projects'),
     
     # Project routes
-    path('projects/<int:project_id>/', project_detail, name='project-detail'),
+    path('projects/batch/', project_batch, name='project-batch'),
+    path('projects/batch', project_batch, name='project-batch-noslash'),
+    path('projects/<int:project_id>/', project_detail_view, name='project-detail'),
+    path('projects/<int:project_id>/images/', project_images, name='project-images'),
 ]
 
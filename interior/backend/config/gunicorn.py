@@ -0,0 +1,11 @@
+"""
+Gunicorn configuration hooks (gunicorn --config python:config.gunicorn)
+"""
+import os
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of an exited worker from the shared metrics directory"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -41,6 +41,12 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Counts each request's queries / DB time (Server-Timing header, query budgets)
+    'api.middleware.QueryInstrumentationMiddleware',
+    # Routes read-only API requests to the read replicas (no-op without DB_REPLICA_HOSTS)
+    'api.middleware.ReplicaRoutingMiddleware',
+    # Compresses the final API response (keep above middleware that edits the body)
+    'api.middleware.CompressedResponseCacheMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -79,10 +85,39 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Set DB_ENGINE=mysql, postgresql, or sqlite in .env (default: mysql)
 DB_ENGINE = os.getenv('DB_ENGINE', 'mysql')
 
+# Connection reuse (MySQL / PostgreSQL)
+# DB_CONN_MAX_AGE: seconds a connection stays open for the next requests of the same
+# worker (0 = new connection per request). DB_CONN_HEALTH_CHECKS: check a reused
+# connection before the request uses it, so a server-side timeout or restart does
+# not fail the request.
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+DB_CONN_HEALTH_CHECKS = os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True'
+
+# Connection pool (replaces DB_CONN_MAX_AGE: connections go back to a per-process pool
+# after each request). PostgreSQL uses psycopg_pool 3.2+ (pip install "psycopg[binary,pool]"
+# "psycopg-pool>=3.2"), MySQL the in-process pool in api/db/pool.py. Pool metrics: /api/health/
+DB_POOL = os.getenv('DB_POOL', 'False') == 'True'
+DB_POOL_OPTIONS = {
+    'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+    'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+    # Seconds to wait for a free connection before failing the request
+    'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+    # Seconds an idle connection above min_size is kept
+    'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '600')),
+    # Idle seconds after which a connection is health-checked before reuse (MySQL pool)
+    'check_idle': float(os.getenv('DB_POOL_CHECK_IDLE', '30')),
+}
+
+DB_CONNECTION_SETTINGS = {
+    'CONN_MAX_AGE': 0 if DB_POOL else DB_CONN_MAX_AGE,
+    'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+    'POOL': DB_POOL_OPTIONS if DB_POOL else None,
+}
+
 if DB_ENGINE == 'mysql':
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.mysql',
+            'ENGINE': 'api.db.backends.mysql' if DB_POOL else 'django.db.backends.mysql',
             'NAME': os.getenv('DB_NAME', 'houzatt_db'),
             'USER': os.getenv('DB_USER', 'root'),
             'PASSWORD': os.getenv('DB_PASSWORD', ''),
@@ -91,17 +126,19 @@ if DB_ENGINE == 'mysql':
             'OPTIONS': {
                 'charset': 'utf8mb4',
             },
+            **DB_CONNECTION_SETTINGS,
         }
     }
 elif DB_ENGINE == 'postgresql':
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql',
+            'ENGINE': 'api.db.backends.postgresql' if DB_POOL else 'django.db.backends.postgresql',
             'NAME': os.getenv('DB_NAME', 'houzatt_db'),
             'USER': os.getenv('DB_USER', 'postgres'),
             'PASSWORD': os.getenv('DB_PASSWORD', ''),
             'HOST': os.getenv('DB_HOST', 'localhost'),
             'PORT': os.getenv('DB_PORT', '5432'),
+            **DB_CONNECTION_SETTINGS,
         }
     }
 else:
@@ -112,6 +149,37 @@ else:
         }
     }
 
+# Read replicas (MySQL / PostgreSQL): read-only /api/ requests are served from them,
+# writes and everything else (scraper, admin) use the primary. DB_REPLICA_HOSTS is a
+# comma-separated list of host or host:port; DB_REPLICA_WEIGHTS optionally gives each
+# replica's share of the reads (e.g. 2,1). Other connection settings default to the
+# primary's (override with DB_REPLICA_NAME / DB_REPLICA_USER / DB_REPLICA_PASSWORD).
+DB_REPLICA_HOSTS = [host.strip() for host in os.getenv('DB_REPLICA_HOSTS', '').split(',') if host.strip()]
+DB_REPLICA_WEIGHTS = [int(weight) for weight in os.getenv('DB_REPLICA_WEIGHTS', '').split(',') if weight.strip()]
+DB_REPLICAS = {}
+if DB_ENGINE in ('mysql', 'postgresql'):
+    for index, replica_host in enumerate(DB_REPLICA_HOSTS, start=1):
+        replica_host, _, replica_port = replica_host.partition(':')
+        alias = f'replica_{index}'
+        DATABASES[alias] = {
+            **DATABASES['default'],
+            'NAME': os.getenv('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+            'USER': os.getenv('DB_REPLICA_USER', DATABASES['default']['USER']),
+            'PASSWORD': os.getenv('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+            'HOST': replica_host,
+            'PORT': replica_port or DATABASES['default']['PORT'],
+            # Tests read the test primary through the replica aliases
+            'TEST': {'MIRROR': 'default'},
+        }
+        DB_REPLICAS[alias] = DB_REPLICA_WEIGHTS[index - 1] if index <= len(DB_REPLICA_WEIGHTS) else 1
+
+# Seconds an unreachable replica is skipped before it is tried again
+DB_REPLICA_RETRY_AFTER = int(os.getenv('DB_REPLICA_RETRY_AFTER', '30'))
+# Seconds a client that wrote keeps reading from the primary (read-your-writes)
+DB_REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', '10'))
+
+DATABASE_ROUTERS = ['api.db.router.ReplicaRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -165,8 +233,151 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # orjson-backed renderer (same bytes as DRF's JSONRenderer, falls back to it without orjson)
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+# Images embedded in a project detail response; the rest are paged through
+# /api/projects/<id>/images/
+PROJECT_IMAGES_PAGE_SIZE = int(os.getenv('PROJECT_IMAGES_PAGE_SIZE', '24'))
+
+# Projects embedded in a designer detail response; the rest are paged through
+# /api/designers/<id>/projects/
+DESIGNER_PROJECTS_PAGE_SIZE = int(os.getenv('DESIGNER_PROJECTS_PAGE_SIZE', '12'))
+
+# Route the listing and detail endpoints to their async views (async ORM, concurrent
+# count + page queries). Enable together with the ASGI deployment (gunicorn with
+# uvicorn workers, see gunicorn-asgi.service); under WSGI the sync views are faster.
+# Requires DB_CONN_MAX_AGE=0 or DB_POOL=True: the async ORM runs queries on executor
+# threads, and their persistent connections are not closed between requests, so with
+# CONN_MAX_AGE > 0 connections pile up until the database's max_connections is reached
+API_ASYNC_VIEWS = os.getenv('API_ASYNC_VIEWS', 'False') == 'True'
+
+# Report each request's query count and DB time in a Server-Timing header
+API_SERVER_TIMING = os.getenv('API_SERVER_TIMING', 'True') == 'True'
+# Fail the statement that takes a request over its view's @query_budget (instead of
+# logging a warning). Off by default; the test suite turns it on (api/tests.py).
+# Session / auth lookups are not charged to budgets (see api.db.instrumentation)
+API_QUERY_BUDGET_ENFORCE = os.getenv('API_QUERY_BUDGET_ENFORCE', 'False') == 'True'
+
+# Slow-query capture: statements of API requests taking at least API_SLOW_QUERY_MS
+# (0 = off) are kept in a per-worker ring buffer (staff: /api/slow-queries/) and
+# logged as JSON lines to API_SLOW_QUERY_LOG (rotated; empty = no file). A sample
+# of them is EXPLAINed on the same connection
+API_SLOW_QUERY_MS = int(os.getenv('API_SLOW_QUERY_MS', '200'))
+API_SLOW_QUERY_EXPLAIN_SAMPLE = float(os.getenv('API_SLOW_QUERY_EXPLAIN_SAMPLE', '0.1'))
+API_SLOW_QUERY_BUFFER_SIZE = int(os.getenv('API_SLOW_QUERY_BUFFER_SIZE', '200'))
+API_SLOW_QUERY_LOG = os.getenv('API_SLOW_QUERY_LOG', str(BASE_DIR / 'slow_queries.log'))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'slow_queries': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': API_SLOW_QUERY_LOG,
+            'maxBytes': 10 * 1024 * 1024,
+            'backupCount': 5,
+            # Opened on the first capture
+            'delay': True,
+        } if API_SLOW_QUERY_LOG else {
+            'class': 'logging.NullHandler',
+        },
+    },
+    'loggers': {
+        'api.slow_queries': {
+            'handlers': ['slow_queries'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
+# Prometheus metrics at /api/metrics/ (requires prometheus_client; set
+# PROMETHEUS_MULTIPROC_DIR to aggregate every gunicorn worker, see gunicorn.service)
+API_METRICS_ENABLED = os.getenv('API_METRICS_ENABLED', 'True') == 'True'
+
+# Maximum number of ids accepted by /api/designers/batch/ and /api/projects/batch/
+API_BATCH_MAX_IDS = int(os.getenv('API_BATCH_MAX_IDS', '200'))
+
+# Cache
+# Per-process memory cache by default. Set CACHE_URL=redis://host:6379/0 to share the
+# cache across gunicorn workers (requires the `redis` package).
+# The 'compressed' alias holds compressed response variants (API_COMPRESSION_ENABLED)
+# apart from the response cache, so large variants cannot evict cached payloads.
+CACHE_URL = os.getenv('CACHE_URL', '')
+COMPRESSED_CACHE_URL = os.getenv('COMPRESSED_CACHE_URL', CACHE_URL)
+
+if CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'houzatt',
+        }
+    }
+
+if COMPRESSED_CACHE_URL.startswith(('redis://', 'rediss://')):
+    CACHES['compressed'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': COMPRESSED_CACHE_URL,
+        'KEY_PREFIX': 'compressed',
+    }
+else:
+    CACHES['compressed'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'houzatt-compressed',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('COMPRESSED_CACHE_MAX_ENTRIES', '1000'))},
+    }
+
+# Listing counts
+# Exact counts are cached per normalized filter set for this many seconds
+LISTING_COUNT_CACHE_TTL = int(os.getenv('LISTING_COUNT_CACHE_TTL', '60'))
+# count=estimate only reports planner estimates at or above this size (smaller sets are counted exactly)
+LISTING_COUNT_ESTIMATE_THRESHOLD = int(os.getenv('LISTING_COUNT_ESTIMATE_THRESHOLD', '10000'))
+
+# Serialize the hot read endpoints with the compiled fast path (identical output to
+# the DRF serializers); set to False to fall back to plain DRF serialization
+API_FAST_SERIALIZERS = os.getenv('API_FAST_SERIALIZERS', 'True') == 'True'
+
+# API response cache
+# Entries are keyed on the catalog version (bumped on every Designer/Project/Image
+# write), so invalidation is immediate; the TTL only evicts unreachable entries
+API_RESPONSE_CACHE_ENABLED = os.getenv('API_RESPONSE_CACHE_ENABLED', 'True') == 'True'
+API_RESPONSE_CACHE_TTL = int(os.getenv('API_RESPONSE_CACHE_TTL', '86400'))
+
+# API response compression (Brotli when the `brotli` package is installed, else gzip).
+# Compressed variants are cached (CACHES['compressed']) per response cache key, or per
+# path and ETag for the detail pages, so repeated responses are not recompressed;
+# bodies smaller than API_COMPRESSION_MIN_SIZE bytes are sent as-is
+API_COMPRESSION_ENABLED = os.getenv('API_COMPRESSION_ENABLED', 'True') == 'True'
+API_COMPRESSION_MIN_SIZE = int(os.getenv('API_COMPRESSION_MIN_SIZE', '512'))
+
+# Serve designer / project detail pages from materialized response bodies
+# (manage.py build_api_documents) when they exist
+API_DOCUMENT_STORE_ENABLED = os.getenv('API_DOCUMENT_STORE_ENABLED', 'True') == 'True'
+
+# Static API snapshot (manage.py export_api_snapshot), served by nginx directly
+API_SNAPSHOT_ROOT = os.getenv('API_SNAPSHOT_ROOT', str(BASE_DIR / 'api-snapshot'))
+# Listing page sizes to export (the frontend requests page_size=20)
+API_SNAPSHOT_PAGE_SIZES = [
+    int(size) for size in os.getenv('API_SNAPSHOT_PAGE_SIZES', '20').split(',') if size.strip()
+]
+
+# Designer search
+# 'auto' uses the native full-text index for DB_ENGINE (Postgres GIN, MySQL FULLTEXT,
+# SQLite FTS5); 'icontains' forces the legacy substring search
+DESIGNER_SEARCH_BACKEND = os.getenv('DESIGNER_SEARCH_BACKEND', 'auto')
+
 # CORS settings
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -18,7 +18,13 @@ import {
   AlertCircle
 } from 'lucide-react';
 import { Designer, Project } from '../types';
-import { getDesignerDetail, mapApiDesignerDetailToDesigner, ApiError } from '../apiService';
+import { 
+  getDesignerDetail, 
+  getDesignerProjects,
+  mapApiDesignerDetailToDesigner,
+  mapApiProjectBasicToProject,
+  ApiError 
+} from '../apiService';
 
 interface DesignerDetailPageProps {
   designerId: string;
@@ -37,6 +43,9 @@ export const DesignerDetailPage: React.FC<DesignerDetailPageProps> = ({
   const [designer, setDesigner] = useState<Designer | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [projectsCursor, setProjectsCursor] = useState<string | null>(null);
+  const [projectsTotal, setProjectsTotal] = useState(0);
+  const [loadingProjects, setLoadingProjects] = useState(false);
   const tabs = ['About Us', 'Projects', 'Business', 'Credentials', 'Reviews', 'Ideabooks'];
 
   // Fetch designer detail from API
@@ -49,6 +58,8 @@ export const DesignerDetailPage: React.FC<DesignerDetailPageProps> = ({
         const response = await getDesignerDetail(designerId);
         const mappedDesigner = mapApiDesignerDetailToDesigner(response.data);
         setDesigner(mappedDesigner);
+        setProjectsCursor(response.data.projects_pagination?.next_cursor || null);
+        setProjectsTotal(response.data.projects_pagination?.total ?? mappedDesigner.projects?.length ?? 0);
       } catch (err) {
         console.error('Error fetching designer detail:', err);
         const errorMessage = err instanceof ApiError 
@@ -65,6 +76,22 @@ export const DesignerDetailPage: React.FC<DesignerDetailPageProps> = ({
     }
   }, [designerId]);
 
+  // Load the next page of projects
+  const loadMoreProjects = async () => {
+    if (!projectsCursor || loadingProjects) return;
+    setLoadingProjects(true);
+    try {
+      const response = await getDesignerProjects(designerId, projectsCursor);
+      const projects = response.data.map(mapApiProjectBasicToProject);
+      setDesigner(prev => prev ? { ...prev, projects: [...(prev.projects || []), ...projects] } : prev);
+      setProjectsCursor(response.pagination.next_cursor);
+    } catch (err) {
+      console.error('Error fetching designer projects:', err);
+    } finally {
+      setLoadingProjects(false);
+    }
+  };
+
   // Loading state
   if (loading) {
     return (
@@ -211,7 +238,7 @@ export const DesignerDetailPage: React.FC<DesignerDetailPageProps> = ({
               </section>
 
               <section id="projects">
-                <h3 className="text-sm font-black uppercase tracking-[0.2em] text-slate-800 mb-6">{designer.projects?.length || 0} Projects</h3>
+                <h3 className="text-sm font-black uppercase tracking-[0.2em] text-slate-800 mb-6">{projectsTotal || designer.projects?.length || 0} Projects</h3>
                 {designer.projects && designer.projects.length > 0 ? (
                   <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
                     {designer.projects.map(project => (
@@ -250,6 +277,16 @@ export const DesignerDetailPage: React.FC<DesignerDetailPageProps> = ({
                       </div>
                     </div>
                     ))}
+                    {projectsCursor && (
+                      <button
+                        onClick={loadMoreProjects}
+                        disabled={loadingProjects}
+                        className="md:col-span-2 flex items-center justify-center gap-2 px-5 py-3 border border-slate-200 rounded text-[11px] font-bold uppercase tracking-widest text-slate-600 hover:bg-slate-50 transition-colors disabled:opacity-50"
+                      >
+                        {loadingProjects && <Loader2 size={16} className="animate-spin" />}
+                        Load more projects
+                      </button>
+                    )}
                   </div>
                 ) : (
                   <p className="text-slate-500 text-sm">No projects available.</p>
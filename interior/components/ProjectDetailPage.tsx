@@ -15,6 +15,7 @@ import {
 import { Designer, Project } from '../types';
 import { 
   getProjectDetail, 
+  getProjectImages,
   getDesignerDetail,
   mapApiProjectDetailToProject,
   mapApiDesignerDetailToDesigner,
@@ -41,6 +42,8 @@ export const ProjectDetailPage: React.FC<ProjectDetailPageProps> = ({
   const [project, setProject] = useState<Project | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [imagesCursor, setImagesCursor] = useState<string | null>(null);
+  const [loadingImages, setLoadingImages] = useState(false);
   const tabs = ['About Us', 'Projects', 'Business', 'Credentials', 'Reviews', 'Ideabooks'];
 
   // Fetch project and designer details from API
@@ -60,6 +63,7 @@ export const ProjectDetailPage: React.FC<ProjectDetailPageProps> = ({
         const mappedDesigner = mapApiDesignerDetailToDesigner(designerResponse.data);
         
         setProject(mappedProject);
+        setImagesCursor(projectResponse.data.images_pagination?.next_cursor || null);
         setDesigner(mappedDesigner);
       } catch (err) {
         console.error('Error fetching project detail:', err);
@@ -77,6 +81,22 @@ export const ProjectDetailPage: React.FC<ProjectDetailPageProps> = ({
     }
   }, [projectId, designerId]);
 
+  // Load the next page of gallery images
+  const loadMoreImages = async () => {
+    if (!imagesCursor || loadingImages) return;
+    setLoadingImages(true);
+    try {
+      const response = await getProjectImages(projectId, imagesCursor);
+      const urls = response.data.map(img => img.image_url);
+      setProject(prev => prev ? { ...prev, images: [...(prev.images || []), ...urls] } : prev);
+      setImagesCursor(response.pagination.next_cursor);
+    } catch (err) {
+      console.error('Error fetching project images:', err);
+    } finally {
+      setLoadingImages(false);
+    }
+  };
+
   // Loading state
   if (loading) {
     return (
@@ -218,6 +238,16 @@ export const ProjectDetailPage: React.FC<ProjectDetailPageProps> = ({
                    <p className="text-[12px] font-bold text-slate-600 mb-8 group-hover:text-black transition-colors uppercase tracking-widest">{project.name}</p>
                  </div>
                 ))}
+                {imagesCursor && (
+                  <button
+                    onClick={loadMoreImages}
+                    disabled={loadingImages}
+                    className="md:col-span-2 flex items-center justify-center gap-2 px-5 py-3 border border-slate-200 rounded text-[11px] font-bold uppercase tracking-widest text-slate-600 hover:bg-slate-50 transition-colors disabled:opacity-50"
+                  >
+                    {loadingImages && <Loader2 size={16} className="animate-spin" />}
+                    Load more images
+                  </button>
+                )}
               </div>
             ) : project.thumbnail ? (
               <div className="grid grid-cols-1 md:grid-cols-2 gap-8">
@@ -15,7 +15,11 @@ import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import Django models
-from api.models import Designer, Project, Image
+from django.db import router, transaction
+from django.db.models import Q
+from api.models import Designer, DesignerFacet, Project, Image
+from api.services.document_store_service import DocumentStoreService
+from api.signals import receivers_suspended, refresh_designers
 
 # List of designer profile URLs to scrape
 DESIGNER_URLS = [
@@ -146,13 +150,40 @@ def scrape_project_details(project_url):
 def save_to_database(data):
     """Save scraped data to database"""
     
-    # Get or create Designer
-    details = data.get("details", {})
     business_details = data.get("business_details", {})
     
     # Use business name or website as unique identifier
     business_name = business_details.get("Business Name") or "Unknown"
     
+    projects_data = data.get("projects", [])
+    project_ids = [project_data.get("project_id") for project_data in projects_data if project_data.get("project_id")]
+    
+    # Facet values of this designer and of the designers its projects may move away from,
+    # before the writes (the per-row receivers are suspended below)
+    previous_facets = DesignerFacet.values_by_designer(
+        Designer.objects.filter(Q(business_name=business_name) | Q(projects__project_id__in=project_ids)).distinct()
+    )
+    
+    with receivers_suspended(), transaction.atomic():
+        designer = _save_designer_rows(data, business_name, projects_data)
+        # Stats, facets, document invalidation and the catalog bump, once for the whole designer
+        refresh_designers({designer.id, *previous_facets}, previous_facets)
+    
+    # Re-materialize the detail pages of this designer and its projects
+    documents = DocumentStoreService.build_for_designer(designer.id)
+    print(f"  Rebuilt {documents} API documents")
+    
+    print(f"\n✅ Total projects saved: {len(projects_data)}")
+    return designer
+
+
+def _save_designer_rows(data, business_name, projects_data):
+    """Write the designer, its projects and their images (receivers suspended by the caller)"""
+    
+    # Get or create Designer
+    details = data.get("details", {})
+    business_details = data.get("business_details", {})
+    
     designer, created = Designer.objects.update_or_create(
         business_name=business_name,
         defaults={
@@ -174,8 +205,6 @@ def save_to_database(data):
     print(f"{'Created' if created else 'Updated'} designer: {designer.business_name}")
     
     # Process Projects
-    projects_data = data.get("projects", [])
-    
     for project_data in projects_data:
         project_id = project_data.get("project_id")
         if not project_id:
@@ -201,8 +230,9 @@ def save_to_database(data):
         
         print(f"  {'Created' if project_created else 'Updated'} project: {project.project_title or project.title}")
         
-        # Delete existing images for this project to avoid duplicates
-        Image.objects.filter(project=project).delete()
+        # Delete existing images for this project to avoid duplicates. A plain DELETE: the
+        # collector would load every row to send delete signals nobody listens to here
+        Image.objects.filter(project=project)._raw_delete(router.db_for_write(Image))
         
         # Save Images
         images_data = project_details.get("images", [])
@@ -225,7 +255,6 @@ def save_to_database(data):
             Image.objects.bulk_create(image_objects, ignore_conflicts=True)
             print(f"    Saved {len(image_objects)} images")
     
-    print(f"\n✅ Total projects saved: {len(projects_data)}")
     return designer
 
 